@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scalar dice vs NumPy batch dice
+
+Times n rolls of damage dice, skill checks with advantage and damage with
+25% crits, one call at a time and as one batch, and checks both give the
+same rolls under the same seed.
+
+Usage:
+    python benchmarks/bench_dice.py [rolls]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+
+from src.utils import dice  # noqa: E402
+
+
+def compare(name: str, scalar, batch):
+    dice.seed(42)
+    start = time.perf_counter()
+    expected = scalar()
+    scalar_time = time.perf_counter() - start
+
+    dice.seed(42)
+    start = time.perf_counter()
+    result = batch()
+    batch_time = time.perf_counter() - start
+
+    same = "identical" if result.tolist() == expected else "DIFFERENT"
+    print(f"   {name:<24} scalar {scalar_time * 1000:>8.1f} ms  batch {batch_time * 1000:>7.1f} ms"
+          f"  ({scalar_time / batch_time:.0f}x, {same})")
+
+
+def main():
+    rolls = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    critical = np.random.default_rng(0).random(rolls) < 0.25
+    crit_list = critical.tolist()
+
+    print(f"🎲 {rolls} rolls each")
+    compare(
+        "roll_dice 2d6+3",
+        lambda: [dice.roll_dice("2d6+3") for _ in range(rolls)],
+        lambda: dice.roll_dice_batch("2d6+3", rolls)
+    )
+    compare(
+        "skill_check advantage",
+        lambda: [dice.skill_check(5, 15, use_advantage=True)[0] for _ in range(rolls)],
+        lambda: dice.skill_check_batch(5, 15, rolls, use_advantage=True)[0]
+    )
+    compare(
+        "damage_roll 1d8+3 crits",
+        lambda: [dice.damage_roll("1d8+3", crit) for crit in crit_list],
+        lambda: dice.damage_roll_batch("1d8+3", rolls, critical)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark: flyweight enemy squads vs per-enemy record copies
+
+Spawns N copies of one enemy both ways and compares spawn time and the
+memory added per enemy.
+
+Usage:
+    python benchmarks/bench_enemies.py [count]
+"""
+
+import copy
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.loader import DataLoader  # noqa: E402
+from src.data.views import thaw  # noqa: E402
+from src.entities.enemy import EnemySquad  # noqa: E402
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def measure(spawn, count: int) -> tuple[float, int]:
+    """Run spawn(count), return (seconds, bytes still allocated)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    spawned = spawn(count)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del spawned
+    return elapsed, size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    loader = DataLoader(DATA_DIR)
+    record = thaw(loader.load_enemy("cyberpunk", "street_thug_tutorial"))
+    template = loader.load_enemy_model("cyberpunk", "street_thug_tutorial")
+
+    copies_time, copies_size = measure(
+        lambda n: [copy.deepcopy(record) for _ in range(n)], count)
+    squad_time, squad_size = measure(lambda n: EnemySquad(template, n), count)
+    _, single_size = measure(lambda n: EnemySquad(template, n), 1)
+
+    print(f"👾 Spawning {count} x {template.name}")
+    print(f"   Deep copies: {copies_time * 1000:7.2f} ms  {copies_size / 1024:8.1f} KiB")
+    print(f"   Squad:       {squad_time * 1000:7.2f} ms  {squad_size / 1024:8.1f} KiB  "
+          f"(1 enemy: {single_size / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
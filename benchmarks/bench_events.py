@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: event dispatch cost with many narrowly interested listeners
+
+Fifty systems each care about one flag. "callback filter" subscribes them
+all to FLAG_SET and filters inside the callback (one Python call per
+listener per event); "where filter" declares the filter on subscribe so
+non-matching listeners are never called. Then the cost of listener
+profiling, off and on.
+
+Usage:
+    python benchmarks/bench_events.py [events]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.event_dispatcher import Event, EventDispatcher, EventType  # noqa: E402
+
+SYSTEMS = 50
+
+
+def run(dispatcher: EventDispatcher, events: int) -> float:
+    flags = [Event(EventType.FLAG_SET, {"flag": f"flag_{i % SYSTEMS}"}) for i in range(events)]
+    start = time.perf_counter()
+    for event in flags:
+        dispatcher.publish(event)
+    return time.perf_counter() - start
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    hits = [0]
+
+    def on_flag(event: Event):
+        hits[0] += 1
+
+    callback_filter = EventDispatcher(history_size=0)
+    for i in range(SYSTEMS):
+        wanted = f"flag_{i}"
+        callback_filter.subscribe(
+            EventType.FLAG_SET,
+            lambda event, wanted=wanted: on_flag(event) if event.data["flag"] == wanted else None
+        )
+
+    where_filter = EventDispatcher(history_size=0)
+    for i in range(SYSTEMS):
+        where_filter.subscribe(EventType.FLAG_SET, on_flag, where={"flag": f"flag_{i}"})
+
+    print(f"📣 {events} FLAG_SET events, {SYSTEMS} listeners filtering on the flag")
+    for name, dispatcher in (("callback filter", callback_filter), ("where filter", where_filter)):
+        report(name, run(dispatcher, events), events)
+
+    # Profiling cost: listeners called on every event
+    broadcast = EventDispatcher(history_size=0)
+    for _ in range(10):
+        broadcast.subscribe(EventType.FLAG_SET, on_flag)
+    print(f"⏱️  {events} FLAG_SET events, 10 listeners each")
+    report("profiling off", run(broadcast, events), events)
+    broadcast.enable_profiling(slow_threshold=None)
+    report("profiling on", run(broadcast, events), events)
+
+
+def report(name: str, elapsed: float, events: int):
+    print(f"   {name:<16} {elapsed * 1000:>8.1f} ms  ({elapsed / events * 1e6:.2f} µs/event)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rewind history (record time, restore time, storage) by campaign size
+
+Plays `points` autosaves of a campaign, advancing it a few turns between
+each, and records every one into a HistoryStore. Compares the history
+file with what keeping every autosave as a default-codec save would take.
+
+Usage:
+    python benchmarks/bench_history.py [turns ...]
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.save_codecs import DEFAULT_CODEC, get_codec  # noqa: E402
+from src.core.save_history import HistoryStore  # noqa: E402
+from src.core.save_manager import SaveManager  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_saves import make_state  # noqa: E402
+
+POINTS = 300
+TURNS_PER_POINT = 3
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    codec = get_codec(DEFAULT_CODEC)
+
+    for turns in sizes:
+        state = make_state(turns)
+        print(f"⏪ {POINTS} rewind points of a {turns}-turn campaign")
+
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+            saves = SaveManager(tmp)
+            history = HistoryStore(Path(tmp) / "history.db", max_points=POINTS)
+            record_times, full_bytes, ids = [], 0, []
+            for _point in range(POINTS):
+                for _ in range(TURNS_PER_POINT):
+                    state.turn_count += 1
+                    state.set_flag(f"quest_{state.turn_count // 10}_step", state.turn_count)
+                    state.record_choice(f"dialogue_{state.turn_count % 50}_option_1")
+                save_data = saves._build_save_data(state)
+                full_bytes += len(codec.encode(save_data))
+
+                start = time.perf_counter()
+                ids.append(history.record(save_data))
+                record_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for point_id in ids[::30]:
+                history.restore(point_id)
+            restore_time = (time.perf_counter() - start) / len(ids[::30])
+            history.close()
+            db_bytes = sum(path.stat().st_size for path in Path(tmp).glob("history.db*"))
+
+        record_times.sort()
+        print(f"   record: median {record_times[len(record_times) // 2] * 1000:.1f} ms, "
+              f"worst {record_times[-1] * 1000:.1f} ms")
+        print(f"   restore: {restore_time * 1000:.1f} ms")
+        print(f"   storage: {db_bytes / 1024:.0f} KiB "
+              f"(full saves: {full_bytes / 1024:.0f} KiB, {full_bytes / db_bytes:.0f}x)")
+        print()
+
+
+if __name__ == "__main__":
+    main()
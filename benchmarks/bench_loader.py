@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: loose JSON files vs precompiled content bundle
+
+Builds a synthetic genre by cloning the cyberpunk content under many IDs,
+then cold-loads every record through DataLoader both ways.
+
+Usage:
+    python benchmarks/bench_loader.py [copies]
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.bundle import build_bundle  # noqa: E402
+from src.data.loader import DataLoader  # noqa: E402
+
+SOURCE_GENRE = Path(__file__).resolve().parent.parent / "data" / "genres" / "cyberpunk"
+LOADERS = {
+    "locations": "load_location",
+    "npcs": "load_npc",
+    "enemies": "load_enemy",
+    "items": "load_item",
+    "dialogues": "load_dialogue_tree",
+}
+
+
+def make_content(data_dir: Path, copies: int) -> list[tuple[str, str]]:
+    """Clone every source record `copies` times, return (kind, id) pairs"""
+    records = []
+    for kind in LOADERS:
+        target = data_dir / "genres" / "bench" / kind
+        target.mkdir(parents=True)
+        for source in (SOURCE_GENRE / kind).glob("*.json"):
+            data = json.loads(source.read_text(encoding="utf-8"))
+            for i in range(copies):
+                record_id = f"{source.stem}_{i}"
+                path = target / f"{record_id}.json"
+                path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                records.append((kind, record_id))
+    return records
+
+
+def cold_load(data_dir: Path, records: list[tuple[str, str]], use_bundles: bool) -> float:
+    """Load every record once with a fresh loader, return seconds"""
+    start = time.perf_counter()
+    loader = DataLoader(data_dir, use_bundles=use_bundles)
+    for kind, record_id in records:
+        getattr(loader, LOADERS[kind])("bench", record_id)
+    elapsed = time.perf_counter() - start
+    loader.close()
+    return elapsed
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        records = make_content(data_dir, copies)
+
+        start = time.perf_counter()
+        path = build_bundle(data_dir, "bench")
+        build_time = time.perf_counter() - start
+
+        loose = min(cold_load(data_dir, records, use_bundles=False) for _ in range(3))
+        bundled = min(cold_load(data_dir, records, use_bundles=True) for _ in range(3))
+
+        print(f"📦 {len(records)} records, bundle {path.stat().st_size / 1024:.0f} KiB "
+              f"(built in {build_time * 1000:.0f} ms)")
+        print(f"   Loose files: {loose * 1000:8.1f} ms")
+        print(f"   Bundle:      {bundled * 1000:8.1f} ms  ({loose / bundled:.1f}x)")
+
+        shutil.rmtree(data_dir / "genres", ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: raw JSON dicts vs compiled content models
+
+Measures resident memory per record (tracemalloc) and hot-loop field access
+for every shipped cyberpunk record.
+
+Usage:
+    python benchmarks/bench_models.py [copies]
+"""
+
+import functools
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.models import compile_record  # noqa: E402
+
+SOURCE_GENRE = Path(__file__).resolve().parent.parent / "data" / "genres" / "cyberpunk"
+KINDS = ("locations", "npcs", "enemies", "items", "dialogues")
+
+
+def measure(build, copies: int) -> tuple[list, float]:
+    """Build `copies` objects, return them and the bytes allocated per object"""
+    tracemalloc.start()
+    objects = [build() for _ in range(copies)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, current / copies
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    for kind in KINDS:
+        for source in sorted((SOURCE_GENRE / kind).glob("*.json")):
+            raw = source.read_text(encoding="utf-8")
+            _, dict_bytes = measure(functools.partial(json.loads, raw), copies)
+            _, model_bytes = measure(
+                lambda kind=kind, raw=raw: compile_record(kind, json.loads(raw)), copies
+            )
+            print(f"{kind + '/' + source.stem:40s} dict {dict_bytes:8.0f} B   "
+                  f"model {model_bytes:8.0f} B   ({model_bytes / dict_bytes:.0%})")
+
+    raw = (SOURCE_GENRE / "enemies" / "street_thug_tutorial.json").read_text(encoding="utf-8")
+    enemy_dict = json.loads(raw)
+    enemy_model = compile_record("enemies", enemy_dict)
+    loops = 1_000_000
+
+    start = time.perf_counter()
+    for _ in range(loops):
+        dict_fields = (enemy_dict["stats"]["hp_max"], enemy_dict["attacks"][0]["damage_dice"])
+    dict_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(loops):
+        model_fields = (enemy_model.stats.hp_max, enemy_model.attacks[0].damage_dice)
+    model_time = time.perf_counter() - start
+    assert model_fields == dict_fields
+
+    print()
+    print(f"Field access x{loops}: dict {dict_time * 1000:.0f} ms, "
+          f"model {model_time * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: session recording overhead and headless replay speed
+
+A small combat system reacts to attack events with dice rolls and derived
+events. Times the session unrecorded, recorded to a journal, and replayed
+from that journal.
+
+Usage:
+    python benchmarks/bench_replay.py [attacks]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.event_dispatcher import Event, EventDispatcher, EventType  # noqa: E402
+from src.core.game_state import GameState  # noqa: E402
+from src.core.replay import SessionRecorder, replay  # noqa: E402
+from src.utils import dice  # noqa: E402
+
+
+def wire_combat(dispatcher: EventDispatcher, game_state: GameState):
+    def on_attack(event: Event):
+        if dice.d20() >= 10:
+            dispatcher.publish(Event(EventType.DAMAGE_DEALT, {
+                "target": event.data["target"], "amount": dice.damage_roll("1d8+2")
+            }))
+
+    def on_damage(event: Event):
+        if event.data["amount"] >= 9:
+            dispatcher.publish(Event(EventType.ENTITY_DIED, {"entity": event.data["target"]}))
+
+    dispatcher.subscribe(EventType.COMBAT_STARTED, on_attack)
+    dispatcher.subscribe(EventType.DAMAGE_DEALT, on_damage)
+
+
+def play(dispatcher: EventDispatcher, attacks: int) -> float:
+    start = time.perf_counter()
+    for i in range(attacks):
+        dispatcher.publish(Event(EventType.COMBAT_STARTED, {"target": f"rat_{i % 10}"}))
+    return time.perf_counter() - start
+
+
+def main():
+    attacks = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    game_state = GameState(seed=42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = EventDispatcher(history_size=0)
+        wire_combat(plain, game_state)
+        dice.seed(game_state.seed)
+        report("unrecorded", play(plain, attacks), attacks)
+
+        recorded = EventDispatcher(history_size=0)
+        wire_combat(recorded, game_state)
+        with SessionRecorder(recorded, log_dir=tmp) as recorder:
+            recorder.start(game_state)
+            report("recorded", play(recorded, attacks), attacks)
+        size = recorder.path.stat().st_size
+
+        start = time.perf_counter()
+        result = replay(recorder.path, wire_combat, GameState())
+        report("replayed", time.perf_counter() - start, attacks)
+
+    print(f"📼 journal {size / 1024:.0f} KB ({size / attacks:.0f} bytes/attack), "
+          f"{result.total_steps} steps, {'identical' if result.ok else result.divergence}")
+
+
+def report(name: str, elapsed: float, attacks: int):
+    print(f"   {name:<12} {elapsed * 1000:>8.1f} ms  ({elapsed / attacks * 1e6:.2f} µs/attack)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: save codecs (size, save time, load time) by campaign size
+
+Builds game states with growing world_flags / choice_history /
+visited_locations and saves and loads each one through SaveManager with
+every registered codec. "preview" is a lazy load reading the playtime
+and turn count (header plus the small core section).
+
+Usage:
+    python benchmarks/bench_saves.py [turns ...]
+"""
+
+import contextlib
+import functools
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.game_state import GameState  # noqa: E402
+from src.core.save_codecs import CODECS  # noqa: E402
+from src.core.save_manager import SaveManager  # noqa: E402
+from src.entities.player import Player  # noqa: E402
+
+
+def make_state(turns: int) -> GameState:
+    """A campaign after `turns` turns: one flag and one choice per turn"""
+    state = GameState(current_location_id="golden_drake_tavern", turn_count=turns)
+    state.player = Player(name="V")
+    for turn in range(turns):
+        state.set_flag(f"quest_{turn // 10}_step_{turn % 10}", turn if turn % 3 else True)
+        state.record_choice(f"dialogue_{turn % 50}_option_{turn % 4}")
+        state.visited_locations.add(f"location_{turn % 400}")
+    return state
+
+
+def preview(saves: SaveManager):
+    with saves.load_game("bench", lazy=True) as save:
+        return save.playtime_seconds, save.game_state_field("turn_count")
+
+
+def best_of(runs: int, func) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+
+    for turns in sizes:
+        state = make_state(turns)
+        print(f"💾 Campaign of {turns} turns")
+        print(f"   {'codec':<12} {'size':>10} {'save':>10} {'load':>10} {'preview':>10}")
+
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+            rows = []
+            for name in CODECS:
+                saves = SaveManager(tmp, codec=name)
+                save_time = best_of(3, functools.partial(saves.save_game, state, "bench"))
+                size = saves._find_save("bench").stat().st_size
+                load_time = best_of(3, functools.partial(saves.load_game, "bench"))
+                preview_time = best_of(3, functools.partial(preview, saves))
+                rows.append((name, size, save_time, load_time, preview_time))
+
+        for name, size, save_time, load_time, preview_time in rows:
+            print(f"   {name:<12} {size / 1024:>7.0f} KiB {save_time * 1000:>7.1f} ms "
+                  f"{load_time * 1000:>7.1f} ms {preview_time * 1000:>7.2f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,11 @@ Core game systems - state management, events, saves
 """
 
 from .game_state import GameState, GamePhase
-from .event_dispatcher import EventDispatcher, Event, EventType, game_events
+from .event_dispatcher import (
+    EventDispatcher, Event, EventCategory, EventHistory, EventType, ListenerError, by_data_key,
+    game_events
+)
+from .session import GameSession, current_session, get_events, notify
 
 __all__ = [
     "GameState",
@@ -11,5 +15,13 @@ __all__ = [
     "EventDispatcher",
     "Event",
     "EventType",
+    "EventCategory",
+    "EventHistory",
+    "by_data_key",
+    "ListenerError",
     "game_events",
+    "GameSession",
+    "current_session",
+    "get_events",
+    "notify",
 ]
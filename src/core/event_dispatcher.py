@@ -1,11 +1,52 @@
 """
 Event System - Decoupled communication between game systems
+
+Events are dispatched immediately by default. In queued mode publish()
+only enqueues, and the game loop calls flush() once per tick to dispatch
+pending events by priority, within an optional event count / time budget.
+Listeners that publish during a flush enqueue too, instead of recursing.
+
+Listeners may be coroutine functions. Their coroutines are scheduled as
+tasks on the running event loop (or an attached one), at most
+max_concurrent at a time, so publishing never waits for their I/O. With
+neither loop, they aren't run and are reported as listener errors.
+
+Listener errors - sync or async - are reported as ListenerError records
+to the dispatcher's error handlers (logged by default) and kept in
+recent_errors.
+
+Subscriptions can target an EventType, an EventCategory or a glob over
+event type values ("*", "dialogue_*"), filter on event data declaratively
+(where={"flag": "met_tom"}) or with a predicate, and hold their callback
+weakly. Targets are resolved into a per-type dispatch table that is only
+rebuilt when subscriptions change, and filters are checked before any
+listener is called.
 """
 
-from typing import Callable, Dict, List, Optional
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from fnmatch import fnmatchcase
+from typing import (
+    Any, Callable, Deque, Dict, FrozenSet, Hashable, Iterator, List, Optional, Set, Tuple, Union
+)
 from dataclasses import dataclass
 from enum import Enum
 
+from .event_profiler import DEFAULT_SLOW_THRESHOLD, EventProfiler
+
+DEFAULT_HISTORY_SIZE = 1000
+DEFAULT_MAX_CONCURRENT = 16  # Async listener calls running at once
+DEFAULT_MAX_PENDING = 1000  # Async listener calls scheduled but not finished
+
+logger = logging.getLogger(__name__)
+
 
 class EventType(Enum):
     """All possible game events"""
@@ -39,6 +80,67 @@ class EventType(Enum):
     SAVE_TRIGGERED = "save_triggered"
     LOAD_TRIGGERED = "load_triggered"
     GAME_OVER = "game_over"
+    CONTENT_RELOADED = "content_reloaded"
+
+
+class EventCategory(Enum):
+    """Groups of event types, for subscribing to all of them at once"""
+    PLAYER = "player"
+    WORLD = "world"
+    COMBAT = "combat"
+    DIALOGUE = "dialogue"
+    SYSTEM = "system"
+
+
+EVENT_CATEGORIES: Dict[EventCategory, FrozenSet[EventType]] = {
+    EventCategory.PLAYER: frozenset({
+        EventType.PLAYER_MOVED, EventType.PLAYER_DIALOGUE_CHOICE,
+        EventType.PLAYER_COMBAT_ACTION, EventType.PLAYER_ITEM_USED, EventType.PLAYER_LEVEL_UP,
+    }),
+    EventCategory.WORLD: frozenset({
+        EventType.LOCATION_ENTERED, EventType.LOCATION_EXITED, EventType.NPC_SPAWNED,
+        EventType.QUEST_UPDATED, EventType.FLAG_SET,
+    }),
+    EventCategory.COMBAT: frozenset({
+        EventType.COMBAT_STARTED, EventType.COMBAT_ENDED, EventType.DAMAGE_DEALT,
+        EventType.ENTITY_DIED,
+    }),
+    EventCategory.DIALOGUE: frozenset({
+        EventType.DIALOGUE_STARTED, EventType.DIALOGUE_ENDED, EventType.DIALOGUE_CHOICE_MADE,
+    }),
+    EventCategory.SYSTEM: frozenset({
+        EventType.SAVE_TRIGGERED, EventType.LOAD_TRIGGERED, EventType.GAME_OVER,
+        EventType.CONTENT_RELOADED,
+    }),
+}
+
+ALL_EVENTS = "*"
+
+Target = Union[EventType, EventCategory, str]
+
+
+def resolve_target(target: Target) -> FrozenSet[EventType]:
+    """
+    Event types a subscription target covers
+
+    Args:
+        target: An EventType, an EventCategory, or a glob over event type
+            values ("*" for every event, "dialogue_*"...)
+
+    Raises:
+        ValueError: If a pattern matches no event type
+        TypeError: If target is none of the above
+    """
+    if isinstance(target, EventType):
+        return frozenset((target,))
+    if isinstance(target, EventCategory):
+        return EVENT_CATEGORIES[target]
+    if isinstance(target, str):
+        types = frozenset(t for t in EventType if fnmatchcase(t.value, target))
+        if not types:
+            raise ValueError(f"No event type matches: {target}")
+        return types
+    raise TypeError(f"Not an event type, category or pattern: {target!r}")
 
 
 @dataclass
@@ -48,6 +150,153 @@ class Event:
     data: dict
 
 
+_MISSING = object()
+
+
+class _Subscription:
+    """A listener with its target and filters"""
+    __slots__ = ("seq", "target", "types", "weak", "_callback", "where", "predicate")
+
+    def __init__(
+        self,
+        seq: int,
+        target: Target,
+        callback: Callable,
+        where: Optional[Dict[str, Any]],
+        predicate: Optional[Callable[[Event], bool]],
+        weak: bool,
+        on_collected: Callable
+    ):
+        self.seq = seq  # Subscription order
+        self.target = target
+        self.types = resolve_target(target)
+        self.weak = weak
+        # The listener, or for weak subscriptions a weak reference to it
+        self._callback: Callable[..., Any]
+        if weak:
+            ref = weakref.WeakMethod if inspect.ismethod(callback) else weakref.ref
+            self._callback = ref(callback, on_collected)
+        else:
+            self._callback = callback
+        self.where: Tuple[Tuple[str, Any], ...] = tuple(where.items()) if where else ()
+        self.predicate = predicate
+
+    @property
+    def callback(self) -> Optional[Callable]:
+        """The listener (None once a weak listener was garbage collected)"""
+        return self._callback() if self.weak else self._callback
+
+
+class EventHistory:
+    """
+    Ring buffer of recently published events, indexed by type
+
+    Holds the last maxlen events (maxlen=0 records nothing, None keeps
+    everything). Each event type has its own buffer holding exactly the
+    retained events of that type, evicted together with the main buffer,
+    so filtered queries cost O(matches).
+
+    Iterating reads the buffers directly, without copying; publishing
+    while iterating raises RuntimeError (copy with list() first).
+    """
+
+    def __init__(self, maxlen: Optional[int] = DEFAULT_HISTORY_SIZE):
+        self.maxlen = maxlen
+        self._events: Deque[Event] = deque()
+        self._by_type: Dict[EventType, Deque[Event]] = {}
+
+    def append(self, event: Event):
+        """Record an event, evicting the oldest one if the buffer is full"""
+        if self.maxlen is not None:
+            if self.maxlen <= 0:
+                return
+            if len(self._events) >= self.maxlen:
+                oldest = self._events.popleft()
+                self._by_type[oldest.type].popleft()
+
+        self._events.append(event)
+        events = self._by_type.get(event.type)
+        if events is None:
+            events = self._by_type[event.type] = deque()
+        events.append(event)
+
+    def resize(self, maxlen: Optional[int]):
+        """Change the capacity, dropping the oldest events if it shrinks"""
+        self.maxlen = maxlen
+        limit = max(maxlen, 0) if maxlen is not None else len(self._events)
+        while len(self._events) > limit:
+            oldest = self._events.popleft()
+            self._by_type[oldest.type].popleft()
+
+    def events(self, event_type: Optional[EventType] = None) -> Iterator[Event]:
+        """Iterate over retained events (of one type), oldest first"""
+        if event_type is None:
+            return iter(self._events)
+        return iter(self._by_type.get(event_type, ()))
+
+    def count(self, event_type: Optional[EventType] = None) -> int:
+        """Number of retained events (of one type)"""
+        if event_type is None:
+            return len(self._events)
+        return len(self._by_type.get(event_type, ()))
+
+    def clear(self):
+        """Forget all recorded events"""
+        self._events.clear()
+        self._by_type.clear()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events)
+
+
+@dataclass
+class ListenerError:
+    """A listener failure, as reported to error handlers"""
+    event: Event
+    listener: Callable
+    error: BaseException
+    is_async: bool = False
+    # "exception", or why an async call was dropped: "overflow" (backlog
+    # full) or "no_loop" (no running or attached event loop)
+    kind: str = "exception"
+
+    def __str__(self) -> str:
+        name = getattr(self.listener, "__qualname__", repr(self.listener))
+        return f"{self.kind} in {name} for {self.event.type}: {self.error!r}"
+
+
+def log_listener_error(error: ListenerError):
+    """Default error handler: log with the traceback"""
+    logger.warning("Error in event listener: %s", error, exc_info=error.error)
+
+
+# A compiled subscription: (subscription order, subscription, data filters left to check)
+_Entry = Tuple[int, _Subscription, Tuple[Tuple[str, Any], ...]]
+# Per event type: entries checked for every event, and entries indexed by
+# their first filter: field -> value -> entries
+_Route = Tuple[Tuple[_Entry, ...], Dict[str, Dict[Any, Tuple[_Entry, ...]]]]
+
+CoalesceKey = Callable[[Event], Hashable]
+CoalesceMerge = Callable[[Event, Event], Event]
+
+
+def by_data_key(*fields: str) -> CoalesceKey:
+    """
+    Coalescing key built from event data fields
+
+    Example:
+        # Repeated FLAG_SET events on the same flag merge; the last value wins
+        game_events.coalesce(EventType.FLAG_SET, by_data_key("flag"))
+    """
+    if len(fields) == 1:
+        field = fields[0]
+        return lambda event: event.data.get(field)
+    return lambda event: tuple(event.data.get(field) for field in fields)
+
+
 class EventDispatcher:
     """
     Central event bus - allows systems to communicate without tight coupling
@@ -61,63 +310,572 @@ class EventDispatcher:
             print(f"Combat started with {event.data['enemy_count']} enemies!")
 
         game_events.subscribe(EventType.COMBAT_STARTED, on_combat_start)
+
+        # Production: don't record history
+        game_events.set_history_size(0)
+
+        # Queued mode: dispatch once per tick, at most 200 events
+        dispatcher = EventDispatcher(queued=True, tick_budget=200)
+        dispatcher.set_priority(EventType.ENTITY_DIED, 10)
+        dispatcher.coalesce(EventType.FLAG_SET, by_data_key("flag"))
+        ...
+        dispatcher.flush()  # In the game loop
+
+        # Async listener: runs as a task on the running (or attached) event loop
+        game_events.attach_loop(ui_loop)
+        async def on_save(event: Event):
+            await asyncio.to_thread(save_manager.autosave, game_state)
+
+        game_events.subscribe(EventType.SAVE_TRIGGERED, on_save)
+        game_events.add_error_handler(lambda error: ui.show_warning(str(error)))
     """
 
-    def __init__(self):
-        self._listeners: Dict[EventType, List[Callable]] = {}
-        self._event_history: List[Event] = []  # For debugging
+    def __init__(
+        self,
+        history_size: Optional[int] = DEFAULT_HISTORY_SIZE,
+        queued: bool = False,
+        tick_budget: Optional[int] = None,
+        tick_seconds: Optional[float] = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_pending: Optional[int] = DEFAULT_MAX_PENDING
+    ):
+        """
+        Initialize dispatcher
+
+        Args:
+            history_size: Recent events kept for debugging (0 = none, None = all)
+            queued: Make publish() enqueue events for flush() instead of
+                dispatching them immediately
+            tick_budget: Default maximum events dispatched per flush()
+            tick_seconds: Default maximum time spent per flush()
+            max_concurrent: Async listener calls allowed to run at once
+            max_pending: Async listener calls allowed to be scheduled but
+                unfinished; publish() drops (and reports) calls beyond it,
+                apublish() waits for room (None = unbounded)
+        """
+        self._subscriptions: List[_Subscription] = []
+        self._subscription_seq = itertools.count()
+        self._table: Optional[Dict[EventType, _Route]] = None  # See _compile
+        self._event_history = EventHistory(history_size)  # For debugging
+
+        # Queued mode (see flush)
+        self.queued = queued
+        self.tick_budget = tick_budget
+        self.tick_seconds = tick_seconds
+        self._queue: List[list] = []  # Heap of [-priority, sequence, event, key]
+        self._sequence = itertools.count()
+        self._priorities: Dict[EventType, int] = {}
+        self._coalesce: Dict[EventType, Tuple[CoalesceKey, Optional[CoalesceMerge]]] = {}
+        self._coalesced: Dict[Tuple[EventType, Any], list] = {}  # Queued entries by key
+
+        # Async listeners (see _schedule)
+        self.max_concurrent = max_concurrent
+        self.max_pending = max_pending
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # See attach_loop
+        self._async_lock = threading.Lock()
+        self._async_pending = 0
+        self._tasks: Set[asyncio.Task] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._room: Optional[asyncio.Event] = None  # Set when an async call finishes
 
-    def subscribe(self, event_type: EventType, callback: Callable):
+        # Instrumentation (see enable_profiling, add_publish_hook)
+        self.profiler: Optional[EventProfiler] = None
+        self._publish_hooks: List[Callable[[Event, int], None]] = []
+        self._dispatch_depth = 0  # Dispatches in progress (> 0 inside a listener)
+
+        # Error channel
+        self._error_handlers: List[Callable[[ListenerError], None]] = []
+        self.recent_errors: Deque[ListenerError] = deque(maxlen=100)
+
+    def subscribe(
+        self,
+        event_type: Target,
+        callback: Callable,
+        where: Optional[Dict[str, Any]] = None,
+        predicate: Optional[Callable[[Event], bool]] = None,
+        weak: bool = False
+    ):
         """
         Register a listener for an event type
 
         Args:
-            event_type: Type of event to listen for
-            callback: Function to call when event fires (receives Event object)
+            event_type: Type of event to listen for - or an EventCategory, or
+                a glob over event type values ("*", "combat_*")
+            callback: Function to call when event fires (receives Event object);
+                coroutine functions are scheduled on the event loop
+            where: Only events whose data has these values (checked before
+                the callback is called)
+            predicate: Only events for which this returns True
+            weak: Hold the callback by weak reference; the subscription goes
+                away when the callback (or a bound method's object) is
+                garbage collected
+
+        Raises:
+            ValueError: If a pattern matches no event type
+
+        Example:
+            game_events.subscribe(EventCategory.COMBAT, combat_log.record)
+            game_events.subscribe(EventType.FLAG_SET, on_tutorial_done,
+                                  where={"flag": "tutorial_combat_complete"})
+            game_events.subscribe("*", hud.on_event, weak=True)
         """
-        if event_type not in self._listeners:
-            self._listeners[event_type] = []
-        self._listeners[event_type].append(callback)
+        self._subscriptions.append(_Subscription(
+            next(self._subscription_seq), event_type, callback, where, predicate, weak,
+            self._on_collected
+        ))
+        self._table = None
 
-    def unsubscribe(self, event_type: EventType, callback: Callable):
-        """Remove a listener"""
-        if event_type in self._listeners:
-            try:
-                self._listeners[event_type].remove(callback)
-            except ValueError:
-                pass  # Callback wasn't subscribed
+    def unsubscribe(self, event_type: Target, callback: Callable):
+        """Remove a listener (every subscription of it to this target)"""
+        self._subscriptions = [
+            sub for sub in self._subscriptions
+            if not (sub.target == event_type and sub.callback == callback)
+        ]
+        self._table = None
 
-    def publish(self, event: Event):
+    def _on_collected(self, _ref):
+        """A weak listener died: rebuild the dispatch table without it"""
+        self._table = None
+
+    def _compile(self) -> Dict[EventType, _Route]:
+        """
+        Build the event type -> route table
+
+        Subscriptions with a data filter are indexed by their first
+        field/value pair, so dispatch finds them with one dict lookup per
+        filtered field instead of testing each one.
         """
-        Fire an event - notify all listeners
+        self._subscriptions = [sub for sub in self._subscriptions if sub.callback is not None]
+        routes: Dict[EventType, Tuple[List[_Entry], Dict[str, Dict[Any, List[_Entry]]]]] = {}
+        for sub in self._subscriptions:
+            indexed = None
+            if sub.where:
+                field, value = sub.where[0]
+                try:
+                    hash(value)
+                    indexed = field, value
+                except TypeError:
+                    pass  # Unhashable filter value: checked for every event
+            for event_type in sub.types:
+                always, index = routes.setdefault(event_type, ([], {}))
+                if indexed is None:
+                    always.append((sub.seq, sub, sub.where))
+                else:
+                    index.setdefault(field, {}).setdefault(value, []).append(
+                        (sub.seq, sub, sub.where[1:])
+                    )
+
+        self._table = {
+            event_type: (
+                tuple(always),
+                {
+                    field: {value: tuple(entries) for value, entries in by_value.items()}
+                    for field, by_value in index.items()
+                },
+            )
+            for event_type, (always, index) in routes.items()
+        }
+        return self._table
+
+    def listener_count(self, event_type: Optional[EventType] = None) -> int:
+        """Live subscriptions receiving an event type (or in total), filters aside"""
+        table = self._table if self._table is not None else self._compile()
+        if event_type is None:
+            return len(self._subscriptions)
+        always, index = table.get(event_type, ((), {}))
+        return len(always) + sum(
+            len(entries) for by_value in index.values() for entries in by_value.values()
+        )
+
+    def publish(self, event: Event, priority: Optional[int] = None):
+        """
+        Fire an event - notify all listeners (or enqueue it in queued mode)
 
         Args:
             event: Event object to publish
+            priority: Queue priority, higher first (defaults to the event
+                type's priority, see set_priority); ignored unless queued
+        """
+        for hook in self._publish_hooks:
+            hook(event, self._dispatch_depth)
+        if self.queued:
+            self._enqueue(event, priority)
+        else:
+            self._dispatch(event)
+
+    def add_publish_hook(self, hook: Callable[[Event, int], None]):
+        """
+        Observe every published event (before it is queued or dispatched)
+
+        Args:
+            hook: Function called with the event and the dispatch depth -
+                0 for events published from outside any listener, 1+ for
+                events published by listeners (see src/core/replay.py)
+        """
+        self._publish_hooks.append(hook)
+
+    def remove_publish_hook(self, hook: Callable[[Event, int], None]):
+        """Stop observing published events"""
+        try:
+            self._publish_hooks.remove(hook)
+        except ValueError:
+            pass  # Hook wasn't added
+
+    def set_priority(self, event_type: EventType, priority: int):
+        """Default queue priority of an event type (higher first, default 0)"""
+        self._priorities[event_type] = priority
+
+    def coalesce(
+        self,
+        event_type: EventType,
+        key: CoalesceKey,
+        merge: Optional[CoalesceMerge] = None
+    ):
+        """
+        Merge queued events of a type that share a key
+
+        A newly queued event whose key matches a pending one is merged into
+        it - the pending event keeps its place in the queue.
+
+        Args:
+            event_type: Type of event to coalesce
+            key: Function returning an event's key (see by_data_key)
+            merge: Function (pending, new) -> merged event; by default the
+                new event replaces the pending one
+
+        Example:
+            # Sum queued damage per target
+            dispatcher.coalesce(
+                EventType.DAMAGE_DEALT, by_data_key("target"),
+                lambda old, new: Event(new.type, {**new.data,
+                                       "amount": old.data["amount"] + new.data["amount"]})
+            )
         """
+        self._coalesce[event_type] = (key, merge)
+
+    def _enqueue(self, event: Event, priority: Optional[int]):
+        rule = self._coalesce.get(event.type)
+        key = None
+        if rule is not None:
+            key = (event.type, rule[0](event))
+            entry = self._coalesced.get(key)
+            if entry is not None:
+                merge = rule[1]
+                entry[2] = merge(entry[2], event) if merge is not None else event
+                return
+
+        if priority is None:
+            priority = self._priorities.get(event.type, 0)
+        entry = [-priority, next(self._sequence), event, key]
+        heapq.heappush(self._queue, entry)
+        if key is not None:
+            self._coalesced[key] = entry
+
+    def flush(
+        self,
+        max_events: Optional[int] = None,
+        max_seconds: Optional[float] = None
+    ) -> int:
+        """
+        Dispatch queued events, highest priority first (FIFO within a priority)
+
+        Events published by listeners meanwhile are queued and dispatched in
+        the same flush if the budget allows. Whatever is left stays queued
+        for the next flush.
+
+        Args:
+            max_events: Maximum events to dispatch (defaults to tick_budget)
+            max_seconds: Stop once this much time has been spent (defaults
+                to tick_seconds); checked between events
+
+        Returns:
+            Number of events dispatched
+        """
+        max_events = self.tick_budget if max_events is None else max_events
+        max_seconds = self.tick_seconds if max_seconds is None else max_seconds
+        deadline = time.perf_counter() + max_seconds if max_seconds is not None else None
+
+        dispatched = 0
+        queue = self._queue
+        while queue and (max_events is None or dispatched < max_events):
+            if deadline is not None and dispatched and time.perf_counter() >= deadline:
+                break
+            _, _, event, key = heapq.heappop(queue)
+            if key is not None:
+                del self._coalesced[key]
+            self._dispatch(event)
+            dispatched += 1
+        return dispatched
+
+    def pending(self) -> int:
+        """Number of queued events"""
+        return len(self._queue)
+
+    def clear_queue(self):
+        """Drop queued events without dispatching them"""
+        self._queue.clear()
+        self._coalesced.clear()
+
+    def _dispatch(self, event: Event):
+        """Record an event and notify its listeners"""
+        self._dispatch_depth += 1
+        try:
+            self._notify(event)
+        finally:
+            self._dispatch_depth -= 1
+
+    def _notify(self, event: Event):
         # Record in history
         self._event_history.append(event)
 
         # Notify listeners
-        if event.type in self._listeners:
-            for callback in self._listeners[event.type]:
+        profiler = self.profiler
+        if profiler is not None:
+            dispatch_start = time.perf_counter()
+        table = self._table if self._table is not None else self._compile()
+        route = table.get(event.type)
+        if route is None:
+            if profiler is not None:  # Still a dispatch, just without listeners
+                profiler.record_event(event.type, time.perf_counter() - dispatch_start)
+            return
+        entries, index = route
+        if index:
+            data = event.data
+            sources = 1 if entries else 0
+            for field, by_value in index.items():
                 try:
-                    callback(event)
-                except Exception as e:
-                    print(f"⚠️  Error in event listener for {event.type}: {e}")
+                    hits = by_value.get(data.get(field, _MISSING))
+                except TypeError:
+                    continue  # Unhashable event value can't equal a filter value
+                if hits:
+                    entries = entries + hits if entries else hits
+                    sources += 1
+            if sources > 1:
+                entries = sorted(entries)  # Back to subscription order
 
-    def clear_listeners(self, event_type: Optional[EventType] = None):
-        """Clear all listeners (or for specific type)"""
+        for _, sub, where in entries:
+            callback = sub._callback() if sub.weak else sub._callback
+            if callback is None:
+                continue
+            try:
+                if where:
+                    data = event.data
+                    if not all(data.get(key, _MISSING) == value for key, value in where):
+                        continue
+                if sub.predicate is not None and not sub.predicate(event):
+                    continue
+                if profiler is None:
+                    result = callback(event)
+                else:
+                    start = time.perf_counter()
+                    try:
+                        result = callback(event)
+                    finally:
+                        profiler.record(
+                            event, sub.seq, callback, sub.target, time.perf_counter() - start
+                        )
+            except Exception as e:
+                self._report(ListenerError(event, callback, e))
+                continue
+            if result is not None and inspect.isawaitable(result):
+                self._schedule(result, event, callback)
+
+        if profiler is not None:
+            profiler.record_event(event.type, time.perf_counter() - dispatch_start)
+
+    def enable_profiling(
+        self,
+        slow_threshold: Optional[float] = DEFAULT_SLOW_THRESHOLD
+    ) -> EventProfiler:
+        """
+        Start timing listeners (see src/core/event_profiler.py)
+
+        Args:
+            slow_threshold: Log listener calls taking at least this many
+                seconds as warnings (None = don't log)
+
+        Returns:
+            The profiler collecting the timings
+        """
+        self.profiler = EventProfiler(slow_threshold)
+        return self.profiler
+
+    def disable_profiling(self) -> Optional[EventProfiler]:
+        """Stop timing listeners; returns the profiler with what it collected"""
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def profiling_snapshot(self) -> Optional[dict]:
+        """Timings collected so far (see EventProfiler.snapshot), or None if not profiling"""
+        profiler = self.profiler
+        return profiler.snapshot() if profiler is not None else None
+
+    async def apublish(self, event: Event, priority: Optional[int] = None):
+        """
+        Publish from a coroutine, first waiting while the async listener
+        backlog is full (backpressure instead of dropped calls)
+        """
+        loop = asyncio.get_running_loop()
+        while self.max_pending is not None and self._async_pending >= self.max_pending:
+            _, room = self._limits_for(loop)
+            room.clear()
+            await room.wait()
+        self.publish(event, priority)
+
+    def attach_loop(self, loop: Optional[asyncio.AbstractEventLoop]):
+        """
+        Run async listeners of events published outside any running loop
+        (e.g., from the game thread) on this loop
+
+        The loop may start running later; calls are queued on it until
+        then. Without an attached loop, such listeners can't run: their
+        calls are dropped and reported as ListenerError(kind="no_loop").
+        """
+        self._loop = loop
+
+    def _schedule(self, awaitable, event: Event, callback: Callable):
+        """Run an async listener's awaitable as a task"""
+        running: Optional[asyncio.AbstractEventLoop]
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        loop = running if running is not None else self._loop
+        if loop is None or loop.is_closed():
+            self._drop(awaitable, event, callback, "no_loop", RuntimeError(
+                "No running event loop for an async listener (see attach_loop)"
+            ))
+            return
+
+        with self._async_lock:
+            full = self.max_pending is not None and self._async_pending >= self.max_pending
+            if not full:
+                self._async_pending += 1
+        if full:
+            self._drop(awaitable, event, callback, "overflow",
+                       RuntimeError("Async listener backlog is full"))
+            return
+
+        if loop is running:
+            self._start(loop, awaitable, event, callback)
+            return
+        try:
+            loop.call_soon_threadsafe(self._start, loop, awaitable, event, callback)
+        except RuntimeError as e:  # Closed since the check above
+            with self._async_lock:
+                self._async_pending -= 1
+            self._drop(awaitable, event, callback, "no_loop", e)
+
+    def _drop(
+        self,
+        awaitable,
+        event: Event,
+        callback: Callable,
+        kind: str,
+        error: BaseException
+    ):
+        """Discard an async listener call that can't be run, reporting why"""
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        self._report(ListenerError(event, callback, error, is_async=True, kind=kind))
+
+    def _start(self, loop: asyncio.AbstractEventLoop, awaitable, event: Event, callback: Callable):
+        task = loop.create_task(self._run(awaitable, event, callback))
+        self._tasks.add(task)  # Keep a reference until it's done
+        task.add_done_callback(self._tasks.discard)
+
+    def _limits_for(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> Tuple[asyncio.Semaphore, asyncio.Event]:
+        """Concurrency limiter and room signal of a loop"""
+        if self._semaphore is None or self._room is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._room = asyncio.Event()
+            self._semaphore_loop = loop
+        return self._semaphore, self._room
+
+    async def _run(self, awaitable, event: Event, callback: Callable):
+        """Await an async listener within the concurrency limit, reporting errors"""
+        try:
+            semaphore, _ = self._limits_for(asyncio.get_running_loop())
+            async with semaphore:
+                await awaitable
+        except Exception as e:
+            self._report(ListenerError(event, callback, e, is_async=True))
+        finally:
+            with self._async_lock:
+                self._async_pending -= 1
+            if self._room is not None:
+                self._room.set()
+
+    def async_pending(self) -> int:
+        """Async listener calls scheduled but not finished"""
+        return self._async_pending
+
+    async def drain(self):
+        """Wait until the async listeners scheduled on this loop have finished"""
+        loop = asyncio.get_running_loop()
+        while True:
+            tasks = [task for task in self._tasks if task.get_loop() is loop]
+            if not tasks:
+                return
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def add_error_handler(self, handler: Callable[[ListenerError], None]):
+        """
+        Receive listener errors (replaces the default logging handler)
+
+        Args:
+            handler: Function called with a ListenerError
+        """
+        self._error_handlers.append(handler)
+
+    def remove_error_handler(self, handler: Callable[[ListenerError], None]):
+        """Stop sending listener errors to a handler"""
+        try:
+            self._error_handlers.remove(handler)
+        except ValueError:
+            pass  # Handler wasn't added
+
+    def _report(self, error: ListenerError):
+        """Send a listener error to the error handlers"""
+        self.recent_errors.append(error)
+        for handler in self._error_handlers or (log_listener_error,):
+            try:
+                handler(error)
+            except Exception:
+                logger.exception("Error in listener error handler")
+
+    def clear_listeners(self, event_type: Optional[Target] = None):
+        """Clear all listeners (or those subscribed to a specific target)"""
         if event_type:
-            self._listeners[event_type] = []
+            self._subscriptions = [sub for sub in self._subscriptions if sub.target != event_type]
         else:
-            self._listeners.clear()
+            self._subscriptions = []
+        self._table = None
 
     def get_event_history(self, event_type: Optional[EventType] = None) -> List[Event]:
-        """Get event history (for debugging)"""
-        if event_type:
-            return [e for e in self._event_history if e.type == event_type]
-        return self._event_history.copy()
+        """Get event history (for debugging) - a copy, oldest first"""
+        return list(self._event_history.events(event_type))
+
+    def iter_event_history(self, event_type: Optional[EventType] = None) -> Iterator[Event]:
+        """Iterate over event history (of one type) without copying it"""
+        return self._event_history.events(event_type)
+
+    @property
+    def history(self) -> EventHistory:
+        """The recorded event history"""
+        return self._event_history
+
+    def set_history_size(self, history_size: Optional[int]):
+        """Change how many events are kept (0 = disable history, None = unbounded)"""
+        self._event_history.resize(history_size)
+
+    def clear_history(self):
+        """Forget recorded events"""
+        self._event_history.clear()
 
 
-# Global singleton instance
+# Global singleton instance, used outside any GameSession (see session.get_events)
 game_events = EventDispatcher()
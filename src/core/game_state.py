@@ -47,7 +47,7 @@ class GameState:
 
     # Save metadata
     save_version: str = "1.0.0"
-    seed: int = 0  # For reproducible RNG
+    seed: int = 0  # For reproducible RNG (0 = not chosen yet, see GameSession)
     playtime_seconds: int = 0
 
     def set_flag(self, flag_name: str, value: Any = True):
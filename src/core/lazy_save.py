@@ -0,0 +1,248 @@
+"""
+Lazy Save - Open a save file and decode its sections on first access
+
+Headered saves (see save_codecs.py) store the game state's scalars, each
+large table and the player separately. LazySave reads the header when
+it's opened and nothing else: metadata comes from the header, and each
+section is read, decompressed and decoded the first time it's needed. A
+slot preview or a cloud-sync comparison of playtime never touches the
+flag tables.
+
+Journaled saves are supported: the journal's operations are routed to the
+sections their paths fall in and applied when that section is decoded.
+
+Legacy JSON saves have no header or sections; they are decoded in full
+when opened.
+
+Example:
+    with save_manager.load_game("autosave", lazy=True) as save:
+        print(save.current_location_id, save.playtime_seconds)  # Header only
+        if save.game_state_field("turn_count") > 100:            # Core section only
+            game_state = save.game_state                         # Everything
+"""
+
+import copy
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Tuple
+
+from .save_codecs import (
+    SAVE_MAGIC, SPLIT_TABLES, decode_save, decode_section, read_header_from, split_sections
+)
+from .save_journal import apply, journal_path, read_entries
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+_MISSING = object()
+
+
+def _path(name: str) -> Tuple[str, ...]:
+    return tuple(name.split("."))
+
+
+class LazySave:
+    """
+    A save file opened for on-demand decoding
+
+    Keeps the file open so later section reads see the same save even if
+    the slot is overwritten meanwhile (saves are replaced by rename).
+    Decoded sections are cached and shared; treat them as read-only, or
+    use game_state for a GameState of your own.
+    """
+
+    def __init__(self, path: Path, file: Optional[BinaryIO] = None):
+        """
+        Open a save file and read its header
+
+        Args:
+            path: Save file (.sav or legacy .json)
+            file: Save data that is already open (e.g., a database row in
+                an io.BytesIO); path then only locates the journal, if any
+
+        Raises:
+            OSError: If the file can't be opened
+            ValueError: If the header is corrupt
+        """
+        self.path = path
+        self._sections: Dict[str, Any] = {}  # Decoded sections (journal applied)
+        self._game_state: Optional['GameState'] = None
+        self._player = _MISSING
+
+        with ExitStack() as stack:  # Closes the file only if the header can't be read
+            if file is None:
+                self._file: BinaryIO = stack.enter_context(open(path, 'rb'))
+            else:
+                self._file = stack.enter_context(file)
+            self._read_header()
+            self._closer = stack.pop_all()  # Closed by close()
+
+    def _read_header(self):
+        """Load the header, the section table and the journal operations"""
+        f = self._file
+        self._header = None
+        self._table: Dict[str, List[int]] = {}
+        self._raw_sections: Optional[Dict[str, Any]] = None  # For legacy JSON saves
+
+        if f.read(len(SAVE_MAGIC)) == SAVE_MAGIC:
+            f.seek(0)
+            self._header = read_header_from(f)
+            info = self._header.info
+            self._table = info["sections"]
+        else:
+            f.seek(0)
+            info = decode_save(f.read())
+            self._raw_sections = split_sections(info)
+            self._table = {name: [] for name in self._raw_sections}
+
+        self._metadata = info["metadata"]
+        self._ops: List[list] = []
+        if info.get("journal"):
+            for entry in read_entries(journal_path(self.path), info["journal"]["generation"]):
+                self._ops.extend(entry["ops"])
+                self._metadata = entry["metadata"]
+
+    def close(self):
+        """Close the save file (already decoded sections stay available)"""
+        self._closer.close()
+
+    def __enter__(self) -> 'LazySave':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def metadata(self) -> dict:
+        """Save metadata (save_time, version, location, playtime) - header only"""
+        return self._metadata
+
+    @property
+    def current_location_id(self) -> str:
+        return self._metadata["location"]
+
+    @property
+    def playtime_seconds(self) -> int:
+        return self._metadata["playtime"]
+
+    @property
+    def section_names(self) -> List[str]:
+        """Names of the stored sections (e.g., "game_state.world_flags")"""
+        return list(self._table)
+
+    @property
+    def decoded_sections(self) -> List[str]:
+        """Sections decoded so far"""
+        return list(self._sections)
+
+    def section(self, name: str) -> Any:
+        """
+        Decode one section (once), with the journal applied
+
+        Args:
+            name: Section name (see section_names)
+
+        Raises:
+            KeyError: If the save has no such section
+            ValueError: If the section is corrupt
+        """
+        if name in self._sections:
+            return self._sections[name]
+        if name not in self._table:
+            raise KeyError(f"Save has no section: {name}")
+
+        if self._raw_sections is not None:
+            value = self._raw_sections[name]
+        else:
+            offset, length = self._table[name]
+            self._file.seek(self._header.body_offset + offset)
+            value = decode_section(self._header, name, self._file.read(length))
+
+        value = self._apply_journal(name, value)
+        self._sections[name] = value
+        return value
+
+    def _apply_journal(self, name: str, value: Any) -> Any:
+        """Apply the journal operations that touch a section"""
+        if not self._ops:
+            return value
+
+        path = _path(name)
+        depth = len(path)
+        children = [_path(other) for other in self._table if other.startswith(name + ".")]
+
+        for op in self._ops:
+            action, op_path = op[0], tuple(op[1])
+            if op_path[:depth] == path:
+                if any(op_path[:len(child)] == child for child in children):
+                    continue  # Belongs to a nested section
+                rest = list(op_path[depth:])
+                if rest:
+                    value = apply(value, [[action, rest, *op[2:]]])
+                elif action == "set":
+                    value = copy.deepcopy(op[2])
+                elif action == "ext":
+                    value.extend(copy.deepcopy(op[2]))
+                else:
+                    value = None
+            elif path[:len(op_path)] == op_path:
+                # The op replaced or removed an ancestor of this section
+                value = None
+                if action == "set":
+                    value = op[2]
+                    for key in path[len(op_path):]:
+                        value = value.get(key) if isinstance(value, dict) else None
+                    value = copy.deepcopy(value)
+
+        if children and isinstance(value, dict):
+            for child in children:
+                value.pop(child[depth], None)  # Stored (and journaled) in its own section
+        return value
+
+    def game_state_field(self, field: str, default: Any = None) -> Any:
+        """
+        Read one serialized GameState field, decoding only the section holding it
+
+        Example:
+            save.game_state_field("turn_count")   # Core section
+            save.game_state_field("world_flags")  # Flag table section
+        """
+        if field in SPLIT_TABLES and f"game_state.{field}" in self._table:
+            return self.section(f"game_state.{field}")
+        return self.section("game_state").get(field, default)
+
+    @property
+    def world_flags(self) -> dict:
+        """The world flag table (decodes only that section)"""
+        return self.game_state_field("world_flags", {})
+
+    @property
+    def game_state_data(self) -> dict:
+        """Serialized GameState (decodes every game state section)"""
+        data = dict(self.section("game_state"))
+        for name in self._table:
+            if name.startswith("game_state."):
+                data[name.partition(".")[2]] = self.section(name)
+        return data
+
+    @property
+    def player(self):
+        """Player entity (materialized on first access), or None"""
+        if self._player is _MISSING:
+            data = self.section("player") if "player" in self._table else None
+            if data:
+                from src.entities.player import Player
+                self._player = Player.from_dict(data)
+            else:
+                self._player = None
+        return self._player
+
+    @property
+    def game_state(self) -> 'GameState':
+        """Full GameState with its player (materialized on first access)"""
+        if self._game_state is None:
+            from .game_state import GameState
+            game_state = GameState.from_dict(self.game_state_data)
+            game_state.player = self.player
+            self._game_state = game_state
+        return self._game_state
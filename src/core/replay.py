@@ -0,0 +1,418 @@
+"""
+Session Replay - Deterministic record/replay of the event stream
+
+The game is driven by events: player input is published as events, and
+systems react to them (publishing more events and rolling dice on the way).
+Given the same starting state, the same seed and the same input events,
+a session therefore replays exactly.
+
+SessionRecorder writes a compact append-only journal to logs/ while playing:
+every published event and every draw from the dice RNG, in order. Replayer
+re-drives a session headlessly from the save it started from plus the
+journal, at full speed: it publishes only the root (input) events, and
+checks that the derived events and the dice draws come out the same. The
+first difference is reported as a Divergence - the point where a bug report
+stops reproducing, or where a change altered gameplay.
+
+Journal format (JSON lines, one object per line):
+    {"v": 1, "seed": 1234, "save": "saves/slot_1.sav", "started": "..."}  Header
+    {"e": "player_moved", "d": {...}}         Root event (published outside any listener)
+    {"e": "damage_dealt", "d": {...}, "n": 1}  Derived event, n = dispatch depth
+    {"r": [17, 0.25]}                          Dice RNG draws since the previous line
+
+Only synchronous listeners replay deterministically: coroutine listeners run
+on the event loop, outside the dispatch that triggered them, so whatever
+they publish is recorded as root events.
+
+Example:
+    recorder = SessionRecorder()  # Records the active session's dispatcher
+    recorder.start(game_state, save="saves/slot_1.sav")
+    ...
+    recorder.stop()
+
+    result = replay(recorder.path, setup=wire_systems)
+    if not result.ok:
+        print(result.divergence)
+
+Command line (CI regression replays):
+    python -m src.core.replay logs/*.replay --setup src.game:wire_systems
+"""
+
+import argparse
+import importlib
+import json
+import random
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, List, Optional, TextIO, Tuple
+
+from .event_dispatcher import Event, EventDispatcher, EventType
+from .game_state import GameState
+from .session import GameSession, get_events
+
+JOURNAL_VERSION = 1
+JOURNAL_SUFFIX = ".replay"
+
+Setup = Callable[[EventDispatcher, GameState], None]
+
+
+# Compact, and values JSON can't hold are written as their repr
+_encode = json.JSONEncoder(separators=(",", ":"), default=repr, ensure_ascii=False).encode
+
+
+class _ObservedRandom(random.Random):
+    """random.Random that reports every draw to a callback"""
+
+    def __init__(self, seed: int, observe: Callable[[Any], None]) -> None:
+        self._observe = observe
+        super().__init__(seed)
+
+    def random(self) -> float:
+        value = super().random()
+        self._observe(value)
+        return value
+
+    def getrandbits(self, k: int) -> int:
+        value = super().getrandbits(k)
+        self._observe(value)
+        return value
+
+
+class SessionRecorder:
+    """
+    Journals a session's events and dice draws (see module docstring)
+
+    While recording, the dice RNG of the current context (session) is
+    replaced by one seeded with the session seed, so recorded sessions are
+    reproducible. Start and stop it in the session being recorded.
+
+    Attributes:
+        dispatcher: Dispatcher being recorded
+        log_dir: Folder of the journals
+        path: Journal of the current (or last) recording
+    """
+
+    def __init__(
+        self, dispatcher: Optional[EventDispatcher] = None, log_dir: str = "logs"
+    ) -> None:
+        """
+        Args:
+            dispatcher: Dispatcher to record (default: the active session's)
+            log_dir: Folder of the journals
+        """
+        self.dispatcher = dispatcher if dispatcher is not None else get_events()
+        self.log_dir = Path(log_dir)
+        self.path: Optional[Path] = None
+        self._file: Optional[TextIO] = None
+        self._draws: List[Any] = []
+        self._previous_rng: Optional[random.Random] = None
+
+    @property
+    def recording(self) -> bool:
+        return self._file is not None
+
+    def start(
+        self,
+        game_state: GameState,
+        save: Optional[str] = None,
+        seed: Optional[int] = None,
+        path: Optional[Path] = None,
+        overwrite: bool = False
+    ) -> Path:
+        """
+        Start a new journal
+
+        Args:
+            game_state: State the session starts from
+            save: Save file that holds that state (for the replayer)
+            seed: Dice seed (default: game_state.seed)
+            path: Journal file (default: logs/session-<time>.replay)
+            overwrite: Replace the journal if path already exists
+
+        Returns:
+            Path of the journal
+
+        Raises:
+            FileExistsError: If path exists and overwrite is False
+        """
+        from src.utils import dice
+
+        if self.recording:
+            self.stop()
+        seed = game_state.seed if seed is None else seed
+        if path is None:
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+            path = self.log_dir / f"session-{stamp}{JOURNAL_SUFFIX}"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file = open(self.path, 'w' if overwrite else 'x', encoding='utf-8')
+        self._write({
+            "v": JOURNAL_VERSION,
+            "seed": seed,
+            "save": str(save) if save is not None else None,
+            "started": datetime.now().isoformat(),
+        })
+        self._file.flush()
+        self._draws = []
+        self._previous_rng = dice.set_rng(_ObservedRandom(seed, self._draws.append))
+        self.dispatcher.add_publish_hook(self._on_publish)
+        return self.path
+
+    def stop(self) -> None:
+        """Finish the journal and restore the previous dice RNG"""
+        from src.utils import dice
+
+        if self._file is None:
+            return
+        self.dispatcher.remove_publish_hook(self._on_publish)
+        if self._previous_rng is not None:
+            dice.set_rng(self._previous_rng)
+            self._previous_rng = None
+        self._write_draws()
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> 'SessionRecorder':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _journal(self) -> TextIO:
+        if self._file is None:
+            raise RuntimeError("Session recorder is not started")
+        return self._file
+
+    def _write(self, line: dict) -> None:
+        self._journal().write(_encode(line) + "\n")
+
+    def _write_event(self, event: Event, depth: int) -> None:
+        # Same as _write({"e": ..., "d": ..., "n": depth}) without the dict
+        depth_field = f',"n":{depth}' if depth else ""
+        self._journal().write(
+            f'{{"e":"{event.type.value}","d":{_encode(event.data)}{depth_field}}}\n'
+        )
+
+    def _write_draws(self) -> None:
+        if self._draws:
+            self._write({"r": self._draws[:]})
+            self._draws.clear()
+
+    def _on_publish(self, event: Event, depth: int) -> None:
+        self._write_draws()
+        self._write_event(event, depth)
+        if not depth:
+            self._journal().flush()  # Root events are player input: keep them if the game crashes
+
+
+def read_journal(path: Path) -> Tuple[dict, List[tuple]]:
+    """
+    Parse a journal
+
+    Returns:
+        (header, steps) where steps are ("e", event type value, data, depth)
+        and ("r", drawn value) tuples in recorded order
+
+    Raises:
+        ValueError: If the file isn't a journal of a supported version
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get("v") != JOURNAL_VERSION:
+        raise ValueError(f"{path} is not a version {JOURNAL_VERSION} session journal")
+
+    steps: List[tuple] = []
+    for line in lines[1:]:
+        if "r" in line:
+            steps.extend(("r", value) for value in line["r"])
+        else:
+            steps.append(("e", line["e"], line["d"], line.get("n", 0)))
+    return lines[0], steps
+
+
+def _is_root(step: tuple) -> bool:
+    return step[0] == "e" and not step[3]
+
+
+@dataclass
+class Divergence:
+    """First point where a replay differs from its journal"""
+    step: int  # Index in the journal's steps
+    expected: Optional[tuple]  # None = the replay did more than was recorded
+    actual: Optional[tuple]  # None = the replay stopped short of the journal
+
+    def __str__(self) -> str:
+        return f"step {self.step}: expected {self.expected!r}, got {self.actual!r}"
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of a replay"""
+    journal: Path
+    game_state: GameState  # State at the end of the replay
+    steps: int  # Journal steps matched
+    total_steps: int
+    divergence: Optional[Divergence] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.divergence is None
+
+
+class Replayer:
+    """
+    Re-drives a journaled session and checks it against the journal
+
+    Each replay runs in its own headless GameSession (fresh dispatcher,
+    dice RNG, messages discarded); setup subscribes the game's systems to
+    its dispatcher, and systems that resolve through get_events() find it.
+    """
+
+    def __init__(self, setup: Setup, queued: bool = False) -> None:
+        """
+        Args:
+            setup: Function(dispatcher, game_state) that subscribes the systems
+            queued: Replay through a queued dispatcher, flushed after each
+                root event (match how the game dispatches)
+        """
+        self.setup = setup
+        self.queued = queued
+
+    def replay(self, journal: Path, game_state: Optional[GameState] = None) -> ReplayResult:
+        """
+        Replay a journal
+
+        Args:
+            journal: Journal file
+            game_state: Starting state (default: loaded from the journal's save)
+
+        Returns:
+            ReplayResult (divergence is None when the replay matched)
+
+        Raises:
+            ValueError: If there is no starting state
+        """
+        journal = Path(journal)
+        header, steps = read_journal(journal)
+        if game_state is None:
+            if not header.get("save"):
+                raise ValueError(f"{journal} names no save; pass the starting game_state")
+            from .lazy_save import LazySave
+            with LazySave(Path(header["save"])) as save:
+                game_state = save.game_state
+
+        # Event data is compared as encoded in the journal
+        expected = [
+            (step[0], step[1], _encode(step[2]), step[3]) if step[0] == "e" else step
+            for step in steps
+        ]
+        cursor = [0]
+        divergence: List[Divergence] = []
+
+        def check(actual: tuple) -> None:
+            if divergence:
+                return
+            step = cursor[0]
+            if step >= len(expected) or expected[step] != actual:
+                divergence.append(
+                    Divergence(step, expected[step] if step < len(expected) else None, actual)
+                )
+            else:
+                cursor[0] += 1
+
+        def on_publish(event: Event, depth: int) -> None:
+            check(("e", event.type.value, _encode(event.data), depth))
+
+        dispatcher = EventDispatcher(history_size=0, queued=self.queued)
+        dispatcher.add_publish_hook(on_publish)
+        session = GameSession(
+            game_state,
+            events=dispatcher,
+            rng=_ObservedRandom(header["seed"], lambda value: check(("r", value))),
+            output=lambda message: None
+        )
+        with session.activate():
+            self.setup(dispatcher, game_state)
+            while cursor[0] < len(steps) and not divergence:
+                step = steps[cursor[0]]
+                if not _is_root(step):
+                    # Recorded as a reaction, but nothing produced it
+                    divergence.append(Divergence(cursor[0], expected[cursor[0]], None))
+                    break
+                dispatcher.publish(Event(EventType(step[1]), step[2]))
+                # Queued: the game flushed after this run of input events
+                following = steps[cursor[0]] if cursor[0] < len(steps) else None
+                if not (following and _is_root(following)):
+                    while dispatcher.pending():
+                        dispatcher.flush()
+
+        return ReplayResult(
+            journal=journal,
+            game_state=game_state,
+            steps=cursor[0],
+            total_steps=len(steps),
+            divergence=divergence[0] if divergence else None,
+        )
+
+
+def replay(
+    journal: Path,
+    setup: Setup,
+    game_state: Optional[GameState] = None,
+    queued: bool = False
+) -> ReplayResult:
+    """
+    Replay a journal (see Replayer)
+
+    Example:
+        result = replay(Path("logs/session-20260101-120000-000000.replay"), wire_systems)
+        assert result.ok, result.divergence
+    """
+    return Replayer(setup, queued).replay(journal, game_state)
+
+
+def _load_setup(spec: str) -> Setup:
+    module_name, _, name = spec.partition(":")
+    if not name:
+        raise ValueError(f"--setup must be module:function, got {spec!r}")
+    setup: Setup = getattr(importlib.import_module(module_name), name)
+    return setup
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay session journals headlessly")
+    parser.add_argument("journals", nargs="+", type=Path, help="Journal files")
+    parser.add_argument("--setup", required=True,
+                        help="module:function(dispatcher, game_state) wiring the systems")
+    parser.add_argument("--save", type=Path, help="Starting save (default: the journal's)")
+    parser.add_argument("--queued", action="store_true", help="Replay with a queued dispatcher")
+    args = parser.parse_args(argv)
+
+    replayer = Replayer(_load_setup(args.setup), queued=args.queued)
+    failed = 0
+    for journal in args.journals:
+        game_state = None
+        if args.save is not None:
+            from .lazy_save import LazySave
+            with LazySave(args.save) as save:
+                game_state = save.game_state
+        try:
+            result = replayer.replay(journal, game_state)
+        except (OSError, ValueError) as e:
+            failed += 1
+            print(f"❌ {journal}: {e}")
+            continue
+        if result.ok:
+            print(f"✅ {journal}: {result.total_steps} steps")
+        else:
+            failed += 1
+            print(f"❌ {journal}: diverged at {result.divergence}")
+    print(f"{len(args.journals) - failed}/{len(args.journals)} journals replayed identically")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Save Binary - Compact, versioned binary encoding for save data
+
+A small tagged format owned by this project, so saves don't depend on the
+Python version (as marshal and pickle do) and decoding a file never does
+more than build plain data:
+
+    version    u8            BINARY_VERSION
+    value                    One tagged value
+
+    N / T / F                None / True / False
+    b  i8                    Small int
+    i  i64                   Int
+    I  size + bytes          Big int (little-endian, two's complement)
+    d  f64                   Float
+    s  size + utf-8          String
+    y  size + bytes          Bytes
+    l  size + values         List
+    t  size + values         Tuple
+    m  size + pairs          Dict (key value key value...)
+
+Sizes are unsigned LEB128 varints (one byte below 128). Values are
+little-endian.
+
+Decoding checks every size against the input, accepts only these types
+(dict keys must be hashable: no lists or dicts), limits nesting to
+MAX_DEPTH and rejects trailing bytes, so a corrupt or hostile file raises
+ValueError instead of producing anything else.
+
+Example:
+    raw = dumps({"turn_count": 3, "world_flags": {"met_tom": True}})
+    assert loads(raw) == {"turn_count": 3, "world_flags": {"met_tom": True}}
+"""
+
+import struct
+from typing import Any, Dict, List, Tuple
+
+BINARY_VERSION = 1
+MAX_DEPTH = 64
+
+_I8 = struct.Struct("<b")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_I64_MIN, _I64_MAX = -2 ** 63, 2 ** 63 - 1
+
+_NONE, _TRUE, _FALSE = ord("N"), ord("T"), ord("F")
+_SMALL_INT, _INT, _BIG_INT, _FLOAT = ord("b"), ord("i"), ord("I"), ord("d")
+_STR, _BYTES = ord("s"), ord("y")
+_LIST, _TUPLE, _DICT = ord("l"), ord("t"), ord("m")
+_CONTAINER_TAGS = {list: _LIST, tuple: _TUPLE, dict: _DICT}
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode a value
+
+    Raises:
+        TypeError: If the value contains a type the format doesn't support
+        ValueError: If it's nested deeper than MAX_DEPTH
+    """
+    out = bytearray((BINARY_VERSION,))
+    _write(value, out, 0)
+    return bytes(out)
+
+
+def _write_size(out: bytearray, size: int) -> None:
+    while size >= 0x80:
+        out.append(size & 0x7F | 0x80)
+        size >>= 7
+    out.append(size)
+
+
+def _write(value: Any, out: bytearray, depth: int) -> None:
+    kind = type(value)
+    if kind is str:
+        raw = value.encode("utf-8")
+        out.append(_STR)
+        _write_size(out, len(raw))
+        out += raw
+    elif kind is int:
+        if -128 <= value < 128:
+            out.append(_SMALL_INT)
+            out += _I8.pack(value)
+        elif _I64_MIN <= value <= _I64_MAX:
+            out.append(_INT)
+            out += _I64.pack(value)
+        else:
+            raw = value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+            out.append(_BIG_INT)
+            _write_size(out, len(raw))
+            out += raw
+    elif value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif kind is float:
+        out.append(_FLOAT)
+        out += _F64.pack(value)
+    elif kind in _CONTAINER_TAGS:
+        if depth >= MAX_DEPTH:
+            raise ValueError(f"Save data nested deeper than {MAX_DEPTH} levels")
+        out.append(_CONTAINER_TAGS[kind])
+        _write_size(out, len(value))
+        depth += 1
+        if kind is dict:
+            for key, item in value.items():
+                _write(key, out, depth)
+                _write(item, out, depth)
+        else:
+            for item in value:
+                _write(item, out, depth)
+    elif kind is bytes:
+        out.append(_BYTES)
+        _write_size(out, len(value))
+        out += value
+    else:
+        raise TypeError(f"Can't encode {kind.__name__} in save data")
+
+
+def loads(raw: bytes) -> Any:
+    """
+    Decode a value written by dumps
+
+    Raises:
+        ValueError: If raw is corrupt, truncated or of another format version
+    """
+    if not raw or raw[0] != BINARY_VERSION:
+        raise ValueError(f"Unsupported binary save version: {raw[0] if raw else None}")
+    try:
+        value, pos = _read(raw, 1, 0)
+    except (struct.error, IndexError, UnicodeDecodeError, TypeError) as e:
+        raise ValueError(f"Corrupt binary save data: {e}") from e
+    if pos != len(raw):
+        raise ValueError("Corrupt binary save data: trailing bytes")
+    return value
+
+
+def _read_size(raw: bytes, pos: int) -> Tuple[int, int]:
+    size = shift = 0
+    while True:
+        byte = raw[pos]
+        pos += 1
+        size |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+        if shift > 63:
+            raise ValueError("Corrupt binary save data: size too large")
+    if size > len(raw) - pos:  # Every byte or item takes at least one byte
+        raise ValueError("Corrupt binary save data: size past the end")
+    return size, pos
+
+
+def _read(raw: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    tag = raw[pos]
+    pos += 1
+    # Most common first: this is the hot loop of every load
+    if tag == _STR:
+        size = raw[pos]
+        if size < 0x80:
+            pos += 1
+            end = pos + size
+            if end > len(raw):
+                raise ValueError("Corrupt binary save data: size past the end")
+        else:
+            size, pos = _read_size(raw, pos)
+            end = pos + size
+        return raw[pos:end].decode("utf-8"), end
+    if tag == _SMALL_INT:
+        return _I8.unpack_from(raw, pos)[0], pos + 1
+    if tag == _DICT:
+        if depth >= MAX_DEPTH:
+            raise ValueError(f"Save data nested deeper than {MAX_DEPTH} levels")
+        size, pos = _read_size(raw, pos)
+        result: Dict[Any, Any] = {}
+        for _ in range(size):
+            key, pos = _read(raw, pos, depth + 1)
+            result[key], pos = _read(raw, pos, depth + 1)  # TypeError if unhashable
+        return result, pos
+    if tag == _LIST or tag == _TUPLE:
+        if depth >= MAX_DEPTH:
+            raise ValueError(f"Save data nested deeper than {MAX_DEPTH} levels")
+        size, pos = _read_size(raw, pos)
+        items: List[Any] = [None] * size
+        for i in range(size):
+            items[i], pos = _read(raw, pos, depth + 1)
+        return (items if tag == _LIST else tuple(items)), pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _NONE:
+        return None, pos
+    if tag == _INT:
+        return _I64.unpack_from(raw, pos)[0], pos + _I64.size
+    if tag == _FLOAT:
+        return _F64.unpack_from(raw, pos)[0], pos + _F64.size
+    if tag == _BIG_INT or tag == _BYTES:
+        size, pos = _read_size(raw, pos)
+        end = pos + size
+        data = raw[pos:end]
+        return (data if tag == _BYTES else int.from_bytes(data, "little", signed=True)), end
+    raise ValueError(f"Corrupt binary save data: unknown tag {tag}")
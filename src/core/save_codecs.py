@@ -0,0 +1,394 @@
+"""
+Save Codecs - Pluggable encodings and compression for save files
+
+A codec pairs an encoding (how the save dict becomes bytes) with an
+optional compression. Files written by a codec start with a small
+self-describing header, so any file can be decoded without knowing which
+codec wrote it:
+
+    magic      8 bytes   b"NERVESAV"
+    version    u16       Header format version
+    enc_len    u8        Length of the encoding name
+    comp_len   u8        Length of the compression name
+    encoding   ascii     e.g. "binary"
+    compression ascii    e.g. "zlib" (or "none")
+    info_len   u32       Length of the info block
+    info       json      {"metadata": ..., "journal": ..., "sections": ...}
+    body                 Compressed, encoded sections
+
+The info block repeats the save's small top-level sections uncompressed,
+so listing saves only has to read the first few hundred bytes of each
+file (see read_save_info).
+
+The body is split into sections - the game state's scalars, each of its
+large tables (world_flags, choice_history, visited_locations) and the
+player - each encoded and compressed on its own. info["sections"] maps
+section names to [offset, length] in the body, so a single section can
+be decoded without touching the others (see src/core/lazy_save.py).
+
+Files without the magic are legacy pretty-printed JSON saves and are
+decoded as such.
+
+Decoded sections are checked against the types the loader expects
+(SECTION_TYPES), so a damaged or hand-edited file fails with ValueError
+instead of half-loading.
+
+Built-in codecs:
+    json          Legacy pretty-printed JSON, no header (<slot>.json)
+    json+zlib     Compact JSON, zlib-compressed (default; fastest to load)
+    binary        Compact tagged binary (see src/core/save_binary.py)
+    binary+zlib   Binary, zlib-compressed (smaller than json+zlib, slower)
+    binary+lzma   Binary, lzma-compressed (smallest, slowest)
+
+The binary encoding is this project's own versioned format rather than
+marshal or pickle: it doesn't change with the Python version, and
+decoding only ever builds plain data, so shared save files are safe to
+load.
+
+Example:
+    register_compression("bz2", bz2.compress, bz2.decompress)
+    register_codec(SaveCodec("binary+bz2", "binary", "bz2"))
+    save_manager = SaveManager("saves", codec="binary+bz2")
+"""
+
+import io
+import json
+import lzma
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Dict, NamedTuple, Optional, Tuple
+
+from . import save_binary
+
+SAVE_MAGIC = b"NERVESAV"
+FORMAT_VERSION = 1
+SAVE_SUFFIX = ".sav"
+LEGACY_SUFFIX = ".json"
+
+_HEADER = struct.Struct("<8sHBB")  # magic, version, encoding name length, compression name length
+_INFO_LEN = struct.Struct("<I")
+_INFO_KEYS = ("metadata", "journal")  # Top-level sections copied into the header
+
+# Game state tables stored as sections of their own ("game_state.world_flags"...)
+SPLIT_TABLES = ("world_flags", "choice_history", "visited_locations")
+
+# Section name -> accepted types (sections not listed aren't checked)
+SECTION_TYPES: Dict[str, Tuple[type, ...]] = {
+    "game_state": (dict,),
+    "game_state.world_flags": (dict,),
+    "game_state.choice_history": (list,),
+    "game_state.visited_locations": (list,),
+    "player": (dict, type(None)),
+}
+
+
+def check_section(name: str, value: Any) -> Any:
+    """
+    Check a decoded section against SECTION_TYPES
+
+    Returns:
+        The value, unchanged
+
+    Raises:
+        ValueError: If the section has the wrong type
+    """
+    expected = SECTION_TYPES.get(name)
+    if expected is not None and not isinstance(value, expected):
+        raise ValueError(f"Corrupt save data: {name} is a {type(value).__name__}")
+    return value
+
+
+def check_save(save_data: Any) -> dict:
+    """
+    Check decoded save data section by section (see check_section)
+
+    Raises:
+        ValueError: If it isn't a dict, lacks metadata or has a section of the wrong type
+    """
+    if not isinstance(save_data, dict) or not isinstance(save_data.get("metadata"), dict):
+        raise ValueError("Corrupt save data: not a save")
+    for name, value in split_sections(save_data).items():
+        check_section(name, value)
+    return save_data
+
+
+def split_sections(save_data: dict) -> Dict[str, Any]:
+    """
+    Split save data into independently stored sections
+
+    Returns:
+        Section name -> value; nested sections are named "parent.key"
+
+    Example:
+        >>> split_sections({"metadata": {}, "game_state": {"turn_count": 3, "world_flags": {}}})
+        {'game_state': {'turn_count': 3}, 'game_state.world_flags': {}}
+    """
+    sections: Dict[str, Any] = {}
+    for key, value in save_data.items():
+        if key in _INFO_KEYS:
+            continue
+        if key == "game_state" and isinstance(value, dict):
+            core = dict(value)
+            sections[key] = core
+            for table in SPLIT_TABLES:
+                if table in core:
+                    sections[f"{key}.{table}"] = core.pop(table)
+        else:
+            sections[key] = value
+    return sections
+
+
+def join_sections(info: dict, sections: Dict[str, Any]) -> dict:
+    """Reassemble save data from its header info and decoded sections (see split_sections)"""
+    save_data = {key: info[key] for key in _INFO_KEYS if key in info}
+    for name in sorted(sections, key=lambda name: name.count(".")):
+        *parents, key = name.split(".")
+        target = save_data
+        for parent in parents:
+            target = target[parent]
+        target[key] = sections[name]
+    return save_data
+
+Encoder = Callable[[dict], bytes]
+Decoder = Callable[[bytes], dict]
+
+# name -> (encode, decode)
+ENCODINGS: Dict[str, Tuple[Encoder, Decoder]] = {
+    "json": (
+        lambda data: json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        json.loads,
+    ),
+    "binary": (save_binary.dumps, save_binary.loads),
+}
+
+# name -> (compress, decompress)
+COMPRESSIONS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "none": (lambda raw: raw, lambda raw: raw),
+    "zlib": (lambda raw: zlib.compress(raw, 1), zlib.decompress),
+    "lzma": (lambda raw: lzma.compress(raw, preset=1), lzma.decompress),
+}
+
+
+@dataclass(frozen=True)
+class SaveCodec:
+    """
+    An encoding + compression combination
+
+    Attributes:
+        name: Codec name used in SaveManager(codec=...)
+        encoding: Key in ENCODINGS
+        compression: Key in COMPRESSIONS
+        legacy_json: Write headerless pretty-printed JSON (the original format)
+    """
+    name: str
+    encoding: str = "binary"
+    compression: str = "none"
+    legacy_json: bool = False
+
+    @property
+    def suffix(self) -> str:
+        """File extension of saves written by this codec"""
+        return LEGACY_SUFFIX if self.legacy_json else SAVE_SUFFIX
+
+    def encode(self, save_data: dict) -> bytes:
+        """
+        Serialize save data, header included
+
+        Raises:
+            ValueError: If the codec's encoding or compression isn't registered
+        """
+        if self.legacy_json:
+            return json.dumps(save_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        encode, _ = _lookup(ENCODINGS, self.encoding, "encoding")
+        compress, _ = _lookup(COMPRESSIONS, self.compression, "compression")
+        encoding = self.encoding.encode("ascii")
+        compression = self.compression.encode("ascii")
+
+        blobs, table, offset = [], {}, 0
+        for name, value in split_sections(save_data).items():
+            blob = compress(encode(value))
+            table[name] = [offset, len(blob)]
+            offset += len(blob)
+            blobs.append(blob)
+
+        info = {key: save_data[key] for key in _INFO_KEYS if key in save_data}
+        info["sections"] = table
+        info_raw = json.dumps(info, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        header = _HEADER.pack(SAVE_MAGIC, FORMAT_VERSION, len(encoding), len(compression))
+        return b"".join((
+            header, encoding, compression, _INFO_LEN.pack(len(info_raw)), info_raw, *blobs
+        ))
+
+
+CODECS: Dict[str, SaveCodec] = {
+    codec.name: codec for codec in (
+        SaveCodec("json", "json", legacy_json=True),
+        SaveCodec("json+zlib", "json", "zlib"),
+        SaveCodec("binary", "binary"),
+        SaveCodec("binary+zlib", "binary", "zlib"),
+        SaveCodec("binary+lzma", "binary", "lzma"),
+    )
+}
+
+DEFAULT_CODEC = "json+zlib"
+
+
+def _lookup(table: dict, name: str, what: str):
+    try:
+        return table[name]
+    except KeyError:
+        raise ValueError(f"Unknown save {what}: {name}") from None
+
+
+def register_encoding(name: str, encode: Encoder, decode: Decoder):
+    """Add an encoding that codecs can refer to"""
+    ENCODINGS[name] = (encode, decode)
+
+
+def register_compression(
+    name: str,
+    compress: Callable[[bytes], bytes],
+    decompress: Callable[[bytes], bytes]
+):
+    """Add a compression that codecs can refer to"""
+    COMPRESSIONS[name] = (compress, decompress)
+
+
+def register_codec(codec: SaveCodec):
+    """Make a codec available by name"""
+    CODECS[codec.name] = codec
+
+
+def get_codec(name: str) -> SaveCodec:
+    """
+    Look up a codec by name
+
+    Raises:
+        ValueError: If no codec has that name
+    """
+    return _lookup(CODECS, name, "codec")
+
+
+class SaveHeader(NamedTuple):
+    """Parsed save header"""
+    version: int
+    encoding: str
+    compression: str
+    info: dict  # {"metadata": ..., "journal": ..., "sections": ...}
+    body_offset: int
+
+
+def _read_exact(f: BinaryIO, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated save header")
+    return data
+
+
+def read_header_from(f: BinaryIO) -> SaveHeader:
+    """
+    Parse a save header from the start of a file, reading nothing past it
+
+    Raises:
+        ValueError: If the file isn't a headered save, its version is
+            unsupported or its info block is malformed
+    """
+    magic, version, encoding_len, compression_len = _HEADER.unpack(_read_exact(f, _HEADER.size))
+    if magic != SAVE_MAGIC:
+        raise ValueError("Not a save file (bad magic)")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported save format version: {version}")
+
+    encoding = _read_exact(f, encoding_len).decode("ascii")
+    compression = _read_exact(f, compression_len).decode("ascii")
+    (info_len,) = _INFO_LEN.unpack(_read_exact(f, _INFO_LEN.size))
+    info = json.loads(_read_exact(f, info_len))
+    _check_info(info)
+
+    offset = _HEADER.size + encoding_len + compression_len + _INFO_LEN.size + info_len
+    return SaveHeader(version, encoding, compression, info, offset)
+
+
+def _check_info(info: Any) -> None:
+    """Check the header's info block: metadata plus a table of [offset, length] sections"""
+    if (
+        not isinstance(info, dict)
+        or not isinstance(info.get("metadata"), dict)
+        or not isinstance(info.get("sections"), dict)
+        or not all(
+            isinstance(span, list) and len(span) == 2
+            and all(type(n) is int and n >= 0 for n in span)
+            for span in info["sections"].values()
+        )
+    ):
+        raise ValueError("Corrupt save header: malformed info block")
+
+
+def read_header(raw: bytes) -> SaveHeader:
+    """
+    Parse the header of an in-memory save
+
+    Raises:
+        ValueError: If raw isn't a headered save or its version is unsupported
+    """
+    return read_header_from(io.BytesIO(raw))
+
+
+def read_save_info(path) -> Optional[dict]:
+    """
+    Read a save's metadata (and journal info) without decoding its body
+
+    Args:
+        path: Save file
+
+    Returns:
+        {"metadata": ..., "journal": ..., "sections": ...} from the header,
+        or None for legacy JSON saves, which must be decoded in full
+
+    Raises:
+        ValueError: If the header is corrupt
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(SAVE_MAGIC)) != SAVE_MAGIC:
+            return None
+        f.seek(0)
+        return read_header_from(f).info
+
+
+def decode_save(raw: bytes) -> dict:
+    """
+    Decode a save file written by any codec, or a legacy JSON save
+
+    Raises:
+        ValueError: If the file is corrupt, isn't shaped like a save (see
+            check_save) or uses an unregistered encoding/compression
+    """
+    if not raw.startswith(SAVE_MAGIC):
+        return check_save(json.loads(raw))
+
+    header = read_header(raw)
+    start = header.body_offset
+    return check_save(join_sections(header.info, {
+        name: decode_section(header, name, raw[start + offset:start + offset + length])
+        for name, (offset, length) in header.info["sections"].items()
+    }))
+
+
+def decode_section(header: SaveHeader, name: str, blob: bytes) -> Any:
+    """
+    Decompress, decode and check one body section (see check_section)
+
+    Raises:
+        ValueError: If the section is corrupt, has the wrong type or uses
+            an unregistered encoding/compression
+    """
+    _, decode = _lookup(ENCODINGS, header.encoding, "encoding")
+    _, decompress = _lookup(COMPRESSIONS, header.compression, "compression")
+    try:
+        value = decode(decompress(blob))
+    except (EOFError, TypeError, ValueError, zlib.error, lzma.LZMAError) as e:
+        raise ValueError(f"Corrupt save data: {e}") from e
+    return check_section(name, value)
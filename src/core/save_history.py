@@ -0,0 +1,368 @@
+"""
+Save History - Content-addressed rewind history in one SQLite file
+
+Every recorded point (an autosave, a quick-save...) is split into chunks
+that are stored once, keyed by their SHA-1, in saves/history.db:
+
+- Each save section (see save_codecs.split_sections) is treated as a
+  sequence of items: dict entries, list elements, or the single value.
+- Items are grouped into chunks with content-defined boundaries: a chunk
+  ends after an item whose key hashes to a boundary value. One changed
+  flag therefore changes one chunk, and an appended choice only the last
+  one, while every other chunk is shared with the previous point.
+- Chunk hashes are grouped the same way into index nodes, up to a single
+  root per section, so unchanged sections (and unchanged parts of large
+  ones) cost nothing to store beyond a few hashes.
+- The chunk layout of the last recorded point is kept in memory. Runs of
+  items that still compare equal (a C-level list comparison) reuse their
+  chunk hash, so only the changed regions are re-chunked and hashed.
+
+Points beyond max_points are dropped oldest-first, and garbage collection
+(mark from the kept points, sweep the rest) removes chunks no kept point
+references.
+
+Example:
+    history = HistoryStore(Path("saves/history.db"), max_points=300)
+    point_id = history.record(save_data, label="Entered the tavern")
+    save_data = history.restore(point_id)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from . import save_binary
+from .save_codecs import join_sections, split_sections
+
+HISTORY_FILE = "history.db"
+
+LEAF_BOUNDARY_MASK = 0x3F  # ~64 items per chunk
+NODE_BOUNDARY_MASK = 0x1F  # ~32 hashes per index node
+MAX_CHUNK_ITEMS = 512
+RESYNC_WINDOW = 16  # Previous chunks searched to realign after a changed region
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    hash BLOB PRIMARY KEY,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS points (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    label TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    root BLOB NOT NULL
+);
+"""
+
+
+def _encode(obj: Any) -> bytes:
+    # Deterministic: equal chunks always encode (and hash) to equal bytes
+    return save_binary.dumps(obj)
+
+
+class _Chunk(NamedTuple):
+    """A leaf chunk of the last recorded point"""
+    items: list
+    hash: bytes
+    closed: bool  # Ended at a boundary (not just at the end of the section)
+
+
+def _chunk(items: List[Any], is_boundary: Callable[[Any], bool]) -> List[list]:
+    """Group items into content-defined chunks"""
+    chunks, current = [], []
+    for item in items:
+        current.append(item)
+        if len(current) >= MAX_CHUNK_ITEMS or is_boundary(item):
+            chunks.append(current)
+            current = []
+    if current or not chunks:
+        chunks.append(current)
+    return chunks
+
+
+def _item_boundary(item: Any) -> bool:
+    """Boundary test for dict entries (by key) and list elements"""
+    key = item[0] if type(item) is tuple else item
+    raw = key.encode("utf-8") if type(key) is str else _encode(key)  # Flag keys: skip encoding
+    return zlib.crc32(raw) & LEAF_BOUNDARY_MASK == 0
+
+
+def _node_boundary(chunk_hash: bytes) -> bool:
+    return chunk_hash[0] & NODE_BOUNDARY_MASK == 0
+
+
+class HistoryStore:
+    """
+    Deduplicating store of historical save points
+
+    Safe to share between the game thread and the save worker thread.
+    Assumes one process writes the file at a time.
+    """
+
+    def __init__(self, path: Path, max_points: int = 300, gc_every: Optional[int] = None):
+        """
+        Open (or create) a history file
+
+        Args:
+            path: SQLite file (e.g., saves/history.db)
+            max_points: Points kept; older ones are dropped as new ones arrive
+            gc_every: Dropped points between automatic garbage collections
+                (defaults to a tenth of max_points)
+        """
+        self.path = path
+        self.max_points = max(1, max_points)
+        self.gc_every = gc_every or max(1, max_points // 10)
+        self._lock = threading.Lock()
+        self._dropped_since_gc = 0
+        self._last: Dict[str, List[_Chunk]] = {}  # Section -> chunks of the last point
+
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA auto_vacuum = INCREMENTAL")  # Only applies to new files
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._known = {row[0] for row in self._db.execute("SELECT hash FROM chunks")}
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM points").fetchone()[0]
+
+    def _put(self, obj: Any, new_chunks: Dict[bytes, bytes]) -> bytes:
+        """Hash a chunk, queueing it for insertion if it's not stored yet"""
+        return self._put_raw(_encode(obj), new_chunks)
+
+    def _put_raw(self, raw: bytes, new_chunks: Dict[bytes, bytes]) -> bytes:
+        chunk_hash = hashlib.sha1(raw).digest()
+        if chunk_hash not in self._known and chunk_hash not in new_chunks:
+            new_chunks[chunk_hash] = zlib.compress(raw, 1)
+        return chunk_hash
+
+    def _put_leaves(
+        self,
+        name: str,
+        items: List[Any],
+        new_chunks: Dict[bytes, bytes]
+    ) -> List[bytes]:
+        """Chunk a section's items, reusing chunks of the last point that still match"""
+        previous = self._last.get(name, [])
+        chunks: List[_Chunk] = []
+        pos, j, size = 0, 0, len(items)
+        while True:
+            # Reuse previous chunks while the items at this position are unchanged
+            while j < len(previous) and previous[j].closed:
+                old = previous[j]
+                end = pos + len(old.items)
+                if end > size or items[pos:end] != old.items:
+                    break
+                chunks.append(old)
+                pos, j = end, j + 1
+            if pos >= size:
+                break
+
+            # Re-chunk up to the next boundary
+            end, closed = pos, False
+            while end < size and not closed:
+                end += 1
+                closed = end - pos >= MAX_CHUNK_ITEMS or _item_boundary(items[end - 1])
+            raw = _encode(items[pos:end])
+            # Keep a private copy: items may be live containers (the player's inventory)
+            chunk = save_binary.loads(raw)
+            chunks.append(_Chunk(chunk, self._put_raw(raw, new_chunks), closed))
+            pos = end
+
+            # Realign with the previous chunk ending on the same item
+            last = chunk[-1]
+            for k in range(j, min(j + RESYNC_WINDOW, len(previous))):
+                if previous[k].items and previous[k].items[-1] == last:
+                    j = k + 1
+                    break
+
+        if not chunks:
+            chunks.append(_Chunk([], self._put([], new_chunks), False))
+        self._last[name] = chunks
+        return [chunk.hash for chunk in chunks]
+
+    def _put_tree(
+        self,
+        name: str,
+        items: List[Any],
+        new_chunks: Dict[bytes, bytes]
+    ) -> Tuple[bytes, int]:
+        """Store a section as chunks plus index nodes, return (root hash, depth)"""
+        level = self._put_leaves(name, items, new_chunks)
+        depth = 0
+        while len(level) > 1:
+            level = [self._put(node, new_chunks) for node in _chunk(level, _node_boundary)]
+            depth += 1
+        return level[0], depth
+
+    def _get_many(self, hashes: List[bytes]) -> List[Any]:
+        """Load chunks in order (duplicates allowed)"""
+        found: Dict[bytes, Any] = {}
+        wanted = list(dict.fromkeys(hashes))
+        for start in range(0, len(wanted), 500):
+            batch = wanted[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._db.execute(
+                f"SELECT hash, data FROM chunks WHERE hash IN ({placeholders})", batch
+            )
+            for chunk_hash, data in rows:
+                found[chunk_hash] = save_binary.loads(zlib.decompress(data))
+        try:
+            return [found[chunk_hash] for chunk_hash in hashes]
+        except KeyError:
+            raise ValueError("History is missing a chunk (corrupt history file)") from None
+
+    def record(self, save_data: dict, label: str = "") -> int:
+        """
+        Record a save point
+
+        Args:
+            save_data: Save file structure (metadata, game_state, player)
+            label: Optional description shown in the rewind list
+
+        Returns:
+            ID of the new point
+        """
+        with self._lock:
+            new_chunks: Dict[bytes, bytes] = {}
+            sections = {}
+            for name, value in split_sections(save_data).items():
+                if type(value) is dict:
+                    kind, items = "dict", list(value.items())
+                elif type(value) is list:
+                    kind, items = "list", value
+                else:
+                    kind, items = "value", [value]
+                sections[name] = (kind, *self._put_tree(name, items, new_chunks))
+
+            metadata = save_data.get("metadata", {})
+            root = self._put({"metadata": metadata, "sections": sections}, new_chunks)
+
+            try:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO chunks (hash, data) VALUES (?, ?)",
+                        new_chunks.items()
+                    )
+                    cursor = self._db.execute(
+                        "INSERT INTO points (created, label, metadata, root) VALUES (?, ?, ?, ?)",
+                        (time.time(), label, json.dumps(metadata, ensure_ascii=False), root)
+                    )
+                    point_id = cursor.lastrowid
+                    dropped = self._db.execute(
+                        "DELETE FROM points WHERE id NOT IN "
+                        "(SELECT id FROM points ORDER BY id DESC LIMIT ?)",
+                        (self.max_points,)
+                    ).rowcount
+            except Exception:
+                self._last.clear()  # Its chunks may not have been stored
+                raise
+            self._known.update(new_chunks)
+
+            self._dropped_since_gc += dropped
+            if self._dropped_since_gc >= self.gc_every:
+                self._collect()
+            return point_id
+
+    def points(self) -> List[dict]:
+        """
+        List kept points, newest first
+
+        Returns:
+            Dicts with id, created (epoch seconds), label and metadata
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, created, label, metadata FROM points ORDER BY id DESC"
+            ).fetchall()
+        return [
+            {"id": point_id, "created": created, "label": label, "metadata": json.loads(metadata)}
+            for point_id, created, label, metadata in rows
+        ]
+
+    def restore(self, point_id: int) -> dict:
+        """
+        Rebuild the save data of a point
+
+        Raises:
+            KeyError: If the point doesn't exist (or was dropped)
+            ValueError: If the history file is corrupt
+        """
+        with self._lock:
+            row = self._db.execute("SELECT root FROM points WHERE id = ?", (point_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"No history point: {point_id}")
+
+            [manifest] = self._get_many([row[0]])
+            sections = {}
+            for name, (kind, root, depth) in manifest["sections"].items():
+                hashes = [root]
+                for _ in range(depth):
+                    hashes = [h for node in self._get_many(hashes) for h in node]
+                items = [item for chunk in self._get_many(hashes) for item in chunk]
+                if kind == "dict":
+                    sections[name] = dict(items)
+                else:
+                    sections[name] = items if kind == "list" else items[0]
+
+        return join_sections({"metadata": manifest["metadata"]}, sections)
+
+    def gc(self) -> int:
+        """
+        Delete chunks that no kept point references
+
+        Returns:
+            Number of chunks removed
+        """
+        with self._lock:
+            return self._collect()
+
+    def _collect(self) -> int:
+        """Mark chunks reachable from kept points, sweep the rest (lock held)"""
+        live = set()
+        for (root,) in self._db.execute("SELECT root FROM points").fetchall():
+            if root in live:
+                continue
+            live.add(root)
+            [manifest] = self._get_many([root])
+            for _, section_root, depth in manifest["sections"].values():
+                frontier = [section_root]
+                for _ in range(depth):
+                    frontier = [h for h in frontier if h not in live]
+                    live.update(frontier)
+                    frontier = [h for node in self._get_many(frontier) for h in node]
+                live.update(frontier)
+
+        dead = self._known - live
+        with self._db:
+            self._db.executemany("DELETE FROM chunks WHERE hash = ?", ((h,) for h in dead))
+        self._db.execute("PRAGMA incremental_vacuum")
+        self._known &= live
+        self._dropped_since_gc = 0
+        return len(dead)
+
+    def stats(self) -> dict:
+        """
+        Storage statistics
+
+        Returns:
+            Dict with points, chunks, and stored_bytes (compressed chunk data)
+        """
+        with self._lock:
+            points = self._db.execute("SELECT COUNT(*) FROM points").fetchone()[0]
+            chunks, stored = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM chunks"
+            ).fetchone()
+        return {"points": points, "chunks": chunks, "stored_bytes": stored}
@@ -0,0 +1,118 @@
+"""
+Save Index - Sidecar index of save slot metadata
+
+saves/slots.index maps every slot to its file, the (mtime, size) stamps of
+the file and its journal, and the metadata shown in the load menu. It is
+rewritten atomically whenever a save is written, so listing saves reads
+one small file and stats the save files instead of decoding each of them.
+
+Entries whose stamps no longer match their files (a save copied in or
+edited by hand), and the whole index if it's missing or corrupt, are
+rebuilt from the save headers (see save_codecs.read_save_info).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .save_journal import journal_path
+
+INDEX_VERSION = 1
+INDEX_FILE = "slots.index"
+
+Stamp = Tuple[int, int]  # (st_mtime_ns, st_size)
+
+
+def file_stamp(path: Path) -> Optional[Stamp]:
+    """Current (mtime, size) of a file, or None if it doesn't exist"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class SaveIndex:
+    """
+    Slot -> metadata index persisted next to the saves
+
+    Entries are dicts:
+        {"file": "autosave.sav", "stamp": [mtime_ns, size],
+         "journal_stamp": [mtime_ns, size] or None, "metadata": {...}}
+    """
+
+    def __init__(self, saves_dir: Path):
+        """
+        Initialize index (nothing is read until load())
+
+        Args:
+            saves_dir: Folder holding the save files
+        """
+        self.path = saves_dir / INDEX_FILE
+        self.entries: Dict[str, dict] = {}
+        self.loaded = False
+
+    def load(self) -> bool:
+        """
+        Read the index from disk
+
+        Returns:
+            False if the index was missing or corrupt (entries are then empty)
+        """
+        self.loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION or not isinstance(data.get("slots"), dict):
+                raise ValueError("Unsupported save index")
+            self.entries = data["slots"]
+            return True
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+            return False
+
+    def save(self):
+        """Write the index atomically (temp file + rename)"""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {"version": INDEX_VERSION, "slots": self.entries},
+                f, ensure_ascii=False, separators=(",", ":")
+            )
+        os.replace(tmp_path, self.path)
+
+    def put(self, slot_name: str, save_path: Path, metadata: dict) -> dict:
+        """
+        Record a slot's current files and metadata
+
+        Args:
+            slot_name: Save slot
+            save_path: Save file the slot is stored in (its journal is found from it)
+            metadata: Save metadata (save_time, location, playtime...)
+
+        Returns:
+            The new entry
+        """
+        journal_stamp = file_stamp(journal_path(save_path))
+        entry = {
+            "file": save_path.name,
+            "stamp": list(file_stamp(save_path)),
+            "journal_stamp": list(journal_stamp) if journal_stamp else None,
+            "metadata": metadata,
+        }
+        self.entries[slot_name] = entry
+        return entry
+
+    def is_current(self, slot_name: str, save_path: Path) -> bool:
+        """Check if a slot's entry still matches its files on disk"""
+        entry = self.entries.get(slot_name)
+        if entry is None or entry.get("file") != save_path.name:
+            return False
+        stamp = file_stamp(save_path)
+        journal_stamp = file_stamp(journal_path(save_path))
+        return (
+            stamp is not None
+            and entry.get("stamp") == list(stamp)
+            and entry.get("journal_stamp") == (list(journal_stamp) if journal_stamp else None)
+        )
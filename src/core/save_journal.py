@@ -0,0 +1,152 @@
+"""
+Save Journal - Delta encoding for incremental saves
+
+A journaled save slot is a full snapshot (<slot>.json) plus an append-only
+journal (<slot>.journal) of the changes made since that snapshot, one JSON
+line per save. Loading replays the journal over the snapshot.
+
+Deltas are lists of operations on the serialized save payload:
+    ["set", path, value]   # Replace (or add) the value at path
+    ["del", path]          # Remove the key at path
+    ["ext", path, items]   # Append items to the list at path
+
+Lists that only grew (choice_history) become a single "ext" of the new
+tail, so a delta's size tracks what changed rather than the total save.
+
+Every snapshot gets a new generation ID, and journal lines carry the
+generation they apply to. Lines from an older generation (left behind if
+the game stopped between writing a snapshot and truncating the journal)
+are ignored on replay.
+"""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+KeyPath = List[Any]  # Keys from the payload root down to a value
+Op = list
+
+
+def diff(
+    old: Any,
+    new: Any,
+    path: Optional[KeyPath] = None,
+    ops: Optional[List[Op]] = None
+) -> List[Op]:
+    """
+    Compute the operations that turn old into new
+
+    Args:
+        old: Previously saved payload (JSON-compatible)
+        new: Current payload
+        path: Path of old/new inside the payload (used when recursing)
+        ops: List to append operations to (used when recursing)
+
+    Returns:
+        Operations (empty if nothing changed)
+
+    Example:
+        >>> diff({"flags": {"a": 1}, "log": ["x"]}, {"flags": {"a": 2}, "log": ["x", "y"]})
+        [['set', ['flags', 'a'], 2], ['ext', ['log'], ['y']]]
+    """
+    path = path or []
+    ops = [] if ops is None else ops
+
+    if type(old) is dict and type(new) is dict:
+        added = 0
+        for key, value in new.items():
+            if key not in old:
+                ops.append(["set", path + [key], value])
+                added += 1
+                continue
+            old_value = old[key]
+            # Equality runs in C, so unchanged entries cost almost nothing
+            if type(old_value) is not type(value) or old_value != value:
+                diff(old_value, value, path + [key], ops)
+        if len(old) > len(new) - added:  # Some old keys are gone
+            ops.extend(["del", path + [key]] for key in old if key not in new)
+    elif type(old) is list and type(new) is list:
+        size = len(old)
+        if len(new) >= size and new[:size] == old:
+            if len(new) > size:
+                ops.append(["ext", path, new[size:]])
+        else:
+            ops.append(["set", path, new])
+    elif type(old) is not type(new) or old != new:
+        ops.append(["set", path, new])
+
+    return ops
+
+
+def apply(payload: Any, ops: List[Op]) -> Any:
+    """
+    Apply operations to a payload in place
+
+    Values are deep-copied into the payload, so it never aliases the
+    objects the operations were built from.
+
+    Args:
+        payload: Payload to update
+        ops: Operations from diff()
+
+    Returns:
+        The updated payload (a new object if an op replaced the root)
+    """
+    for op in ops:
+        action, path = op[0], op[1]
+        if not path:
+            if action != "set":
+                raise ValueError(f"Invalid journal operation on the root: {action}")
+            payload = copy.deepcopy(op[2])
+            continue
+
+        parent = payload
+        for key in path[:-1]:
+            parent = parent[key]
+        key = path[-1]
+
+        if action == "set":
+            parent[key] = copy.deepcopy(op[2])
+        elif action == "del":
+            del parent[key]
+        elif action == "ext":
+            parent[key].extend(copy.deepcopy(op[2]))
+        else:
+            raise ValueError(f"Unknown journal operation: {action}")
+    return payload
+
+
+def journal_path(save_path: Path) -> Path:
+    """Journal file of a save (e.g., saves/autosave.journal)"""
+    return save_path.with_suffix(".journal")
+
+
+def append_entry(path: Path, entry: dict):
+    """Append one delta line to a journal"""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def read_entries(path: Path, generation: int) -> Iterator[dict]:
+    """
+    Read the journal lines that apply to a snapshot generation
+
+    A torn last line (the game stopped mid-write) ends the replay instead
+    of failing the load.
+
+    Args:
+        path: Journal file
+        generation: Generation of the snapshot being replayed onto
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if entry.get("generation") == generation:
+                    yield entry
+    except FileNotFoundError:
+        return
@@ -1,20 +1,171 @@
 """
-Save/Load System - JSON-based persistence
+Save/Load System - Slot-based persistence with pluggable codecs
 """
 
-import json
+import contextvars
+import copy
+import functools
+import os
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 from datetime import datetime
 
+from .lazy_save import LazySave
+from .save_codecs import (
+    DEFAULT_CODEC, LEGACY_SUFFIX, SAVE_SUFFIX, decode_save, get_codec, read_save_info
+)
+from .save_history import HISTORY_FILE, HistoryStore
+from .save_index import SaveIndex
+from .save_journal import append_entry, apply, diff, journal_path, read_entries
+from .session import notify
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+
+def _snapshot(value: Any) -> Any:
+    """
+    Copy the dicts and lists of serialized save data
+
+    Scalars are immutable and shared; containers are copied with their C
+    copy() and only recursed into when they hold other containers, which
+    keeps this well below the cost of serializing the same data.
+    """
+    kind = type(value)
+    if kind is dict:
+        copied = value.copy()
+        for key, item in copied.items():
+            if type(item) is dict or type(item) is list:
+                copied[key] = _snapshot(item)
+        return copied
+    if kind is list:
+        if any(type(item) is dict or type(item) is list for item in value):
+            return [_snapshot(item) for item in value]
+        return value.copy()
+    return value
+
+
+@dataclass
+class _JournalState:
+    """What a journaled slot looks like on disk, as of the last save"""
+    generation: int  # Snapshot generation the journal applies to
+    base: dict  # Payload (game_state + player) after the last write
+    deltas: int = 0  # Journal lines since the snapshot
+
 
 class SaveManager:
-    """Handles game save and load operations"""
+    """
+    Handles game save and load operations
+
+    Saves are written with the configured codec (see src/core/save_codecs.py)
+    to saves/<slot>.sav, or saves/<slot>.json for the legacy JSON codec.
+    Any save file loads regardless of the codec that wrote it.
+
+    Example:
+        # Uncompressed binary saves for the fastest load
+        save_manager = SaveManager("saves", codec="binary")
 
-    def __init__(self, saves_dir: str = "saves"):
+        # Journaled autosaves: append changes, rewrite the full save every 20
+        save_manager = SaveManager("saves", journaled=True, compact_every=20)
+        save_manager.autosave(game_state)
+
+        # Autosave on a worker thread; flush before quitting
+        save_manager = SaveManager("saves", background=True)
+        save_manager.autosave(game_state)
+        save_manager.close()
+
+        # Keep the last 300 autosaves as rewind points
+        save_manager = SaveManager("saves", history_size=300)
+        save_manager.autosave(game_state)
+        point = save_manager.list_history()[5]
+        game_state = save_manager.rewind(point["id"])
+    """
+
+    def __init__(
+        self,
+        saves_dir: str = "saves",
+        journaled: bool = False,
+        compact_every: int = 20,
+        background: bool = False,
+        codec: str = DEFAULT_CODEC,
+        history_size: int = 0
+    ):
+        """
+        Initialize save manager
+
+        Args:
+            saves_dir: Folder holding save files
+            journaled: Make autosave() append deltas to a journal instead of
+                rewriting the whole save (see save_journaled)
+            compact_every: Deltas before a journaled save is compacted back
+                into a full snapshot
+            background: Make autosave() return immediately and write on a
+                worker thread (see save_in_background)
+            codec: Save codec name (e.g., "binary+zlib", "binary+lzma", "json")
+            history_size: Rewind points to keep in saves/history.db; every
+                autosave records one (0 = no history)
+
+        Raises:
+            ValueError: If the codec isn't registered
+        """
+        self.codec = get_codec(codec)
         self.saves_dir = Path(saves_dir)
         self.saves_dir.mkdir(exist_ok=True)
-        self.autosave_path = self.saves_dir / "autosave.json"
+        self.autosave_path = self._save_path("autosave")
+        self.journaled = journaled
+        self.compact_every = compact_every
+        self.background = background
+        self._journals: Dict[str, _JournalState] = {}
+        self._index = SaveIndex(self.saves_dir)  # Slot metadata for list_saves
+        self._write_lock = threading.Lock()  # Serializes file writes across threads
+        self.history: Optional[HistoryStore] = None
+        if history_size > 0:
+            self.history = HistoryStore(self._history_path(), max_points=history_size)
+
+        # Background saves (see save_in_background)
+        self._pending: Dict[str, Tuple[Callable[[str, dict], None], dict]] = {}
+        self._pending_cond = threading.Condition()
+        self._writing = False
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def _history_path(self) -> Path:
+        """Rewind history database"""
+        return self.saves_dir / HISTORY_FILE
+
+    def _save_path(self, slot_name: str) -> Path:
+        """File a slot is written to with the configured codec"""
+        return self.saves_dir / f"{slot_name}{self.codec.suffix}"
+
+    def _find_save(self, slot_name: str) -> Optional[Path]:
+        """Existing file of a slot, whichever codec wrote it"""
+        for suffix in dict.fromkeys((self.codec.suffix, SAVE_SUFFIX, LEGACY_SUFFIX)):
+            path = self.saves_dir / f"{slot_name}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    def _remove_other_formats(self, save_path: Path):
+        """Delete a slot's file in the other format after writing this one"""
+        for suffix in (SAVE_SUFFIX, LEGACY_SUFFIX):
+            if suffix != save_path.suffix:
+                save_path.with_suffix(suffix).unlink(missing_ok=True)
+
+    def _build_save_data(self, game_state: 'GameState') -> dict:
+        """Serialize game state into the save file structure"""
+        return {
+            "metadata": {
+                "save_time": datetime.now().isoformat(),
+                "version": game_state.save_version,
+                "location": game_state.current_location_id,
+                "playtime": game_state.playtime_seconds,
+            },
+            "game_state": game_state.to_dict(),
+            "player": game_state.player.to_dict() if game_state.player else None,
+        }
 
     def save_game(self, game_state: 'GameState', slot_name: str = "slot_1") -> bool:
         """
@@ -27,95 +178,445 @@ class SaveManager:
         Returns:
             True if save successful
         """
+        self._cancel_pending(slot_name)
         try:
-            save_path = self.saves_dir / f"{slot_name}.json"
-
-            save_data = {
-                "metadata": {
-                    "save_time": datetime.now().isoformat(),
-                    "version": game_state.save_version,
-                    "location": game_state.current_location_id,
-                    "playtime": game_state.playtime_seconds,
-                },
-                "game_state": game_state.to_dict(),
-                "player": game_state.player.to_dict() if game_state.player else None,
-            }
-
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
-
-            print(f"✅ Game saved to {slot_name}")
+            self._write_full(slot_name, self._build_save_data(game_state))
+            notify(f"✅ Game saved to {slot_name}")
             return True
 
         except Exception as e:
-            print(f"❌ Save failed: {e}")
+            notify(f"❌ Save failed: {e}")
             return False
 
-    def load_game(self, slot_name: str = "slot_1") -> Optional['GameState']:
+    def _write_save_file(self, save_path: Path, save_data: dict):
+        """Encode and write a save file atomically (temp file + rename)"""
+        raw = self.codec.encode(save_data)
+        tmp_path = save_path.with_name(save_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, save_path)
+        self._remove_other_formats(save_path)
+
+    def _write_full(self, slot_name: str, save_data: dict):
+        """Write a complete save, superseding any journal for the slot"""
+        save_path = self._save_path(slot_name)
+        with self._write_lock:
+            self._write_save_file(save_path, save_data)
+            self._journals.pop(slot_name, None)
+            journal_path(save_path).unlink(missing_ok=True)
+            self._update_index(slot_name, save_path, save_data["metadata"])
+
+    def _update_index(self, slot_name: str, save_path: Path, metadata: dict):
+        """Record a just-written save in the slot index (caller holds the write lock)"""
+        try:
+            if not self._index.loaded:
+                self._index.load()
+            self._index.put(slot_name, save_path, metadata)
+            self._index.save()
+        except OSError as e:
+            # The save itself is fine; list_saves rebuilds the stale entry
+            notify(f"⚠️  Failed to update save index: {e}")
+
+    def load_game(self, slot_name: str = "slot_1", lazy: bool = False):
         """
         Load game state from file
 
         Args:
             slot_name: Save slot to load
+            lazy: Return a LazySave that decodes sections on first access
+                instead of a GameState (for previews and tools; close it
+                when done)
 
         Returns:
-            Loaded GameState or None if failed
+            Loaded GameState (or LazySave) or None if failed
+
+        Example:
+            with save_manager.load_game("slot_1", lazy=True) as save:
+                print(save.playtime_seconds)
         """
         try:
-            save_path = self.saves_dir / f"{slot_name}.json"
+            if lazy:
+                save = self._open_lazy(slot_name)
+                if save is None:
+                    notify(f"❌ Save file not found: {slot_name}")
+                return save
 
-            if not save_path.exists():
-                print(f"❌ Save file not found: {slot_name}")
+            save_data = self._read_save(slot_name)
+            if save_data is None:
+                notify(f"❌ Save file not found: {slot_name}")
                 return None
 
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            game_state = self._restore_state(save_data)
+            notify(f"✅ Game loaded from {slot_name}")
+            return game_state
+
+        except Exception as e:
+            notify(f"❌ Load failed: {e}")
+            return None
+
+    def _read_save(self, slot_name: str) -> Optional[dict]:
+        """Decoded save data of a slot (journal replayed), or None if it has no save"""
+        save_path = self._find_save(slot_name)
+        if save_path is None:
+            return None
+        with open(save_path, 'rb') as f:
+            save_data = decode_save(f.read())
+        self._replay_journal(save_path, save_data)
+        return save_data
 
-            # Validate version
-            if save_data["metadata"]["version"] != "1.0.0":
-                print("⚠️  Save file version mismatch - may have issues")
+    def _open_lazy(self, slot_name: str) -> Optional[LazySave]:
+        """Open a slot's save for on-demand decoding, or None if it has no save"""
+        save_path = self._find_save(slot_name)
+        return LazySave(save_path) if save_path is not None else None
 
-            # Reconstruct game state
-            from .game_state import GameState
-            game_state = GameState.from_dict(save_data["game_state"])
+    def _restore_state(self, save_data: dict) -> 'GameState':
+        """Rebuild a GameState (and its player) from save data"""
+        # Validate version
+        if save_data["metadata"]["version"] != "1.0.0":
+            notify("⚠️  Save file version mismatch - may have issues")
 
-            # Reconstruct player
-            if save_data["player"]:
-                from src.entities.player import Player
-                game_state.player = Player.from_dict(save_data["player"])
+        # Reconstruct game state
+        from .game_state import GameState
+        game_state = GameState.from_dict(save_data["game_state"])
 
-            print(f"✅ Game loaded from {slot_name}")
+        # Reconstruct player
+        if save_data["player"]:
+            from src.entities.player import Player
+            game_state.player = Player.from_dict(save_data["player"])
+
+        return game_state
+
+    def save_journaled(self, game_state: 'GameState', slot_name: str = "autosave") -> bool:
+        """
+        Save only what changed since the last save of this slot
+
+        The first save of a session, and every compact_every-th save after
+        it, writes a full snapshot (atomically, temp file + rename) and
+        starts a new journal. Other saves append one line holding the
+        metadata and the delta against the previous save, so their cost
+        depends on what changed rather than on the size of the save.
+
+        Args:
+            game_state: Current game state
+            slot_name: Save slot name
+
+        Returns:
+            True if save successful
+        """
+        self._cancel_pending(slot_name)
+        try:
+            self._write_journaled(slot_name, self._build_save_data(game_state))
+            notify(f"✅ Game saved to {slot_name}")
+            return True
+
+        except Exception as e:
+            notify(f"❌ Save failed: {e}")
+            return False
+
+    def _write_journaled(self, slot_name: str, save_data: dict):
+        """Append a delta to a slot's journal, or compact it into a snapshot"""
+        save_path = self._save_path(slot_name)
+        payload = {"game_state": save_data["game_state"], "player": save_data["player"]}
+
+        with self._write_lock:
+            state = self._journals.get(slot_name)
+            if state is None or state.deltas >= self.compact_every:
+                self._write_snapshot(save_path, slot_name, save_data, payload)
+                return
+
+            ops = diff(state.base, payload)
+            append_entry(journal_path(save_path), {
+                "generation": state.generation,
+                "metadata": save_data["metadata"],
+                "ops": ops,
+            })
+            state.base = apply(state.base, ops)
+            state.deltas += 1
+            self._update_index(slot_name, save_path, save_data["metadata"])
+
+    def _write_snapshot(self, save_path: Path, slot_name: str, save_data: dict, payload: dict):
+        """Write a full journaled snapshot and start an empty journal for it"""
+        generation = time.time_ns()
+        save_data["journal"] = {"generation": generation}
+        self._write_save_file(save_path, save_data)
+
+        # Lines left in the old journal carry the old generation and are
+        # ignored on load even if truncating fails
+        open(journal_path(save_path), 'w', encoding='utf-8').close()
+
+        self._journals[slot_name] = _JournalState(generation, copy.deepcopy(payload))
+        self._update_index(slot_name, save_path, save_data["metadata"])
+
+    def _replay_journal(self, save_path: Path, save_data: dict):
+        """Apply a journaled save's deltas to its snapshot data, in place"""
+        journal = save_data.get("journal")
+        if not journal:
+            return
+
+        payload = {"game_state": save_data["game_state"], "player": save_data["player"]}
+        for entry in read_entries(journal_path(save_path), journal["generation"]):
+            payload = apply(payload, entry["ops"])
+            save_data["metadata"] = entry["metadata"]
+        save_data.update(payload)
+
+    def autosave(self, game_state: 'GameState') -> bool:
+        """
+        Quick autosave to dedicated slot (journaled and/or in the background if enabled)
+
+        With a history, each autosave is also recorded as a rewind point
+        (by the worker thread for background saves).
+        """
+        if self.background:
+            return self.save_in_background(game_state, "autosave")
+        if self.journaled:
+            saved = self.save_journaled(game_state, "autosave")
+        else:
+            saved = self.save_game(game_state, "autosave")
+        if saved and self.history is not None:
+            self.record_history(game_state)
+        return saved
+
+    def record_history(self, game_state: 'GameState', label: str = "") -> Optional[int]:
+        """
+        Record the game state as a rewind point
+
+        Args:
+            game_state: Current game state
+            label: Optional description shown in the rewind list
+
+        Returns:
+            ID of the point, or None if history is disabled or recording failed
+        """
+        if self.history is None:
+            return None
+        try:
+            return self.history.record(self._build_save_data(game_state), label)
+        except Exception as e:
+            notify(f"⚠️  Failed to record history: {e}")
+            return None
+
+    def _write_and_record(
+        self,
+        write: Callable[[str, dict], None],
+        slot_name: str,
+        save_data: dict
+    ):
+        """Write a background save, then record it as a rewind point"""
+        write(slot_name, save_data)
+        try:
+            self.history.record(save_data)
+        except Exception as e:
+            notify(f"⚠️  Failed to record history: {e}")
+
+    def list_history(self) -> list[dict]:
+        """
+        List rewind points, newest first
+
+        Returns:
+            Dicts with id, created (epoch seconds), label and metadata
+            (empty if history is disabled)
+        """
+        return self.history.points() if self.history is not None else []
+
+    def rewind(self, point_id: int) -> Optional['GameState']:
+        """
+        Restore the game state of a rewind point
+
+        Args:
+            point_id: ID from list_history() or record_history()
+
+        Returns:
+            Restored GameState or None if failed
+        """
+        if self.history is None:
+            notify("❌ Rewind failed: history is disabled")
+            return None
+        try:
+            game_state = self._restore_state(self.history.restore(point_id))
+            notify(f"✅ Rewound to point {point_id}")
             return game_state
 
         except Exception as e:
-            print(f"❌ Load failed: {e}")
+            notify(f"❌ Rewind failed: {e}")
             return None
 
-    def autosave(self, game_state: 'GameState') -> bool:
-        """Quick autosave to dedicated slot"""
-        return self.save_game(game_state, "autosave")
+    def save_in_background(self, game_state: 'GameState', slot_name: str = "autosave") -> bool:
+        """
+        Snapshot the game state now and write it on a worker thread
+
+        Only the snapshot (copying the serialized containers) runs on the
+        caller's thread; encoding and the atomic write happen on the
+        worker. If several saves of a slot are requested before the worker
+        gets to it, only the latest snapshot is written.
+
+        Args:
+            game_state: Current game state
+            slot_name: Save slot name
+
+        Returns:
+            True if the save was queued (write errors are printed by the worker)
+        """
+        try:
+            save_data = _snapshot(self._build_save_data(game_state))
+        except Exception as e:
+            notify(f"❌ Save failed: {e}")
+            return False
+
+        write = self._write_journaled if self.journaled else self._write_full
+        if self.history is not None and slot_name == "autosave":
+            write = functools.partial(self._write_and_record, write)
+        with self._pending_cond:
+            if self._closed:
+                notify("❌ Save failed: save manager is closed")
+                return False
+            self._pending[slot_name] = (write, save_data)  # Replaces an unwritten older snapshot
+            if self._worker is None:
+                # The worker reports to the session that started it (see session.notify)
+                self._worker = threading.Thread(
+                    target=contextvars.copy_context().run, args=(self._run_worker,),
+                    name="save-worker", daemon=True
+                )
+                self._worker.start()
+            self._pending_cond.notify_all()
+        return True
+
+    def _run_worker(self):
+        """Worker thread: write queued snapshots until closed"""
+        while True:
+            with self._pending_cond:
+                while not self._pending and not self._closed:
+                    self._pending_cond.wait()
+                if not self._pending:
+                    return  # Closed and drained
+                batch, self._pending = self._pending, {}
+                self._writing = True
+
+            for slot_name, (write, save_data) in batch.items():
+                try:
+                    write(slot_name, save_data)
+                    notify(f"✅ Game saved to {slot_name}")
+                except Exception as e:
+                    notify(f"❌ Save failed: {e}")
+
+            with self._pending_cond:
+                self._writing = False
+                self._pending_cond.notify_all()
+
+    def _cancel_pending(self, slot_name: str):
+        """
+        Drop a queued background save that a direct save supersedes
+
+        Also waits for a batch the worker is already writing, so an older
+        snapshot can't land on top of the direct save.
+        """
+        with self._pending_cond:
+            self._pending.pop(slot_name, None)
+            self._pending_cond.wait_for(lambda: not self._writing)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued background save is on disk
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if nothing is left to write
+        """
+        with self._pending_cond:
+            return self._pending_cond.wait_for(
+                lambda: not self._pending and not self._writing, timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush background saves, stop the worker thread and close the history
+
+        Returns:
+            True if everything was written
+        """
+        with self._pending_cond:
+            self._closed = True
+            self._pending_cond.notify_all()
+        worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+            if worker.is_alive():
+                return False
+            self._worker = None
+        if self.history is not None:
+            self.history.close()
+            self.history = None
+        return True
 
     def list_saves(self) -> list[dict]:
         """
         List all available save files with metadata
 
+        Served from the slot index (saves/slots.index): save files are only
+        stat'ed. Slots whose files changed outside this manager, or every
+        slot if the index is missing or corrupt, are re-read from their
+        save headers and the index is rewritten.
+
         Returns:
             List of save info dicts
         """
+        slots: Dict[str, Path] = {}
+        for path in self.saves_dir.iterdir():
+            legacy = path.suffix == LEGACY_SUFFIX and path.stem not in slots
+            if path.suffix == SAVE_SUFFIX or legacy:
+                slots[path.stem] = path
+
         saves = []
+        with self._write_lock:
+            if not self._index.loaded:
+                self._index.load()
+            entries = self._index.entries
+
+            changed = False
+            for slot_name in [slot for slot in entries if slot not in slots]:
+                del entries[slot_name]
+                changed = True
 
-        for save_file in self.saves_dir.glob("*.json"):
-            try:
-                with open(save_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            for slot_name, save_file in slots.items():
+                if not self._index.is_current(slot_name, save_file):
+                    try:
+                        self._index.put(slot_name, save_file, self._read_metadata(save_file))
+                    except Exception:
+                        entries.pop(slot_name, None)
+                        continue
+                    changed = True
 
+                metadata = entries[slot_name]["metadata"]
                 saves.append({
-                    "slot_name": save_file.stem,
-                    "save_time": data["metadata"]["save_time"],
-                    "location": data["metadata"]["location"],
-                    "playtime": data["metadata"]["playtime"],
+                    "slot_name": slot_name,
+                    "save_time": metadata["save_time"],
+                    "location": metadata["location"],
+                    "playtime": metadata["playtime"],
                 })
-            except Exception:
-                continue
+
+            if changed:
+                try:
+                    self._index.save()
+                except OSError as e:
+                    notify(f"⚠️  Failed to update save index: {e}")
 
         return sorted(saves, key=lambda x: x["save_time"], reverse=True)
+
+    def _read_metadata(self, save_file: Path) -> dict:
+        """
+        Current metadata of a save file, from its header when it has one
+
+        Raises:
+            ValueError: If the file is corrupt
+        """
+        info = read_save_info(save_file)
+        if info is None:  # Legacy JSON save: decode it in full
+            with open(save_file, 'rb') as f:
+                info = decode_save(f.read())
+
+        metadata = info["metadata"]
+        if info.get("journal"):
+            for entry in read_entries(journal_path(save_file), info["journal"]["generation"]):
+                metadata = entry["metadata"]
+        return metadata
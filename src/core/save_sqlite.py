@@ -0,0 +1,283 @@
+"""
+SQLite Saves - Multi-profile save backend in one database file
+
+SQLiteSaveManager keeps the SaveManager interface (save_game, load_game,
+list_saves, autosave, background saves, rewind history) but stores every
+profile's slots as rows of a single SQLite database instead of one file
+per slot:
+
+- WAL mode: readers never block the writer and see the last committed save
+- Each save is one upsert in an IMMEDIATE transaction, so it's atomic and
+  concurrent writers (threads or processes) queue on the busy timeout
+- Metadata lives in indexed columns, so listing and querying saves by
+  profile, time or location never decodes a payload
+- Payloads are encoded with the configured codec (see save_codecs.py),
+  header included, so lazy loads and any codec work as with files
+
+Example:
+    saves = SQLiteSaveManager("saves/saves.db", profile="alice")
+    saves.save_game(game_state, "slot_1")
+    saves.query_saves(location="golden_drake_tavern", limit=10)  # All profiles
+"""
+
+import io
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Optional
+from urllib.parse import quote
+
+from .lazy_save import LazySave
+from .save_codecs import DEFAULT_CODEC, decode_save
+from .save_manager import SaveManager
+from .session import notify
+
+DEFAULT_PROFILE = "default"
+BUSY_TIMEOUT = 10.0  # Seconds a writer waits for another writer's transaction
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    profile TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    save_time TEXT NOT NULL,
+    version TEXT NOT NULL,
+    location TEXT NOT NULL,
+    playtime INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (profile, slot)
+);
+CREATE INDEX IF NOT EXISTS saves_by_profile_time ON saves (profile, save_time);
+CREATE INDEX IF NOT EXISTS saves_by_time ON saves (save_time);
+CREATE INDEX IF NOT EXISTS saves_by_location ON saves (location, save_time);
+"""
+
+_METADATA_COLUMNS = "profile, slot, save_time, version, location, playtime"
+
+
+class SQLiteSaveManager(SaveManager):
+    """
+    SaveManager storing slots of many player profiles in a SQLite database
+
+    Every thread gets its own connection (the background save worker
+    included). A slot is a single row replaced as a whole, so journaled
+    saves don't apply: save_journaled writes the full save.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "saves/saves.db",
+        profile: str = DEFAULT_PROFILE,
+        background: bool = False,
+        codec: str = DEFAULT_CODEC,
+        history_size: int = 0
+    ):
+        """
+        Open (or create) a save database
+
+        Args:
+            db_path: SQLite file; rewind history goes next to it, one file
+                per profile (history-<profile>.db)
+            profile: Player profile whose slots this manager reads and writes
+            background: Make autosave() write on a worker thread
+            codec: Payload codec name (e.g., "binary+zlib", "json+zlib")
+            history_size: Rewind points to keep (0 = no history)
+
+        Raises:
+            ValueError: If the codec isn't registered
+        """
+        self.db_path = Path(db_path)
+        self.profile = profile
+        super().__init__(
+            str(self.db_path.parent), background=background, codec=codec,
+            history_size=history_size
+        )
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._connection().executescript(_SCHEMA)
+
+    def _history_path(self) -> Path:
+        """Per-profile rewind history, so profiles don't evict each other's points"""
+        return self.saves_dir / f"history-{quote(self.profile, safe='')}.db"
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (opened on first use)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path), timeout=BUSY_TIMEOUT, isolation_level=None,
+                check_same_thread=False  # Only so close() can close it
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _write_full(self, slot_name: str, save_data: dict):
+        """Replace a slot's row in one transaction"""
+        metadata = save_data["metadata"]
+        raw = self.codec.encode(save_data)
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                f"INSERT OR REPLACE INTO saves ({_METADATA_COLUMNS}, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.profile, slot_name, metadata["save_time"], metadata["version"],
+                 metadata["location"], metadata["playtime"], raw)
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _write_journaled(self, slot_name: str, save_data: dict):
+        """A slot is one row: there's no journal to append to"""
+        self._write_full(slot_name, save_data)
+
+    def _read_payload(self, slot_name: str) -> Optional[bytes]:
+        row = self._connection().execute(
+            "SELECT data FROM saves WHERE profile = ? AND slot = ?", (self.profile, slot_name)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def _read_save(self, slot_name: str) -> Optional[dict]:
+        """Decoded save data of a slot, or None if it has no save"""
+        raw = self._read_payload(slot_name)
+        return decode_save(raw) if raw is not None else None
+
+    def _open_lazy(self, slot_name: str) -> Optional[LazySave]:
+        """Open a slot's payload for on-demand decoding, or None if it has no save"""
+        raw = self._read_payload(slot_name)
+        if raw is None:
+            return None
+        return LazySave(Path(self.db_path.name, self.profile, slot_name), io.BytesIO(raw))
+
+    def list_saves(self) -> List[dict]:
+        """
+        List this profile's saves with metadata, newest first
+
+        Returns:
+            List of save info dicts
+        """
+        return [
+            {key: save[key] for key in ("slot_name", "save_time", "location", "playtime")}
+            for save in self.query_saves(profile=self.profile)
+        ]
+
+    def query_saves(
+        self,
+        profile: Optional[str] = None,
+        location: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Query save metadata across profiles, newest first (payloads aren't read)
+
+        Args:
+            profile: Only this profile's saves (None = every profile)
+            location: Only saves made at this location
+            since: Only saves made at or after this ISO timestamp
+            until: Only saves made before this ISO timestamp
+            limit: Maximum number of saves returned
+
+        Returns:
+            Dicts with profile, slot_name, save_time, version, location and playtime
+
+        Example:
+            # The 20 most recent saves in the tavern, any profile
+            saves.query_saves(location="golden_drake_tavern", limit=20)
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        for column, op, value in (
+            ("profile", "=", profile),
+            ("location", "=", location),
+            ("save_time", ">=", since),
+            ("save_time", "<", until),
+        ):
+            if value is not None:
+                conditions.append(f"{column} {op} ?")
+                params.append(value)
+
+        sql = f"SELECT {_METADATA_COLUMNS} FROM saves"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY save_time DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [
+            {
+                "profile": profile, "slot_name": slot, "save_time": save_time,
+                "version": version, "location": location, "playtime": playtime,
+            }
+            for profile, slot, save_time, version, location, playtime
+            in self._connection().execute(sql, params)
+        ]
+
+    def list_profiles(self) -> List[str]:
+        """Profiles that have at least one save"""
+        return [
+            row[0] for row in
+            self._connection().execute("SELECT DISTINCT profile FROM saves ORDER BY profile")
+        ]
+
+    def delete_save(self, slot_name: str) -> bool:
+        """
+        Delete one of this profile's slots
+
+        Returns:
+            True if the slot existed
+        """
+        self._cancel_pending(slot_name)
+        cursor = self._connection().execute(
+            "DELETE FROM saves WHERE profile = ? AND slot = ?", (self.profile, slot_name)
+        )
+        return cursor.rowcount > 0
+
+    def import_files(self, saves_dir: str) -> int:
+        """
+        Copy the slots of a file-based saves folder into this profile
+
+        Args:
+            saves_dir: Folder written by a file-based SaveManager
+
+        Returns:
+            Number of slots imported (unreadable files are skipped)
+        """
+        files = SaveManager(saves_dir)
+        imported = 0
+        for slot in files.list_saves():
+            try:
+                save_data = files._read_save(slot["slot_name"])
+                if save_data is None:
+                    notify(f"⚠️  Skipped {slot['slot_name']}: save file not found")
+                    continue
+                save_data.pop("journal", None)
+                self._write_full(slot["slot_name"], save_data)
+                imported += 1
+            except Exception as e:
+                notify(f"⚠️  Skipped {slot['slot_name']}: {e}")
+        return imported
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush background saves, then close the history and database connections
+
+        Returns:
+            True if everything was written
+        """
+        if not super().close(timeout):
+            return False
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+        return True
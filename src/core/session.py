@@ -0,0 +1,137 @@
+"""
+Game Session - Per-session event dispatcher, dice and player messages
+
+A GameSession bundles what one game in progress owns: its EventDispatcher,
+its dice RNG and where its player-facing messages go. The active session
+is carried in a context variable, and the core systems resolve through it
+(get_events, notify, src.utils.dice), so one process can host many
+isolated sessions - one per thread, or one per asyncio task - while they
+share the read-only content cache of a single DataLoader.
+
+Outside any session everything falls back to the process-wide defaults:
+the game_events dispatcher, one shared dice RNG, and print.
+
+Example:
+    session = GameSession(game_state, output=connection.send_line)
+
+    with session.activate():
+        wire_systems(session.events, game_state)
+        player.level_up()  # Message goes to connection.send_line
+
+    # One asyncio task per connected player
+    asyncio.create_task(play(connection), context=session.context())
+"""
+
+import contextvars
+import itertools
+import random
+import secrets
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from .event_dispatcher import EventDispatcher, game_events
+from .game_state import GameState
+
+_current: contextvars.ContextVar[Optional['GameSession']] = contextvars.ContextVar(
+    "game_session", default=None
+)
+_ids = itertools.count(1)
+
+
+class GameSession:
+    """
+    One game in progress
+
+    Attributes:
+        id: Session number, unique in the process
+        game_state: The session's game state (may be None before loading)
+        events: The session's event dispatcher
+        rng: The session's dice RNG
+        output: Function receiving player-facing messages
+    """
+
+    def __init__(
+        self,
+        game_state: Optional[GameState] = None,
+        events: Optional[EventDispatcher] = None,
+        rng: Optional[random.Random] = None,
+        output: Callable[[str], Any] = print
+    ):
+        """
+        Args:
+            game_state: The session's game state
+            events: Dispatcher (default: a new one)
+            rng: Dice RNG (default: seeded with game_state.seed; an unset
+                seed (0) is replaced by a random one, written back so the
+                session can still be recorded and replayed)
+            output: Where messages go (e.g., a connection's send function)
+        """
+        self.id = next(_ids)
+        self.game_state = game_state
+        self.events = events if events is not None else EventDispatcher()
+        if rng is None:
+            seed = game_state.seed if game_state is not None else 0
+            if not seed:
+                seed = secrets.randbelow(2 ** 32 - 1) + 1  # Never 0
+                if game_state is not None:
+                    game_state.seed = seed
+            rng = random.Random(seed)
+        self.rng = rng
+        self.output = output
+
+    def __repr__(self) -> str:
+        return f"GameSession(id={self.id})"
+
+    @contextmanager
+    def activate(self) -> Iterator['GameSession']:
+        """Make this the current session inside a with block"""
+        from src.utils import dice
+
+        token = _current.set(self)
+        previous_rng = dice.set_rng(self.rng)
+        try:
+            yield self
+        finally:
+            dice.set_rng(previous_rng)
+            _current.reset(token)
+
+    def context(self) -> contextvars.Context:
+        """
+        A copy of the current context with this session active
+
+        For asyncio.create_task(..., context=...), loop.call_soon or
+        Context.run, e.g. to run each session's task on a shared loop.
+        """
+        context = contextvars.copy_context()
+        context.run(self._enter)
+        return context
+
+    def _enter(self):
+        from src.utils import dice
+
+        _current.set(self)
+        dice.set_rng(self.rng)
+
+    def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call func with this session active (e.g., as a worker thread's target)"""
+        return self.context().run(func, *args, **kwargs)
+
+
+def current_session() -> Optional[GameSession]:
+    """The active session (None outside any session)"""
+    return _current.get()
+
+
+def get_events() -> EventDispatcher:
+    """The active session's dispatcher (game_events outside any session)"""
+    session = _current.get()
+    return session.events if session is not None else game_events
+
+
+def notify(message: str):
+    """Show a message to the active session's player (printed outside any session)"""
+    session = _current.get()
+    if session is not None:
+        session.output(message)
+    else:
+        print(message)
@@ -3,5 +3,31 @@ Data loading and caching system
 """
 
 from .loader import DataLoader
+from .bundle import ContentBundle, build_bundle
+from .cache import CachePolicy, ContentCache
+from .index import ContentIndex, IndexEntry
+from .watcher import ContentWatcher
+from .models import Location, NPC, Enemy, Item, DialogueTree
+from .views import Instance, instantiate, thaw
+from .validation import ContentValidator, validate_content
 
-__all__ = ["DataLoader"]
+__all__ = [
+    "DataLoader",
+    "ContentBundle",
+    "build_bundle",
+    "CachePolicy",
+    "ContentCache",
+    "ContentIndex",
+    "IndexEntry",
+    "ContentWatcher",
+    "Location",
+    "NPC",
+    "Enemy",
+    "Item",
+    "DialogueTree",
+    "Instance",
+    "instantiate",
+    "thaw",
+    "ContentValidator",
+    "validate_content",
+]
@@ -0,0 +1,211 @@
+"""
+Content Bundles - Precompiled, memory-mapped genre content
+
+A bundle packs every JSON file under data/genres/<genre>/ into one file:
+
+    [header][record 0][record 1]...[record N][offset table]
+
+The header stores the offset table position, and the offset table maps each
+record key (path relative to the genre folder, without .json - e.g.
+"locations/golden_drake_tavern") to the (offset, length) of its compact JSON
+payload. Readers memory-map the file and decode one record at a time.
+
+Build a bundle:
+    python -m src.data.bundle cyberpunk --data-dir data
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+BUNDLE_MAGIC = b"NERVEBDL"
+BUNDLE_VERSION = 1
+BUNDLE_SUFFIX = ".bundle"
+
+# magic, format version, record count, offset table position, offset table length
+_HEADER = struct.Struct("<8sHxxIQQ")
+
+
+def bundle_path(data_dir: Path, genre: str) -> Path:
+    """
+    Get the bundle file location for a genre
+
+    Args:
+        data_dir: Root data directory (e.g., Path("data"))
+        genre: Genre folder (e.g., "cyberpunk")
+
+    Returns:
+        Path next to the genre folder (e.g., data/genres/cyberpunk.bundle)
+    """
+    return data_dir / "genres" / f"{genre}{BUNDLE_SUFFIX}"
+
+
+def build_bundle(data_dir: Path, genre: str, output: Optional[Path] = None) -> Path:
+    """
+    Compile all JSON content of a genre into a single bundle file
+
+    Every file is parsed (so broken JSON fails the build, not the game) and
+    re-serialized without whitespace. The bundle is written to a temporary
+    file and renamed into place, so readers never see a half-written bundle.
+
+    Args:
+        data_dir: Root data directory
+        genre: Genre folder to compile
+        output: Bundle path (defaults to bundle_path(data_dir, genre))
+
+    Returns:
+        Path of the written bundle
+
+    Raises:
+        FileNotFoundError: If the genre folder doesn't exist
+        json.JSONDecodeError: If any content file is invalid
+    """
+    genre_dir = data_dir / "genres" / genre
+    if not genre_dir.is_dir():
+        raise FileNotFoundError(f"Genre folder not found: {genre_dir}")
+
+    output = output or bundle_path(data_dir, genre)
+    tmp_path = output.with_name(output.name + ".tmp")
+
+    offsets: Dict[str, List[int]] = {}
+    with open(tmp_path, 'wb') as f:
+        f.write(b"\0" * _HEADER.size)
+
+        for file_path in sorted(genre_dir.rglob("*.json")):
+            key = file_path.relative_to(genre_dir).with_suffix("").as_posix()
+            with open(file_path, 'r', encoding='utf-8') as src:
+                data = json.load(src)
+
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            offsets[key] = [f.tell(), len(payload)]
+            f.write(payload)
+
+        table = json.dumps(offsets, separators=(",", ":")).encode("utf-8")
+        table_offset = f.tell()
+        f.write(table)
+
+        f.seek(0)
+        f.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(offsets), table_offset, len(table)))
+
+    os.replace(tmp_path, output)
+    return output
+
+
+class ContentBundle:
+    """
+    Read-only, memory-mapped view over a compiled bundle
+
+    Only the offset table is decoded on open; records are decoded on demand.
+
+    Example:
+        bundle = ContentBundle(Path("data/genres/cyberpunk.bundle"))
+        tavern = bundle.read("locations/golden_drake_tavern")
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open and map a bundle file
+
+        Args:
+            path: Bundle file path
+
+        Raises:
+            ValueError: If the file is not a bundle or has an unsupported version
+        """
+        self.path = path
+        # The map keeps its own handle, so the file can be closed right away
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            self.stamp = (stat.st_mtime_ns, stat.st_size)  # For change detection
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise ValueError(f"Empty bundle file: {path}") from e
+
+        magic, version, count, table_offset, table_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC:
+            self.close()
+            raise ValueError(f"Not a content bundle: {path}")
+        if version != BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported bundle version {version}: {path}")
+
+        table = self._mmap[table_offset:table_offset + table_length]
+        self._offsets: Dict[str, Tuple[int, int]] = {
+            key: (offset, length) for key, (offset, length) in json.loads(table).items()
+        }
+        if len(self._offsets) != count:
+            self.close()
+            raise ValueError(f"Corrupt bundle offset table: {path}")
+
+    def __enter__(self) -> 'ContentBundle':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def keys(self) -> List[str]:
+        """All record keys in the bundle"""
+        return list(self._offsets)
+
+    def record_size(self, key: str) -> int:
+        """Size of a record's serialized payload in bytes"""
+        return self._offsets[key][1]
+
+    def read_bytes(self, key: str) -> bytes:
+        """
+        Get a record's serialized JSON payload without decoding it
+
+        Raises:
+            KeyError: If the record isn't in the bundle
+        """
+        offset, length = self._offsets[key]
+        return self._mmap[offset:offset + length]
+
+    def read(self, key: str) -> dict:
+        """
+        Decode a single record
+
+        Args:
+            key: Record key (e.g., "npcs/bartender_tom")
+
+        Returns:
+            Parsed record data
+
+        Raises:
+            KeyError: If the record isn't in the bundle
+        """
+        return json.loads(self.read_bytes(key))
+
+    def close(self):
+        """Unmap the bundle file"""
+        if not self._mmap.closed:
+            self._mmap.close()
+
+
+def main():
+    """Command-line entry point for building bundles"""
+    parser = argparse.ArgumentParser(description="Compile genre content into a bundle")
+    parser.add_argument("genres", nargs="+", help="Genre folders to compile (e.g., cyberpunk)")
+    parser.add_argument("--data-dir", type=Path, default=Path("data"), help="Root data directory")
+    args = parser.parse_args()
+
+    for genre in args.genres:
+        path = build_bundle(args.data_dir, genre)
+        with ContentBundle(path) as bundle:
+            print(f"✅ Built {path} ({len(bundle)} records, {path.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Content Cache - Bounded LRU cache for parsed game content
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+
+@dataclass
+class CachePolicy:
+    """
+    Limits for the content cache
+
+    Attributes:
+        max_entries: Maximum number of cached records (None = unlimited)
+        max_bytes: Approximate byte budget, measured as the serialized size
+            of each record on disk (None = unlimited)
+        pin_hubs: Keep every location with "type": "hub" resident once loaded
+    """
+    max_entries: Optional[int] = None
+    max_bytes: Optional[int] = None
+    pin_hubs: bool = False
+
+
+class ContentCache:
+    """
+    LRU cache with an entry and byte budget, plus pinned entries
+
+    Pinned entries are kept apart from the LRU order, so they never get
+    evicted and never slow eviction down. They still count towards
+    resident bytes. All operations are thread-safe.
+
+    Example:
+        cache = ContentCache(CachePolicy(max_entries=500))
+        cache.pin("data/genres/cyberpunk/locations/golden_drake_tavern.json")
+    """
+
+    def __init__(self, policy: Optional[CachePolicy] = None):
+        """
+        Initialize cache
+
+        Args:
+            policy: Cache limits (defaults to unbounded)
+        """
+        self.policy = policy or CachePolicy()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()  # LRU order, oldest first
+        self._pinned: Dict[str, Any] = {}
+        self._pinned_keys: Set[str] = set()
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resident_bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or key in self._pinned
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pinned)
+
+    def keys(self) -> List[str]:
+        """All cached keys (pinned first, then least to most recently used)"""
+        with self._lock:
+            return list(self._pinned) + list(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value and mark it as recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            if key in self._pinned:
+                self.hits += 1
+                return self._pinned[key]
+
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any, size: int = 0):
+        """
+        Store a value, evicting least recently used entries if over budget
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Approximate size in bytes
+        """
+        with self._lock:
+            self.discard(key)
+
+            if key in self._pinned_keys:
+                self._pinned[key] = value
+            else:
+                self._entries[key] = value
+            self._sizes[key] = size
+            self.resident_bytes += size
+
+            self._evict()
+
+    def discard(self, key: str) -> bool:
+        """
+        Remove a single entry (pins stay registered)
+
+        Returns:
+            True if the key was cached
+        """
+        with self._lock:
+            if key in self._entries:
+                del self._entries[key]
+            elif key in self._pinned:
+                del self._pinned[key]
+            else:
+                return False
+
+            self.resident_bytes -= self._sizes.pop(key, 0)
+            return True
+
+    def pin(self, key: str):
+        """Exempt a key from eviction (it may be pinned before it's loaded)"""
+        with self._lock:
+            self._pinned_keys.add(key)
+            if key in self._entries:
+                self._pinned[key] = self._entries.pop(key)
+
+    def unpin(self, key: str):
+        """Return a pinned key to normal LRU eviction"""
+        with self._lock:
+            self._pinned_keys.discard(key)
+            if key in self._pinned:
+                self._entries[key] = self._pinned.pop(key)
+                self._evict()
+
+    def is_pinned(self, key: str) -> bool:
+        """Check if a key is pinned"""
+        return key in self._pinned_keys
+
+    def clear(self):
+        """Drop all entries (pins and counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+            self._sizes.clear()
+            self.resident_bytes = 0
+
+    def _evict(self):
+        """Evict least recently used entries until within policy limits"""
+        max_entries = self.policy.max_entries
+        max_bytes = self.policy.max_bytes
+
+        while self._entries and (
+            (max_entries is not None and len(self) > max_entries)
+            or (max_bytes is not None and self.resident_bytes > max_bytes)
+        ):
+            key, _ = self._entries.popitem(last=False)
+            self.resident_bytes -= self._sizes.pop(key, 0)
+            self.evictions += 1
+
+    def get_stats(self) -> dict:
+        """
+        Get cache counters for sizing the cache
+
+        Returns:
+            Dict with hits, misses, evictions, resident bytes and limits
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self),
+                "pinned": len(self._pinned),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "resident_bytes": self.resident_bytes,
+                "max_entries": self.policy.max_entries,
+                "max_bytes": self.policy.max_bytes,
+            }
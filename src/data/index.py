@@ -0,0 +1,213 @@
+"""
+Content Index - Cross-reference index over all content IDs of a genre
+
+Maps every content ID to its kind and file, records which IDs each record
+links to, and keeps the reverse "who references me" map. Built in one pass
+over the content and persisted as data/genres/<genre>.index.json, so later
+starts only need to stat the content files to know the index is current.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .references import Reference, extract_references
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".index.json"
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """
+    Where a content ID lives
+
+    Attributes:
+        content_id: Record ID (filename without .json)
+        kind: Content folder (e.g., "npcs")
+        path: File path relative to the genre folder (e.g., "npcs/bartender_tom.json")
+    """
+    content_id: str
+    kind: str
+    path: str
+
+
+def index_path(data_dir: Path, genre: str) -> Path:
+    """Location of a genre's persisted index (e.g., data/genres/cyberpunk.index.json)"""
+    return data_dir / "genres" / f"{genre}{INDEX_SUFFIX}"
+
+
+def content_fingerprint(paths: Iterable[Path], root: Path) -> str:
+    """
+    Fingerprint a set of files by path, size and modification time
+
+    Cheap enough to run on every start: it stats files but never reads them.
+
+    Args:
+        paths: Files to fingerprint
+        root: Directory the recorded paths are made relative to
+    """
+    digest = hashlib.sha1()
+    for path in sorted(paths):
+        stat = path.stat()
+        name = path.relative_to(root).as_posix()
+        digest.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ContentIndex:
+    """
+    ID index with forward and reverse references
+
+    Example:
+        index = loader.get_index("cyberpunk")
+        index.lookup("bartender_tom").kind        # "npcs"
+        index.referenced_by("medkit_basic")       # [("locations", "golden_drake_tavern"), ...]
+        index.dangling_references()               # links to content that doesn't exist yet
+    """
+
+    def __init__(self, genre: str, fingerprint: str = ""):
+        """
+        Initialize an empty index
+
+        Args:
+            genre: Genre folder the index covers
+            fingerprint: Content fingerprint the index was built from
+        """
+        self.genre = genre
+        self.fingerprint = fingerprint
+        self._entries: Dict[str, IndexEntry] = {}
+        self._references: Dict[str, List[Reference]] = {}
+        self._referenced_by: Dict[str, List[Reference]] = {}
+        self.duplicate_ids: Set[str] = set()
+
+    def add(self, kind: str, content_id: str, path: str, references: List[Reference]) -> None:
+        """
+        Register a record and its outgoing references
+
+        Args:
+            kind: Content folder
+            content_id: Record ID
+            path: File path relative to the genre folder
+            references: (kind, content_id) pairs the record links to
+        """
+        if content_id in self._entries:
+            self.duplicate_ids.add(content_id)
+        self._entries[content_id] = IndexEntry(content_id, kind, path)
+
+        unique_refs: List[Reference] = list(dict.fromkeys((ref[0], ref[1]) for ref in references))
+        self._references[content_id] = unique_refs
+        for _, target_id in unique_refs:
+            self._referenced_by.setdefault(target_id, []).append((kind, content_id))
+
+    def __contains__(self, content_id: str) -> bool:
+        return content_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, content_id: str) -> Optional[IndexEntry]:
+        """Find where a content ID lives (None if it doesn't exist)"""
+        return self._entries.get(content_id)
+
+    def exists(self, kind: str, content_id: str) -> bool:
+        """Check that an ID exists and is of the expected kind"""
+        entry = self._entries.get(content_id)
+        return entry is not None and entry.kind == kind
+
+    def ids(self, kind: Optional[str] = None) -> List[str]:
+        """All indexed IDs, optionally filtered by kind"""
+        if kind is None:
+            return list(self._entries)
+        return [entry.content_id for entry in self._entries.values() if entry.kind == kind]
+
+    def references(self, content_id: str) -> List[Reference]:
+        """IDs that a record links to"""
+        return list(self._references.get(content_id, []))
+
+    def referenced_by(self, content_id: str) -> List[Reference]:
+        """Records that link to an ID (whether or not the ID exists)"""
+        return list(self._referenced_by.get(content_id, []))
+
+    def dangling_references(self) -> List[Tuple[Reference, Reference]]:
+        """
+        Find references to missing content (or content of the wrong kind)
+
+        Returns:
+            List of ((source_kind, source_id), (target_kind, target_id))
+        """
+        dangling = []
+        for source_id, refs in self._references.items():
+            source = (self._entries[source_id].kind, source_id)
+            for target_kind, target_id in refs:
+                if not self.exists(target_kind, target_id):
+                    dangling.append((source, (target_kind, target_id)))
+        return dangling
+
+    def to_dict(self) -> dict:
+        """Serialize to dictionary for persisting"""
+        return {
+            "version": INDEX_VERSION,
+            "genre": self.genre,
+            "fingerprint": self.fingerprint,
+            "entries": {
+                content_id: [entry.kind, entry.path, self._references[content_id]]
+                for content_id, entry in self._entries.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ContentIndex':
+        """Deserialize from dictionary (reverse references are rebuilt)"""
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported index version: {data.get('version')}")
+
+        index = cls(data["genre"], data["fingerprint"])
+        for content_id, (kind, path, references) in data["entries"].items():
+            index.add(kind, content_id, path, [(ref[0], ref[1]) for ref in references])
+        return index
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically (temp file + rename)"""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'ContentIndex':
+        """
+        Read a persisted index
+
+        Raises:
+            FileNotFoundError: If the index file doesn't exist
+            ValueError: If the index file is corrupt or from another version
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def build(
+        cls,
+        genre: str,
+        records: Iterable[Tuple[str, str, dict]],
+        fingerprint: str = ""
+    ) -> 'ContentIndex':
+        """
+        Build an index in one pass over a genre's records
+
+        Args:
+            genre: Genre folder
+            records: (kind, content_id, data) for every record
+            fingerprint: Content fingerprint to store with the index
+
+        Returns:
+            Populated index
+        """
+        index = cls(genre, fingerprint)
+        for kind, content_id, data in records:
+            index.add(kind, content_id, f"{kind}/{content_id}.json", extract_references(kind, data))
+        return index
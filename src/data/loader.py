@@ -2,31 +2,147 @@
 Data Loader - Load and cache JSON game content
 """
 
+import asyncio
 import json
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from .bundle import ContentBundle, bundle_path
+from .cache import CachePolicy, ContentCache
+from .index import ContentIndex, content_fingerprint, index_path
+from .models import NPC, DialogueTree, Enemy, Item, Location, compile_record
+from .references import (
+    CONTENT_KINDS, DIALOGUES, ENEMIES, ITEMS, LOCATIONS, NPCS, Reference, extract_references
+)
+from .views import loads_frozen
+
+logger = logging.getLogger(__name__)
+
+Stamp = Tuple[int, int]  # (st_mtime_ns, st_size)
+
+
+class _Source(NamedTuple):
+    """Where a cached entry was read from, for change detection"""
+    path: str  # Loose JSON file or bundle file
+    stamp: Stamp
+    record: Optional[Tuple[str, str, str]]  # (genre, kind, record_id) for genre content
+
+
+def _stat_stamp(path: str) -> Optional[Stamp]:
+    """Current (mtime, size) of a file, or None if it's gone"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
 
 
 class DataLoader:
     """
     Loads game content from JSON files with caching
 
+    Records are returned as read-only mappings and tuples straight from the
+    cache (see src/data/views.py); use instantiate() for a mutable copy.
+
     Example:
         loader = DataLoader(Path("data"))
         location = loader.load_location("cyberpunk", "golden_drake_tavern")
+
+        # Read from precompiled bundles (see src/data/bundle.py) when present
+        loader = DataLoader(Path("data"), use_bundles=True)
+
+        # Bounded cache that always keeps the hub tavern resident
+        loader = DataLoader(Path("data"), cache_policy=CachePolicy(max_bytes=8_000_000))
+        loader.pin_location("cyberpunk", "golden_drake_tavern")
+
+        # Warm everything up front, or load neighbours in the background
+        loader.preload_genre("cyberpunk")
+        loader.enable_prefetch(game_events, "cyberpunk")
+
+        # From async code (e.g., the UI loop)
+        location = await loader.aload_location("cyberpunk", "golden_drake_tavern")
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        use_bundles: bool = False,
+        cache_policy: Optional[CachePolicy] = None,
+        model_cache_policy: Optional[CachePolicy] = None
+    ):
         """
         Initialize data loader
 
         Args:
             data_dir: Root data directory (e.g., Path("data"))
+            use_bundles: Read records from data/genres/<genre>.bundle when it
+                exists, falling back to loose JSON files otherwise
+            cache_policy: Limits of the raw record cache (defaults to an
+                unbounded cache)
+            model_cache_policy: Limits of the compiled model cache (see
+                load_*_model), which is separate from the record cache
+                (defaults to the same limits as cache_policy)
         """
         self.data_dir = data_dir
-        self._cache: Dict[str, Any] = {}
+        self.use_bundles = use_bundles
+        self._genres_root = str(data_dir / "genres")
+        self._cache = ContentCache(cache_policy)
+        # Compiled models (see load_*_model), sized on their own
+        self._models = ContentCache(model_cache_policy or cache_policy)
+        self._sources: Dict[str, _Source] = {}  # cache key -> source (see reload_changed)
+        self._source_dirs: Set[str] = set()
+        self._bundles: Dict[str, Optional[ContentBundle]] = {}
+        self._bundle_lock = threading.Lock()
+        self._indexes: Dict[str, ContentIndex] = {}
+        self._index_lock = threading.Lock()
+
+        # Background prefetch (see enable_prefetch)
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_genre = ""
+        self._prefetch_pending: Set[Future] = set()
+        self._prefetch_lock = threading.Lock()
+
+        # Async loading (see aload_location)
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _get_bundle(self, genre: str) -> Optional[ContentBundle]:
+        """Open (once) and return the bundle for a genre, if bundles are enabled"""
+        if not self.use_bundles:
+            return None
+
+        with self._bundle_lock:
+            if genre not in self._bundles:
+                path = bundle_path(self.data_dir, genre)
+                self._bundles[genre] = ContentBundle(path) if path.exists() else None
+            return self._bundles[genre]
+
+    def _read_file(self, file_path: Path, frozen: bool = True) -> Tuple[Any, int, Stamp]:
+        """
+        Read and parse a loose JSON file, bypassing the cache
+
+        Args:
+            file_path: Path to JSON file
+            frozen: Parse into read-only mappings and tuples instead of dicts and lists
+
+        Returns:
+            (parsed data, file size in bytes, (mtime, size) stamp)
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Data file not found: {file_path}")
+
+        with open(file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            raw = f.read()
+        data = loads_frozen(raw) if frozen else json.loads(raw)
+        return data, len(raw), (stat.st_mtime_ns, stat.st_size)
 
-    def _load_json(self, file_path: Path) -> dict:
+    def _load_json(self, file_path: Path) -> Mapping:
         """
         Load JSON file with caching
 
@@ -34,7 +150,7 @@ class DataLoader:
             file_path: Path to JSON file
 
         Returns:
-            Parsed JSON data
+            Parsed JSON data (read-only, shared with the cache)
 
         Raises:
             FileNotFoundError: If file doesn't exist
@@ -43,21 +159,119 @@ class DataLoader:
         cache_key = str(file_path)
 
         # Check cache first
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        data = self._cache.get(cache_key)
+        if data is not None:
+            return data
 
         # Load from disk
-        if not file_path.exists():
-            raise FileNotFoundError(f"Data file not found: {file_path}")
+        data, size, stamp = self._read_file(file_path)
+
+        # Store in cache
+        self._cache.put(cache_key, data, size)
+        self._track(cache_key, _Source(cache_key, stamp, None))
+        return data
+
+    def _load_record(self, genre: str, kind: str, record_id: str) -> Mapping:
+        """
+        Load a genre content record with caching
+
+        Cache keys are the record's file path, whether the record comes from
+        a bundle or a loose file. They are built with os.path.join rather
+        than Path objects since this runs on every lookup.
+
+        Args:
+            genre: Genre folder
+            kind: Content folder (e.g., "npcs"), or "" for genre-level files
+            record_id: Record ID (filename without .json)
+
+        Returns:
+            Parsed record data (read-only, shared with the cache)
+
+        Raises:
+            FileNotFoundError: If the record doesn't exist
+        """
+        cache_key = self._record_key(genre, kind, record_id)
+
+        # Check cache first
+        data = self._cache.get(cache_key)
+        if data is not None:
+            return data
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Load from bundle, falling back to disk
+        data, size, source = self._read_record(genre, kind, record_id, cache_key)
+
+        if kind == LOCATIONS and self._cache.policy.pin_hubs and data.get("type") == "hub":
+            self._cache.pin(cache_key)
 
         # Store in cache
-        self._cache[cache_key] = data
+        self._cache.put(cache_key, data, size)
+        self._track(cache_key, source)
         return data
 
-    def load_location(self, genre: str, location_id: str) -> dict:
+    def _load_model(self, genre: str, kind: str, record_id: str):
+        """
+        Load a genre content record compiled into its model type, with caching
+
+        The raw dict is not cached alongside the model, so using only the
+        model API keeps one (slotted, frozen) object per record in memory.
+
+        Raises:
+            FileNotFoundError: If the record doesn't exist
+            pydantic.ValidationError: If the record doesn't match its schema
+        """
+        cache_key = self._record_key(genre, kind, record_id)
+
+        model = self._models.get(cache_key)
+        if model is not None:
+            return model
+
+        data, size, source = self._read_record(genre, kind, record_id, cache_key, frozen=False)
+        model = compile_record(kind, data)
+
+        if kind == LOCATIONS and self._models.policy.pin_hubs and model.type == "hub":
+            self._models.pin(cache_key)
+
+        self._models.put(cache_key, model, size)
+        self._track(cache_key, source)
+        return model
+
+    def _track(self, cache_key: str, source: _Source):
+        """Remember where a cached entry came from (see reload_changed)"""
+        self._sources[cache_key] = source
+        self._source_dirs.add(os.path.dirname(source.path))
+
+    def _read_record(
+        self,
+        genre: str,
+        kind: str,
+        record_id: str,
+        cache_key: Optional[str] = None,
+        frozen: bool = True
+    ) -> Tuple[Any, int, _Source]:
+        """
+        Read a genre content record from its bundle or file, bypassing the cache
+
+        Returns:
+            (parsed data, serialized size in bytes, source it was read from)
+        """
+        record = (genre, kind, record_id)
+        bundle = self._get_bundle(genre)
+        bundle_key = f"{kind}/{record_id}" if kind else record_id
+        if bundle is not None and bundle_key in bundle:
+            source = _Source(str(bundle.path), bundle.stamp, record)
+            raw = bundle.read_bytes(bundle_key)
+            data = loads_frozen(raw) if frozen else json.loads(raw)
+            return data, len(raw), source
+
+        file_path = cache_key or self._record_key(genre, kind, record_id)
+        data, size, stamp = self._read_file(Path(file_path), frozen)
+        return data, size, _Source(file_path, stamp, record)
+
+    def _record_key(self, genre: str, kind: str, record_id: str) -> str:
+        """Cache key (file path) of a genre content record"""
+        return os.path.join(self._genres_root, genre, kind, f"{record_id}.json")
+
+    def load_location(self, genre: str, location_id: str) -> Mapping:
         """
         Load location data
 
@@ -66,16 +280,15 @@ class DataLoader:
             location_id: Location ID (matches filename without .json)
 
         Returns:
-            Location data dict
+            Location data (read-only mapping)
 
         Example:
             location = loader.load_location("cyberpunk", "golden_drake_tavern")
             print(location['name'])  # "The Golden Drake"
         """
-        file_path = self.data_dir / "genres" / genre / "locations" / f"{location_id}.json"
-        return self._load_json(file_path)
+        return self._load_record(genre, "locations", location_id)
 
-    def load_npc(self, genre: str, npc_id: str) -> dict:
+    def load_npc(self, genre: str, npc_id: str) -> Mapping:
         """
         Load NPC data
 
@@ -84,12 +297,11 @@ class DataLoader:
             npc_id: NPC ID
 
         Returns:
-            NPC data dict
+            NPC data (read-only mapping)
         """
-        file_path = self.data_dir / "genres" / genre / "npcs" / f"{npc_id}.json"
-        return self._load_json(file_path)
+        return self._load_record(genre, "npcs", npc_id)
 
-    def load_dialogue_tree(self, genre: str, dialogue_id: str) -> dict:
+    def load_dialogue_tree(self, genre: str, dialogue_id: str) -> Mapping:
         """
         Load dialogue tree data
 
@@ -98,12 +310,11 @@ class DataLoader:
             dialogue_id: Dialogue tree ID
 
         Returns:
-            Dialogue tree data dict
+            Dialogue tree data (read-only mapping)
         """
-        file_path = self.data_dir / "genres" / genre / "dialogues" / f"{dialogue_id}.json"
-        return self._load_json(file_path)
+        return self._load_record(genre, "dialogues", dialogue_id)
 
-    def load_enemy(self, genre: str, enemy_id: str) -> dict:
+    def load_enemy(self, genre: str, enemy_id: str) -> Mapping:
         """
         Load enemy data
 
@@ -112,12 +323,11 @@ class DataLoader:
             enemy_id: Enemy ID
 
         Returns:
-            Enemy data dict
+            Enemy data (read-only mapping)
         """
-        file_path = self.data_dir / "genres" / genre / "enemies" / f"{enemy_id}.json"
-        return self._load_json(file_path)
+        return self._load_record(genre, "enemies", enemy_id)
 
-    def load_item(self, genre: str, item_id: str) -> dict:
+    def load_item(self, genre: str, item_id: str) -> Mapping:
         """
         Load item data
 
@@ -126,12 +336,37 @@ class DataLoader:
             item_id: Item ID
 
         Returns:
-            Item data dict
+            Item data (read-only mapping)
         """
-        file_path = self.data_dir / "genres" / genre / "items" / f"{item_id}.json"
-        return self._load_json(file_path)
+        return self._load_record(genre, "items", item_id)
 
-    def load_factions(self, genre: str) -> dict:
+    def load_location_model(self, genre: str, location_id: str) -> Location:
+        """
+        Load a location compiled into a validated, immutable Location
+
+        Example:
+            tavern = loader.load_location_model("cyberpunk", "golden_drake_tavern")
+            tavern.exits["out"].target  # "downtown_streets"
+        """
+        return self._load_model(genre, LOCATIONS, location_id)
+
+    def load_npc_model(self, genre: str, npc_id: str) -> NPC:
+        """Load an NPC compiled into a validated, immutable NPC"""
+        return self._load_model(genre, NPCS, npc_id)
+
+    def load_enemy_model(self, genre: str, enemy_id: str) -> Enemy:
+        """Load an enemy compiled into a validated, immutable Enemy"""
+        return self._load_model(genre, ENEMIES, enemy_id)
+
+    def load_item_model(self, genre: str, item_id: str) -> Item:
+        """Load an item compiled into a validated, immutable Item"""
+        return self._load_model(genre, ITEMS, item_id)
+
+    def load_dialogue_model(self, genre: str, dialogue_id: str) -> DialogueTree:
+        """Load a dialogue tree compiled into a validated, immutable DialogueTree"""
+        return self._load_model(genre, DIALOGUES, dialogue_id)
+
+    def load_factions(self, genre: str) -> Mapping:
         """
         Load faction data
 
@@ -139,23 +374,515 @@ class DataLoader:
             genre: Genre folder
 
         Returns:
-            Factions data dict
+            Factions data (read-only mapping)
+        """
+        return self._load_record(genre, "", "factions")
+
+    def _list_records(self, genre: str) -> List[Tuple[str, str]]:
+        """
+        List every record of a genre as (kind, record_id)
+
+        Genre-level files such as factions.json have an empty kind.
+        """
+        keys = set()
+        bundle = self._get_bundle(genre)
+        if bundle is not None:
+            keys.update(bundle.keys())
+
+        genre_dir = self.data_dir / "genres" / genre
+        keys.update(
+            path.relative_to(genre_dir).with_suffix("").as_posix()
+            for path in genre_dir.rglob("*.json")
+        )
+
+        return [
+            (kind, record_id)
+            for kind, _, record_id in (key.rpartition("/") for key in sorted(keys))
+        ]
+
+    def preload_genre(self, genre: str, max_workers: Optional[int] = None) -> int:
+        """
+        Load every record of a genre into the cache using a thread pool
+
+        With a bounded cache policy, records beyond the budget are evicted
+        as usual, so size the cache for the genre before preloading it.
+
+        Args:
+            genre: Genre folder
+            max_workers: Thread pool size (defaults to ThreadPoolExecutor's)
+
+        Returns:
+            Number of records loaded
+
+        Raises:
+            json.JSONDecodeError: If any record is invalid
+        """
+        records = self._list_records(genre)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._load_record, genre, kind, record_id)
+                for kind, record_id in records
+            ]
+        for future in futures:
+            future.result()  # Re-raise the first load error
+        return len(futures)
+
+    def enable_prefetch(self, dispatcher, genre: str, max_workers: int = 4):
+        """
+        Load a location's neighbourhood in the background when it's entered
+
+        Subscribes to LOCATION_ENTERED (event data: "location_id", and
+        optionally "genre"). Exit targets, NPCs, dialogue trees, encounter
+        enemies and the items all of those reference are loaded on a
+        thread pool, so the next move finds them in the cache.
+
+        Args:
+            dispatcher: EventDispatcher to subscribe to (e.g., game_events)
+            genre: Genre used when the event doesn't carry one
+            max_workers: Prefetch thread pool size
         """
-        file_path = self.data_dir / "genres" / genre / "factions.json"
-        return self._load_json(file_path)
+        from src.core.event_dispatcher import EventType
+
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="prefetch"
+            )
+        self._prefetch_genre = genre
+        dispatcher.subscribe(EventType.LOCATION_ENTERED, self._on_location_entered)
+
+    def disable_prefetch(self, dispatcher):
+        """Stop prefetching and shut the prefetch thread pool down"""
+        from src.core.event_dispatcher import EventType
+
+        dispatcher.unsubscribe(EventType.LOCATION_ENTERED, self._on_location_entered)
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_executor = None
+
+    def _on_location_entered(self, event):
+        """LOCATION_ENTERED listener - queue the location's neighbourhood"""
+        genre = event.data.get("genre", self._prefetch_genre)
+        self.prefetch_location(genre, event.data["location_id"])
+
+    def prefetch_location(self, genre: str, location_id: str):
+        """
+        Queue a background load of a location and everything it references
+
+        Returns immediately. Missing or broken referenced records are
+        skipped here and reported when they are actually loaded.
+
+        Args:
+            genre: Genre folder
+            location_id: Location ID
+        """
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(thread_name_prefix="prefetch")
+        self._submit_prefetch(genre, LOCATIONS, location_id, depth=2)
+
+    def _submit_prefetch(self, genre: str, kind: str, record_id: str, depth: int):
+        """Queue one prefetch task and track it until it finishes"""
+        with self._prefetch_lock:
+            executor = self._prefetch_executor
+            if executor is None:
+                return
+            try:
+                future = executor.submit(self._prefetch_record, genre, kind, record_id, depth)
+            except RuntimeError:
+                return  # Executor is shutting down
+            self._prefetch_pending.add(future)
+        future.add_done_callback(self._prefetch_done)
+
+    def _prefetch_done(self, future: Future):
+        with self._prefetch_lock:
+            self._prefetch_pending.discard(future)
+
+    def _prefetch_record(self, genre: str, kind: str, record_id: str, depth: int):
+        """
+        Load one record, then queue the records it references
+
+        depth limits how far references are followed: the entered location
+        starts at 2, so its NPCs and enemies also pull in their items and
+        dialogues. Neighbouring locations are loaded but never followed,
+        so prefetch stays one exit away.
+        """
+        try:
+            data = self._load_record(genre, kind, record_id)
+        except (OSError, ValueError):
+            return
+
+        if depth <= 0:
+            return
+
+        for ref_kind, ref_id in dict.fromkeys(extract_references(kind, data)):
+            ref_depth = 0 if ref_kind == LOCATIONS else depth - 1
+            self._submit_prefetch(genre, ref_kind, ref_id, ref_depth)
+
+    def wait_for_prefetch(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until all queued prefetch work (including follow-ups) is done
+
+        Args:
+            timeout: Maximum seconds to wait per round (None = no limit)
+
+        Returns:
+            True if no prefetch work is pending
+        """
+        while True:
+            with self._prefetch_lock:
+                pending = set(self._prefetch_pending)
+            if not pending:
+                return True
+            _, not_done = wait(pending, timeout=timeout)
+            if not_done:
+                return False
+
+    async def _aload(self, load, cache: ContentCache, genre: str, kind: str, record_id: str):
+        """
+        Run a blocking load on the async thread pool, sharing in-flight loads
+
+        Cached records are returned without leaving the event loop. Otherwise
+        every caller asking for the same record while it's being read awaits
+        the same load. Waiters are shielded, so cancelling one of them
+        doesn't cancel the load for the others.
+        """
+        cache_key = self._record_key(genre, kind, record_id)
+        if cache_key in cache:
+            value = cache.get(cache_key)
+            if value is not None:
+                return value
+
+        inflight_key = (load.__name__, cache_key)
+        with self._inflight_lock:
+            future = self._inflight.get(inflight_key)
+            is_new = future is None
+            if future is None:
+                if self._async_executor is None:
+                    self._async_executor = ThreadPoolExecutor(thread_name_prefix="aload")
+                future = self._async_executor.submit(load, genre, kind, record_id)
+                self._inflight[inflight_key] = future
+        if is_new:
+            future.add_done_callback(lambda done: self._inflight_done(inflight_key, done))
+
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _inflight_done(self, inflight_key: Tuple[str, str], future: Future):
+        with self._inflight_lock:
+            if self._inflight.get(inflight_key) is future:
+                del self._inflight[inflight_key]
+
+    async def aload_location(self, genre: str, location_id: str) -> Mapping:
+        """
+        Load location data without blocking the event loop
+
+        Example:
+            location = await loader.aload_location("cyberpunk", "golden_drake_tavern")
+        """
+        return await self._aload(self._load_record, self._cache, genre, LOCATIONS, location_id)
+
+    async def aload_npc(self, genre: str, npc_id: str) -> Mapping:
+        """Load NPC data without blocking the event loop"""
+        return await self._aload(self._load_record, self._cache, genre, NPCS, npc_id)
+
+    async def aload_dialogue_tree(self, genre: str, dialogue_id: str) -> Mapping:
+        """Load dialogue tree data without blocking the event loop"""
+        return await self._aload(self._load_record, self._cache, genre, DIALOGUES, dialogue_id)
+
+    async def aload_enemy(self, genre: str, enemy_id: str) -> Mapping:
+        """Load enemy data without blocking the event loop"""
+        return await self._aload(self._load_record, self._cache, genre, ENEMIES, enemy_id)
+
+    async def aload_item(self, genre: str, item_id: str) -> Mapping:
+        """Load item data without blocking the event loop"""
+        return await self._aload(self._load_record, self._cache, genre, ITEMS, item_id)
+
+    async def aload_factions(self, genre: str) -> Mapping:
+        """Load faction data without blocking the event loop"""
+        return await self._aload(self._load_record, self._cache, genre, "", "factions")
+
+    async def aload_location_model(self, genre: str, location_id: str) -> Location:
+        """Load a compiled Location without blocking the event loop"""
+        return await self._aload(self._load_model, self._models, genre, LOCATIONS, location_id)
+
+    async def aload_npc_model(self, genre: str, npc_id: str) -> NPC:
+        """Load a compiled NPC without blocking the event loop"""
+        return await self._aload(self._load_model, self._models, genre, NPCS, npc_id)
+
+    async def aload_enemy_model(self, genre: str, enemy_id: str) -> Enemy:
+        """Load a compiled Enemy without blocking the event loop"""
+        return await self._aload(self._load_model, self._models, genre, ENEMIES, enemy_id)
+
+    async def aload_item_model(self, genre: str, item_id: str) -> Item:
+        """Load a compiled Item without blocking the event loop"""
+        return await self._aload(self._load_model, self._models, genre, ITEMS, item_id)
+
+    async def aload_dialogue_model(self, genre: str, dialogue_id: str) -> DialogueTree:
+        """Load a compiled DialogueTree without blocking the event loop"""
+        return await self._aload(self._load_model, self._models, genre, DIALOGUES, dialogue_id)
+
+    async def agather_location(self, genre: str, location_id: str) -> Dict[Reference, Mapping]:
+        """
+        Load a location and its whole dependency set concurrently
+
+        Follows references the same way as prefetch_location: the location's
+        NPCs, dialogues, enemies and items, plus the items and dialogues
+        those reference, and neighbouring locations (not followed further).
+        Each level is loaded in parallel. Dangling references are skipped.
+
+        Args:
+            genre: Genre folder
+            location_id: Location ID
+
+        Returns:
+            Dict of (kind, content_id) -> record data, including the location
+
+        Raises:
+            FileNotFoundError: If the location itself doesn't exist
+            json.JSONDecodeError: If any loaded record is invalid
+
+        Example:
+            content = await loader.agather_location("cyberpunk", "golden_drake_tavern")
+            tom = content[("npcs", "bartender_tom")]
+        """
+        root = (LOCATIONS, location_id)
+        loaded = {root: await self.aload_location(genre, location_id)}
+        frontier: Dict[Reference, int] = {root: 2}  # Reference -> remaining depth
+
+        while frontier:
+            wanted: Dict[Reference, int] = {}
+            for ref, depth in frontier.items():
+                if depth <= 0:
+                    continue
+                for target in extract_references(ref[0], loaded[ref]):
+                    if target not in loaded and target not in wanted:
+                        wanted[target] = 0 if target[0] == LOCATIONS else depth - 1
+
+            results = await asyncio.gather(
+                *(self._aload(self._load_record, self._cache, genre, kind, content_id)
+                  for kind, content_id in wanted),
+                return_exceptions=True
+            )
+
+            frontier = {}
+            for ref, result in zip(wanted, results, strict=True):
+                if isinstance(result, FileNotFoundError):
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                loaded[ref] = result
+                frontier[ref] = wanted[ref]
+
+        return loaded
+
+    def get_index(self, genre: str, rebuild: bool = False) -> ContentIndex:
+        """
+        Get the cross-reference index for a genre
+
+        The index is persisted next to the content (data/genres/<genre>.index.json)
+        together with a fingerprint of the content files' sizes and mtimes.
+        It's only rebuilt when that fingerprint no longer matches, or the
+        persisted file is missing or corrupt. Building reads records without
+        going through the cache.
+
+        Args:
+            genre: Genre folder
+            rebuild: Ignore the persisted index and rebuild it
+
+        Returns:
+            ContentIndex for the genre
+        """
+        with self._index_lock:
+            if not rebuild and genre in self._indexes:
+                return self._indexes[genre]
+
+            genres_dir = self.data_dir / "genres"
+            files = [
+                path for kind in CONTENT_KINDS
+                for path in (genres_dir / genre / kind).glob("*.json")
+            ]
+            bundle = self._get_bundle(genre)
+            if bundle is not None:
+                files.append(bundle.path)
+            fingerprint = content_fingerprint(files, genres_dir)
+
+            path = index_path(self.data_dir, genre)
+            index = None
+            if not rebuild:
+                try:
+                    index = ContentIndex.load(path)
+                except (OSError, ValueError, KeyError, TypeError):
+                    index = None
+                if index is not None and index.fingerprint != fingerprint:
+                    index = None
+
+            if index is None:
+                records = (
+                    (kind, record_id, self._read_record(genre, kind, record_id, frozen=False)[0])
+                    for kind, record_id in self._list_records(genre)
+                    if kind in CONTENT_KINDS
+                )
+                index = ContentIndex.build(genre, records, fingerprint)
+                try:
+                    index.save(path)
+                except OSError as e:
+                    logger.warning("Could not persist content index for %s: %s", genre, e)
+
+            self._indexes[genre] = index
+            return index
+
+    def load_by_id(self, genre: str, content_id: str) -> Mapping:
+        """
+        Load any content record by ID, resolving its kind through the index
+
+        Args:
+            genre: Genre folder
+            content_id: Record ID (e.g., "bartender_tom")
+
+        Returns:
+            Record data (read-only mapping)
+
+        Raises:
+            KeyError: If no record with that ID exists
+        """
+        entry = self.get_index(genre).lookup(content_id)
+        if entry is None:
+            raise KeyError(f"Unknown content ID in {genre}: {content_id}")
+        return self._load_record(genre, entry.kind, content_id)
+
+    def pin_location(self, genre: str, location_id: str):
+        """
+        Keep a location resident in the cache regardless of eviction
+
+        Args:
+            genre: Genre folder
+            location_id: Location ID (e.g., "golden_drake_tavern")
+        """
+        cache_key = self._record_key(genre, LOCATIONS, location_id)
+        self._cache.pin(cache_key)
+        self._models.pin(cache_key)
+
+    def unpin_location(self, genre: str, location_id: str):
+        """Allow a pinned location to be evicted again"""
+        cache_key = self._record_key(genre, LOCATIONS, location_id)
+        self._cache.unpin(cache_key)
+        self._models.unpin(cache_key)
 
     def clear_cache(self):
-        """Clear all cached data (useful for hot-reloading in dev)"""
+        """Clear all cached data (see reload_changed to reload only edited files)"""
         self._cache.clear()
+        self._models.clear()
+        self._sources.clear()
+
+    def watched_dirs(self) -> Set[str]:
+        """Directories holding the files (loose JSON or bundles) cached entries came from"""
+        return set(self._source_dirs)
+
+    def reload_changed(self, paths: Optional[Set[str]] = None) -> List[dict]:
+        """
+        Invalidate and reload only cached entries whose source file changed
+
+        A source counts as changed when its mtime or size differs from when
+        it was read. Entries that are no longer cached are just forgotten.
+        When a bundle changes, it is reopened and every entry read from it
+        is reloaded.
+
+        Args:
+            paths: Only check these source paths (e.g., from file system
+                notifications); None checks every tracked source
+
+        Returns:
+            One change dict per reloaded entry, with "path", "genre",
+            "kind", "content_id" (None for non-genre files), "deleted"
+            and "error" (message if the new version failed to load)
+        """
+        stamps: Dict[str, Optional[Stamp]] = {}
+        changed: List[Tuple[str, _Source]] = []
+        for cache_key, source in list(self._sources.items()):
+            if paths is not None and source.path not in paths:
+                continue
+            if source.path not in stamps:
+                stamps[source.path] = _stat_stamp(source.path)
+            if stamps[source.path] != source.stamp:
+                changed.append((cache_key, source))
+
+        if not changed:
+            return []
+
+        with self._bundle_lock:
+            for bundle_genre, bundle in list(self._bundles.items()):
+                if bundle is not None and str(bundle.path) in stamps \
+                        and stamps[str(bundle.path)] != bundle.stamp:
+                    bundle.close()
+                    del self._bundles[bundle_genre]
+
+        changes = []
+        for cache_key, source in changed:
+            del self._sources[cache_key]
+            had_data = self._cache.discard(cache_key)
+            had_model = self._models.discard(cache_key)
+            if not (had_data or had_model):
+                continue  # Evicted since it was loaded - nothing to refresh
+
+            genre: Optional[str] = None
+            kind: Optional[str] = None
+            content_id: Optional[str] = None
+            if source.record is not None:
+                genre, kind, content_id = source.record
+                self._indexes.pop(genre, None)
+
+            change = {
+                "path": cache_key,
+                "genre": genre,
+                "kind": kind,
+                "content_id": content_id,
+                "deleted": False,
+                "error": None,
+            }
+            try:
+                if source.record is None:
+                    self._load_json(Path(cache_key))
+                else:
+                    if had_data:
+                        self._load_record(*source.record)
+                    if had_model:
+                        self._load_model(*source.record)
+            except FileNotFoundError:
+                change["deleted"] = True
+            except ValueError as e:
+                change["error"] = str(e)
+                logger.warning("Failed to reload %s: %s", cache_key, e)
+            changes.append(change)
+
+        return changes
+
+    def close(self):
+        """Stop background prefetching and async loads, release memory-mapped bundles"""
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_executor = None
+        if self._async_executor is not None:
+            self._async_executor.shutdown(wait=True, cancel_futures=True)
+            self._async_executor = None
+
+        for bundle in self._bundles.values():
+            if bundle is not None:
+                bundle.close()
+        self._bundles.clear()
 
     def get_cache_stats(self) -> dict:
         """
         Get cache statistics
 
         Returns:
-            Dict with cache info
+            Dict with record cache info: file count and keys, plus hits,
+            misses, evictions, resident_bytes and the configured limits;
+            "compiled_models" (count) and "models" (the same counters for
+            the compiled model cache)
         """
+        stats = self._cache.get_stats()
         return {
-            "cached_files": len(self._cache),
-            "cache_keys": list(self._cache.keys())
+            "cached_files": stats.pop("entries"),
+            "cache_keys": self._cache.keys(),
+            **stats,
+            "compiled_models": len(self._models),
+            "models": self._models.get_stats(),
         }
@@ -0,0 +1,278 @@
+"""
+Content Models - Validated, immutable, slotted views of game content
+
+Each content kind (Location, NPC, Enemy, Item, DialogueTree) is compiled once
+from its JSON record into a frozen pydantic dataclass with __slots__, so
+systems get attribute access instead of nested string-keyed lookups and
+records carry no per-instance __dict__.
+
+Sections the engine doesn't interpret yet (personality, lore, dialogue
+lines...) are kept as read-only mappings; lists become tuples.
+
+Example:
+    enemy = loader.load_enemy_model("cyberpunk", "street_thug_tutorial")
+    enemy.stats.hp_max           # 30
+    enemy.attacks[0].damage_dice # "1d6+2"
+"""
+
+from dataclasses import field
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, Mapping, Optional, Tuple, Type
+
+from pydantic import AfterValidator, ConfigDict, TypeAdapter
+from pydantic.dataclasses import dataclass
+
+from .references import DIALOGUES, ENEMIES, ITEMS, LOCATIONS, NPCS
+from .views import freeze
+
+
+def _empty_mapping() -> Mapping[str, Any]:
+    return MappingProxyType({})
+
+
+# Free-form JSON section, frozen after validation
+FrozenMapping = Annotated[Mapping[str, Any], AfterValidator(freeze)]
+
+# Typed mappings made read-only after their values are validated
+_read_only = AfterValidator(MappingProxyType)
+IntMapping = Annotated[Mapping[str, int], _read_only]
+StrMapping = Annotated[Mapping[str, str], _read_only]
+
+_CONFIG = ConfigDict(extra="ignore")
+
+
+# ---------------------------------------------------------------------------
+# Locations
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class Exit:
+    """A way out of a location"""
+    target: str
+    description: str = ""
+    locked: bool = False
+    key_required: Optional[str] = None
+    first_time_exit_text: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class LocationNPC:
+    """An NPC placement inside a location"""
+    npc_id: str
+    spawn_position: str = ""
+    spawn_conditions: FrozenMapping = field(default_factory=_empty_mapping)
+    dialogue_tree: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class LocationObject:
+    """An examinable object inside a location"""
+    object_id: str
+    name: str
+    examine_text: str = ""
+    interactable: bool = False
+    actions: FrozenMapping = field(default_factory=_empty_mapping)
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class EnemyGroup:
+    """A group of enemies spawned together by an encounter"""
+    enemies: Tuple[str, ...]
+    count: int = 1
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class Encounter:
+    """A combat encounter that can trigger in a location"""
+    encounter_id: str
+    trigger: str = ""
+    enemy_groups: Tuple[EnemyGroup, ...] = ()
+    intro_text: str = ""
+    on_victory: FrozenMapping = field(default_factory=_empty_mapping)
+    on_defeat: FrozenMapping = field(default_factory=_empty_mapping)
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class Location:
+    """A location template (data/genres/<genre>/locations/)"""
+    location_id: str
+    name: str
+    type: str = ""
+    description: str = ""
+    ascii_art: Tuple[str, ...] = ()
+    music_theme: Optional[str] = None
+    danger_level: int = 0
+    exits: Annotated[Mapping[str, Exit], _read_only] = field(default_factory=_empty_mapping)
+    npcs: Tuple[LocationNPC, ...] = ()
+    objects: Tuple[LocationObject, ...] = ()
+    encounters: Tuple[Encounter, ...] = ()
+    ambient_text: Tuple[str, ...] = ()
+    first_visit_flags: FrozenMapping = field(default_factory=_empty_mapping)
+
+
+# ---------------------------------------------------------------------------
+# NPCs
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class ShopEntry:
+    """An item a merchant sells (stock -1 = unlimited)"""
+    item_id: str
+    price: int
+    stock: int = -1
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class MerchantData:
+    """Merchant configuration of an NPC"""
+    is_merchant: bool = False
+    shop_inventory: Tuple[ShopEntry, ...] = ()
+    discount_conditions: FrozenMapping = field(default_factory=_empty_mapping)
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class NPC:
+    """An NPC template (data/genres/<genre>/npcs/)"""
+    npc_id: str
+    name: str
+    title: str = ""
+    description: str = ""
+    portrait_ascii: Tuple[str, ...] = ()
+    personality: FrozenMapping = field(default_factory=_empty_mapping)
+    stats: IntMapping = field(default_factory=_empty_mapping)
+    faction_affiliations: IntMapping = field(default_factory=_empty_mapping)
+    merchant_data: MerchantData = field(default_factory=MerchantData)
+    dialogue_trees: StrMapping = field(default_factory=_empty_mapping)
+    relationship_tracker: FrozenMapping = field(default_factory=_empty_mapping)
+    ambient_dialogue: Tuple[str, ...] = ()
+
+
+# ---------------------------------------------------------------------------
+# Enemies
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class EnemyStats:
+    """Combat stats of an enemy template"""
+    hp_max: int
+    level: int = 1
+    hp_current: Optional[int] = None
+    armor: int = 0
+    evasion: int = 10
+    strength: int = 10
+    dexterity: int = 10
+    intelligence: int = 10
+    charisma: int = 10
+    luck: int = 10
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class Attack:
+    """An attack an enemy can use"""
+    attack_id: str
+    name: str
+    damage_dice: str
+    type: str = "melee"
+    hit_bonus: int = 0
+    cooldown: int = 0
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class LootEntry:
+    """A loot table row (chance only applies to random drops)"""
+    item_id: str
+    quantity: int = 1
+    chance: float = 1.0
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class LootTable:
+    """Items dropped by an enemy"""
+    guaranteed: Tuple[LootEntry, ...] = ()
+    random: Tuple[LootEntry, ...] = ()
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class Enemy:
+    """An enemy template (data/genres/<genre>/enemies/)"""
+    enemy_id: str
+    name: str
+    stats: EnemyStats
+    type: str = ""
+    danger_level: int = 0
+    description: str = ""
+    combat_behavior: FrozenMapping = field(default_factory=_empty_mapping)
+    attacks: Tuple[Attack, ...] = ()
+    loot_table: LootTable = field(default_factory=LootTable)
+    xp_reward: int = 0
+    dialogue: FrozenMapping = field(default_factory=_empty_mapping)
+    tutorial_notes: FrozenMapping = field(default_factory=_empty_mapping)
+    personality: FrozenMapping = field(default_factory=_empty_mapping)
+
+
+# ---------------------------------------------------------------------------
+# Items and dialogue
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class ItemStats:
+    """Inventory stats of an item"""
+    weight: float = 0.0
+    value: int = 0
+    rarity: str = "common"
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class Item:
+    """An item template (data/genres/<genre>/items/)"""
+    item_id: str
+    name: str
+    type: str = ""
+    description: str = ""
+    icon: str = ""
+    stats: ItemStats = field(default_factory=ItemStats)
+    effect: FrozenMapping = field(default_factory=_empty_mapping)
+    usage: FrozenMapping = field(default_factory=_empty_mapping)
+    lore: FrozenMapping = field(default_factory=_empty_mapping)
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class DialogueTree:
+    """A conversation tree (data/genres/<genre>/dialogues/)"""
+    dialogue_id: str
+    speaker_npc_id: Optional[str] = None
+    title: str = ""
+    nodes: Tuple[FrozenMapping, ...] = ()
+
+
+# Content folder -> model type
+MODEL_TYPES: Dict[str, Type] = {
+    LOCATIONS: Location,
+    NPCS: NPC,
+    ENEMIES: Enemy,
+    ITEMS: Item,
+    DIALOGUES: DialogueTree,
+}
+
+_ADAPTERS: Dict[str, TypeAdapter] = {
+    kind: TypeAdapter(model) for kind, model in MODEL_TYPES.items()
+}
+
+
+def compile_record(kind: str, data: dict) -> Any:
+    """
+    Validate a JSON record and compile it into its model type
+
+    Args:
+        kind: Content folder (e.g., "enemies")
+        data: Parsed record
+
+    Returns:
+        Frozen model instance
+
+    Raises:
+        KeyError: If the kind has no model
+        pydantic.ValidationError: If the record doesn't match its schema
+    """
+    return _ADAPTERS[kind].validate_python(data)
@@ -0,0 +1,99 @@
+"""
+Content References - Find the content IDs a record links to
+"""
+
+from collections.abc import Mapping
+from typing import Any, Iterable, List, Optional, Tuple
+
+# Content folder names under data/genres/<genre>/
+LOCATIONS = "locations"
+NPCS = "npcs"
+ENEMIES = "enemies"
+ITEMS = "items"
+DIALOGUES = "dialogues"
+
+CONTENT_KINDS = (LOCATIONS, NPCS, ENEMIES, ITEMS, DIALOGUES)
+
+Reference = Tuple[str, str]  # (kind, content_id)
+
+
+def _item_ids(entries: Optional[Iterable[Any]]) -> List[Reference]:
+    """References from a list of item IDs or {"item_id": ...} dicts"""
+    refs = []
+    for entry in entries or []:
+        item_id = entry.get("item_id") if isinstance(entry, Mapping) else entry
+        if item_id:
+            refs.append((ITEMS, item_id))
+    return refs
+
+
+def _location_references(data: dict) -> List[Reference]:
+    refs: List[Reference] = []
+
+    for exit_data in (data.get("exits") or {}).values():
+        if exit_data.get("target"):
+            refs.append((LOCATIONS, exit_data["target"]))
+
+    for npc in data.get("npcs") or []:
+        if npc.get("npc_id"):
+            refs.append((NPCS, npc["npc_id"]))
+        if npc.get("dialogue_tree"):
+            refs.append((DIALOGUES, npc["dialogue_tree"]))
+
+    for encounter in data.get("encounters") or []:
+        for group in encounter.get("enemy_groups") or []:
+            refs.extend((ENEMIES, enemy_id) for enemy_id in group.get("enemies") or [])
+        on_victory = encounter.get("on_victory") or {}
+        refs.extend(_item_ids(on_victory.get("items")))
+        if on_victory.get("dialogue_continuation"):
+            refs.append((DIALOGUES, on_victory["dialogue_continuation"]))
+
+    for obj in data.get("objects") or []:
+        for action in (obj.get("actions") or {}).values():
+            refs.extend(_item_ids((action.get("first_time_reward") or {}).get("items")))
+
+    return refs
+
+
+def _npc_references(data: dict) -> List[Reference]:
+    refs = _item_ids((data.get("merchant_data") or {}).get("shop_inventory"))
+    refs.extend((DIALOGUES, tree_id) for tree_id in (data.get("dialogue_trees") or {}).values())
+    return refs
+
+
+def _enemy_references(data: dict) -> List[Reference]:
+    loot_table = data.get("loot_table") or {}
+    return _item_ids(loot_table.get("guaranteed")) + _item_ids(loot_table.get("random"))
+
+
+def _dialogue_references(data: dict) -> List[Reference]:
+    if data.get("speaker_npc_id"):
+        return [(NPCS, data["speaker_npc_id"])]
+    return []
+
+
+_EXTRACTORS = {
+    LOCATIONS: _location_references,
+    NPCS: _npc_references,
+    ENEMIES: _enemy_references,
+    DIALOGUES: _dialogue_references,
+}
+
+
+def extract_references(kind: str, data: dict) -> List[Reference]:
+    """
+    List every content ID a record links to, in document order
+
+    Args:
+        kind: Content folder of the record (e.g., "locations")
+        data: Parsed record
+
+    Returns:
+        (kind, content_id) pairs, possibly with duplicates
+
+    Example:
+        >>> extract_references("enemies", loader.load_enemy("cyberpunk", "street_thug_tutorial"))
+        [('items', 'credits_50'), ('items', 'cheap_stim'), ('items', 'switchblade')]
+    """
+    extractor = _EXTRACTORS.get(kind)
+    return extractor(data) if extractor else []
@@ -0,0 +1,317 @@
+"""
+Content Validation - Schema-check content files, skipping unchanged ones
+
+Every record is validated against its model (see src/data/models.py) and
+the result is stored in a local cache directory keyed by the SHA-256 of the
+file's bytes. On later runs a file whose content hash already has a result
+is not parsed or validated again, and a file whose size and mtime haven't
+changed isn't even re-hashed. Validating the whole tree after a one-file
+edit only does real work for that file.
+
+Cached results are tied to a schema fingerprint (a hash of the model and
+validation source), so editing a schema invalidates them automatically.
+
+Usage:
+    python -m src.data.validation                 # every genre
+    python -m src.data.validation cyberpunk --no-cache
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import ValidationError
+
+from . import models
+from .models import compile_record
+from .references import CONTENT_KINDS, DIALOGUES, ENEMIES, ITEMS, LOCATIONS, NPCS
+
+CACHE_VERSION = 1
+CACHE_FILE = "validation.json"
+
+# Field that must match the record's filename
+ID_FIELDS = {
+    LOCATIONS: "location_id",
+    NPCS: "npc_id",
+    ENEMIES: "enemy_id",
+    ITEMS: "item_id",
+    DIALOGUES: "dialogue_id",
+}
+
+
+def default_cache_dir(data_dir: Path) -> Path:
+    """Validation cache directory for a data folder (e.g., data/.cache)"""
+    return data_dir / ".cache"
+
+
+def _schema_fingerprint() -> str:
+    """Hash of the code that defines what 'valid' means"""
+    digest = hashlib.sha256(f"{CACHE_VERSION}\0".encode("utf-8"))
+    for source in (models.__file__, __file__):
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()
+
+
+def check_record(kind: str, record_id: str, raw: bytes) -> List[str]:
+    """
+    Validate one serialized record
+
+    Args:
+        kind: Content folder (e.g., "npcs"), or "" for genre-level files
+        record_id: Filename without .json
+        raw: File contents
+
+    Returns:
+        Error messages (empty if the record is valid)
+    """
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        return [f"Invalid JSON: {e}"]
+
+    if kind not in CONTENT_KINDS:
+        return []  # Genre-level files (factions.json) have no schema yet
+
+    if not isinstance(data, dict):
+        return ["Record must be a JSON object"]
+
+    errors = []
+    id_field = ID_FIELDS[kind]
+    if data.get(id_field) != record_id:
+        errors.append(f"{id_field} {data.get(id_field)!r} doesn't match filename {record_id!r}")
+
+    try:
+        compile_record(kind, data)
+    except ValidationError as e:
+        errors.extend(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        )
+    return errors
+
+
+@dataclass
+class ValidationResult:
+    """
+    Outcome of validating one file
+
+    Attributes:
+        path: File path relative to the data folder
+        kind: Content folder, or "" for genre-level files
+        errors: Error messages (empty if valid)
+        cached: True if the result came from the cache
+    """
+    path: str
+    kind: str
+    errors: List[str] = field(default_factory=list)
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class ValidationReport:
+    """Results of one validation run"""
+    results: List[ValidationResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    @property
+    def failures(self) -> List[ValidationResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def validated(self) -> int:
+        """Files actually parsed and validated in this run"""
+        return sum(1 for result in self.results if not result.cached)
+
+    @property
+    def skipped(self) -> int:
+        """Files whose result was reused from the cache"""
+        return sum(1 for result in self.results if result.cached)
+
+
+class ContentValidator:
+    """
+    Validates content files with a content-hash-keyed result cache
+
+    Example:
+        validator = ContentValidator(Path("data"))
+        report = validator.validate()
+        for failure in report.failures:
+            print(failure.path, failure.errors)
+    """
+
+    def __init__(self, data_dir: Path, cache_dir: Optional[Path] = None, use_cache: bool = True):
+        """
+        Initialize validator
+
+        Args:
+            data_dir: Root data directory (e.g., Path("data"))
+            cache_dir: Where results are stored (defaults to data/.cache)
+            use_cache: Set False to validate everything and leave the cache alone
+        """
+        self.data_dir = data_dir
+        self.cache_path = (cache_dir or default_cache_dir(data_dir)) / CACHE_FILE
+        self.use_cache = use_cache
+        self._schema = _schema_fingerprint()
+        self._results: Dict[str, List[str]] = {}  # "kind:id:content hash" -> errors
+        self._files: Dict[str, list] = {}  # relative path -> [mtime_ns, size, content hash]
+        self._dirty = False
+        if use_cache:
+            self._load_cache()
+
+    def _load_cache(self):
+        """Read cached results, ignoring a missing, corrupt or outdated cache"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get("schema") != self._schema:
+                return
+            self._results = cache["results"]
+            self._files = cache["files"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            self._results, self._files = {}, {}
+
+    def save(self):
+        """Write the cache atomically, if anything changed"""
+        if not (self.use_cache and self._dirty):
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {"schema": self._schema, "results": self._results, "files": self._files},
+                f, separators=(",", ":")
+            )
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    def validate_file(self, path: Path, kind: str) -> ValidationResult:
+        """
+        Validate one file, reusing a cached result when its content is unchanged
+
+        Args:
+            path: Content file
+            kind: Content folder, or "" for genre-level files
+        """
+        name = path.relative_to(self.data_dir).as_posix()
+        stat = path.stat()
+        known = self._files.get(name)
+
+        raw = None
+        if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+            content_hash = known[2]
+        else:
+            raw = path.read_bytes()
+            content_hash = hashlib.sha256(raw).hexdigest()
+
+        result_key = f"{kind}:{path.stem}:{content_hash}"
+        if self.use_cache and result_key in self._results:
+            if raw is not None:  # New, or touched - remember the new stat
+                self._files[name] = [stat.st_mtime_ns, stat.st_size, content_hash]
+                self._dirty = True
+            return ValidationResult(name, kind, list(self._results[result_key]), cached=True)
+
+        if raw is None:
+            raw = path.read_bytes()
+        errors = check_record(kind, path.stem, raw)
+
+        if self.use_cache:
+            self._results[result_key] = errors
+            self._files[name] = [stat.st_mtime_ns, stat.st_size, content_hash]
+            self._dirty = True
+        return ValidationResult(name, kind, errors)
+
+    def validate_genre(self, genre: str) -> ValidationReport:
+        """Validate every JSON file of a genre (without saving the cache)"""
+        genre_dir = self.data_dir / "genres" / genre
+        report = ValidationReport()
+        for path in sorted(genre_dir.rglob("*.json")):
+            relative = path.relative_to(genre_dir)
+            kind = relative.parts[0] if len(relative.parts) > 1 else ""
+            report.results.append(self.validate_file(path, kind))
+        return report
+
+    def validate(self, genres: Optional[List[str]] = None) -> ValidationReport:
+        """
+        Validate genres and save the cache
+
+        Args:
+            genres: Genre folders (defaults to every genre)
+
+        Returns:
+            Combined report
+        """
+        if genres is None:
+            genres = sorted(
+                path.name for path in (self.data_dir / "genres").iterdir() if path.is_dir()
+            )
+
+        report = ValidationReport()
+        for genre in genres:
+            report.results.extend(self.validate_genre(genre).results)
+
+        # Forget files that no longer exist so the cache doesn't grow forever
+        seen = {result.path for result in report.results}
+        prefixes = tuple(f"genres/{genre}/" for genre in genres)
+        stale = [name for name in self._files if name.startswith(prefixes) and name not in seen]
+        if stale:
+            for name in stale:
+                del self._files[name]
+            live_hashes = {entry[2] for entry in self._files.values()}
+            self._results = {
+                key: errors for key, errors in self._results.items()
+                if key.rpartition(":")[2] in live_hashes
+            }
+            self._dirty = True
+
+        self.save()
+        return report
+
+
+def validate_content(
+    data_dir: Path,
+    genres: Optional[List[str]] = None,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True
+) -> ValidationReport:
+    """
+    Validate content files (see ContentValidator)
+
+    Example:
+        report = validate_content(Path("data"))
+        if not report.ok:
+            ...
+    """
+    return ContentValidator(data_dir, cache_dir, use_cache).validate(genres)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate game content against its schemas")
+    parser.add_argument("genres", nargs="*", help="Genre folders (default: all)")
+    parser.add_argument("--data-dir", type=Path, default=Path("data"))
+    parser.add_argument("--no-cache", action="store_true", help="Revalidate every file")
+    args = parser.parse_args(argv)
+
+    report = validate_content(args.data_dir, args.genres or None, use_cache=not args.no_cache)
+    for failure in report.failures:
+        print(f"❌ {failure.path}")
+        for error in failure.errors:
+            print(f"      {error}")
+    print(f"✅ {len(report.results)} files, {report.validated} validated, "
+          f"{report.skipped} unchanged, {len(report.failures)} invalid")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
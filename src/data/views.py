@@ -0,0 +1,275 @@
+"""
+Content Views - Immutable cached content and copy-on-write instances
+
+The loader parses every record straight into read-only structures (mapping
+proxies and tuples), so the object in the cache can be handed out directly:
+no defensive copy, and no way for one system to corrupt a template that
+every later spawn reads.
+
+Systems that need to change a record (an enemy's HP, a merchant's stock)
+call instantiate(), which wraps the template in an overlay. Only the fields
+that are written are stored on the instance; everything else is read
+through from the shared template.
+
+Example:
+    template = loader.load_enemy("cyberpunk", "street_thug_tutorial")
+    ricky = instantiate(template)
+    ricky["stats"]["hp_current"] -= 7
+    ricky.changes()     # {"stats": {"hp_current": 23}}
+    template["stats"]["hp_current"]  # still 30
+"""
+
+import json
+from collections.abc import Mapping, MutableMapping, MutableSequence
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+def _freeze_list(items: list) -> tuple:
+    return tuple(_freeze_list(item) if type(item) is list else item for item in items)
+
+
+def _freeze_object(data: dict) -> Mapping:
+    """json object_hook: runs bottom-up, so nested objects are already frozen"""
+    for key, value in data.items():
+        if type(value) is list:
+            data[key] = _freeze_list(value)
+    return MappingProxyType(data)
+
+
+def loads_frozen(raw: Union[str, bytes]) -> Any:
+    """
+    Parse JSON directly into read-only mappings and tuples
+
+    Cheaper than parsing and then calling freeze(), since objects are
+    wrapped while the parser builds them.
+    """
+    return json.loads(raw, object_hook=_freeze_object)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples
+
+    Args:
+        value: Parsed JSON value
+
+    Returns:
+        Equivalent immutable structure
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Recursively convert read-only content (or instances) to plain dicts and lists
+
+    Use this before serializing or when a full mutable copy is really needed.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (tuple, list, InstanceList)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _overlay(value: Any) -> Any:
+    """Wrap nested containers in overlays, pass scalars and overlays through"""
+    if isinstance(value, (Instance, InstanceList)):
+        return value
+    if isinstance(value, Mapping):
+        return Instance(value)
+    if isinstance(value, (tuple, list)):
+        return InstanceList(value)
+    return value
+
+
+class Instance(MutableMapping):
+    """
+    Mutable, copy-on-write overlay over a read-only content mapping
+
+    Reads fall through to the template. Writes, and nested overlays created
+    on first access to a nested container, are kept on the instance.
+    """
+
+    __slots__ = ("_template", "_overrides", "_children", "_deleted")
+
+    def __init__(self, template: Mapping):
+        self._template = template
+        self._overrides: Dict[str, Any] = {}
+        self._children: Dict[str, Any] = {}  # Lazily created nested overlays
+        self._deleted: Optional[set] = None
+
+    @property
+    def template(self) -> Mapping:
+        """The shared read-only record this instance overlays"""
+        return self._template
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._overrides:
+            return self._overrides[key]
+        if key in self._children:
+            return self._children[key]
+        if self._deleted and key in self._deleted:
+            raise KeyError(key)
+
+        value = self._template[key]
+        child = _overlay(value)
+        if child is not value:
+            self._children[key] = child
+        return child
+
+    def __setitem__(self, key: str, value: Any):
+        self._overrides[key] = value
+        self._children.pop(key, None)
+        if self._deleted:
+            self._deleted.discard(key)
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        self._overrides.pop(key, None)
+        self._children.pop(key, None)
+        if key in self._template:
+            if self._deleted is None:
+                self._deleted = set()
+            self._deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._overrides:
+            return True
+        if self._deleted and key in self._deleted:
+            return False
+        return key in self._template
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._template:
+            if not (self._deleted and key in self._deleted):
+                yield key
+        for key in self._overrides:
+            if key not in self._template:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"Instance({self.changes()!r})"
+
+    def changes(self) -> Dict[str, Any]:
+        """
+        Fields that differ from the template
+
+        Returns:
+            Nested dict of written values (deleted keys map to None)
+        """
+        changes = {key: thaw(value) for key, value in self._overrides.items()}
+        for key, child in self._children.items():
+            child_changes = child.changes()
+            if child_changes:
+                changes[key] = child_changes
+        for key in self._deleted or ():
+            changes[key] = None
+        return changes
+
+    def to_dict(self) -> dict:
+        """Fully materialized plain dict (template plus changes)"""
+        return thaw(self)
+
+
+class InstanceList(MutableSequence):
+    """
+    Copy-on-write overlay over a read-only content tuple
+
+    Element access wraps nested containers in overlays without copying.
+    The tuple is only copied into a list on the first structural change
+    (assignment, insert, delete).
+    """
+
+    __slots__ = ("_template", "_items", "_children")
+
+    def __init__(self, template: Union[tuple, list]):
+        self._template = template
+        self._items: Optional[List[Any]] = None  # Materialized on first write
+        self._children: Dict[int, Any] = {}
+
+    def _materialize(self) -> List[Any]:
+        if self._items is None:
+            self._items = [self._children.get(i, value) for i, value in enumerate(self._template)]
+            self._children = {}
+        return self._items
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if self._items is not None:
+            value = self._items[index]
+            child = _overlay(value)
+            if child is not value:
+                self._items[index] = child
+            return child
+
+        index = range(len(self._template))[index]  # Normalize negatives, raise IndexError
+        if index in self._children:
+            return self._children[index]
+        value = self._template[index]
+        child = _overlay(value)
+        if child is not value:
+            self._children[index] = child
+        return child
+
+    def __setitem__(self, index, value):
+        self._materialize()[index] = value
+
+    def __delitem__(self, index):
+        del self._materialize()[index]
+
+    def insert(self, index: int, value: Any):
+        self._materialize().insert(index, value)
+
+    def __len__(self) -> int:
+        return len(self._template) if self._items is None else len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (tuple, list, InstanceList)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    def __repr__(self) -> str:
+        return f"InstanceList({thaw(self)!r})"
+
+    def changes(self) -> Any:
+        """Whole list if it was restructured, else {index: changes} of edited elements"""
+        if self._items is not None:
+            return thaw(self._items)
+        changes = {}
+        for index, child in self._children.items():
+            child_changes = child.changes()
+            if child_changes:
+                changes[index] = child_changes
+        return changes
+
+
+def instantiate(template: Mapping) -> Instance:
+    """
+    Create a mutable, copy-on-write instance of a cached content record
+
+    Costs one small object regardless of record size; nested overlays are
+    created only for the containers that are actually accessed.
+
+    Args:
+        template: Read-only record from DataLoader (e.g., load_enemy)
+
+    Returns:
+        Instance overlay
+
+    Example:
+        medkit_stock = instantiate(loader.load_npc("cyberpunk", "bartender_tom"))
+        medkit_stock["merchant_data"]["shop_inventory"][1]["stock"] -= 1
+    """
+    return Instance(template)
@@ -3,8 +3,13 @@ Game entities - Player, NPCs, Enemies, Items
 """
 
 from .player import Player, PlayerStats
+from .enemy import EnemySquad, EnemyUnit, StatusEffect, spawn_encounter
 
 __all__ = [
     "Player",
     "PlayerStats",
+    "EnemySquad",
+    "EnemyUnit",
+    "StatusEffect",
+    "spawn_encounter",
 ]
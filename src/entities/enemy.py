@@ -0,0 +1,247 @@
+"""
+Enemy Entity - Flyweight runtime enemies for encounter groups
+"""
+
+from array import array
+from enum import IntFlag
+from typing import Iterator, List, Mapping, Optional, Sequence
+
+from src.data.models import Enemy as EnemyTemplate
+
+
+class StatusEffect(IntFlag):
+    """Status effects an enemy can be under (stored as a bitmask per enemy)"""
+    NONE = 0
+    STUNNED = 1
+    BLEEDING = 2
+    POISONED = 4
+    DEFENDING = 8
+    SURRENDERED = 16
+
+
+class EnemySquad:
+    """
+    A group of enemies spawned from one shared template
+
+    The template (description, attacks, loot table, dialogue...) is stored
+    once. Per-enemy state lives in parallel typed arrays - HP, position and
+    a status bitmask - so spawning 100 enemies costs a few hundred bytes on
+    top of spawning one.
+
+    Attributes:
+        template: Compiled enemy template shared by every member
+        hp: Current HP per enemy
+        position: Position slot per enemy (e.g., row or range band)
+        status: StatusEffect bitmask per enemy
+
+    Example:
+        template = loader.load_enemy_model("cyberpunk", "street_thug_tutorial")
+        thugs = EnemySquad(template, count=3)
+        thugs[0].take_damage(12)
+        living = thugs.alive_indices()
+    """
+
+    __slots__ = ("template", "hp", "position", "status")
+
+    def __init__(
+        self,
+        template: EnemyTemplate,
+        count: int = 1,
+        positions: Optional[Sequence[int]] = None
+    ):
+        """
+        Spawn a squad
+
+        Args:
+            template: Compiled enemy template (DataLoader.load_enemy_model)
+            count: Number of enemies
+            positions: Starting position per enemy (defaults to 0, 1, 2, ...)
+        """
+        if positions is not None and len(positions) != count:
+            raise ValueError(f"Expected {count} positions, got {len(positions)}")
+
+        stats = template.stats
+        start_hp = stats.hp_current if stats.hp_current is not None else stats.hp_max
+
+        self.template = template
+        self.hp = array('i', [start_hp]) * count
+        self.position = array('h', positions if positions is not None else range(count))
+        self.status = array('I', [StatusEffect.NONE]) * count
+
+    def __len__(self) -> int:
+        return len(self.hp)
+
+    def __getitem__(self, index: int) -> 'EnemyUnit':
+        if not -len(self.hp) <= index < len(self.hp):
+            raise IndexError(f"Enemy index out of range: {index}")
+        return EnemyUnit(self, index % len(self.hp))
+
+    def __iter__(self) -> Iterator['EnemyUnit']:
+        return (EnemyUnit(self, i) for i in range(len(self.hp)))
+
+    def is_alive(self, index: int) -> bool:
+        """Check if an enemy has HP left"""
+        return self.hp[index] > 0
+
+    def alive_indices(self) -> List[int]:
+        """Indices of enemies still standing"""
+        return [i for i, hp in enumerate(self.hp) if hp > 0]
+
+    def is_defeated(self) -> bool:
+        """Check if every enemy is down"""
+        return not any(hp > 0 for hp in self.hp)
+
+    def take_damage(self, index: int, amount: int) -> int:
+        """
+        Damage one enemy
+
+        Args:
+            index: Enemy index
+            amount: Damage amount
+
+        Returns:
+            Actual damage taken (can't go below 0 HP)
+        """
+        old_hp = self.hp[index]
+        self.hp[index] = max(0, old_hp - amount)
+        return old_hp - self.hp[index]
+
+    def heal(self, index: int, amount: int) -> int:
+        """
+        Heal one enemy
+
+        Returns:
+            Actual HP healed (can't exceed the template's hp_max)
+        """
+        old_hp = self.hp[index]
+        self.hp[index] = min(self.template.stats.hp_max, old_hp + amount)
+        return self.hp[index] - old_hp
+
+    def add_status(self, index: int, effect: StatusEffect):
+        """Apply a status effect to one enemy"""
+        self.status[index] |= effect
+
+    def remove_status(self, index: int, effect: StatusEffect):
+        """Clear a status effect from one enemy"""
+        self.status[index] &= ~effect
+
+    def has_status(self, index: int, effect: StatusEffect) -> bool:
+        """Check if one enemy is under a status effect"""
+        return bool(self.status[index] & effect)
+
+    def to_dict(self) -> dict:
+        """Serialize per-enemy state (the template is referenced by ID)"""
+        return {
+            "enemy_id": self.template.enemy_id,
+            "hp": self.hp.tolist(),
+            "position": self.position.tolist(),
+            "status": self.status.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, template: EnemyTemplate) -> 'EnemySquad':
+        """
+        Deserialize per-enemy state onto its template
+
+        Args:
+            data: Output of to_dict()
+            template: Compiled template for data["enemy_id"]
+        """
+        squad = cls(template, count=len(data["hp"]), positions=data["position"])
+        squad.hp = array('i', data["hp"])
+        squad.status = array('I', data["status"])
+        return squad
+
+
+class EnemyUnit:
+    """
+    Lightweight handle to one member of an EnemySquad
+
+    Handles hold no state of their own; they're created on access and
+    read through to the squad's arrays and the shared template.
+    """
+
+    __slots__ = ("squad", "index")
+
+    def __init__(self, squad: EnemySquad, index: int):
+        self.squad = squad
+        self.index = index
+
+    @property
+    def template(self) -> EnemyTemplate:
+        return self.squad.template
+
+    @property
+    def name(self) -> str:
+        return self.squad.template.name
+
+    @property
+    def hp_max(self) -> int:
+        return self.squad.template.stats.hp_max
+
+    @property
+    def hp_current(self) -> int:
+        return self.squad.hp[self.index]
+
+    @hp_current.setter
+    def hp_current(self, value: int):
+        self.squad.hp[self.index] = max(0, min(self.hp_max, value))
+
+    @property
+    def position(self) -> int:
+        return self.squad.position[self.index]
+
+    @position.setter
+    def position(self, value: int):
+        self.squad.position[self.index] = value
+
+    @property
+    def status(self) -> StatusEffect:
+        return StatusEffect(self.squad.status[self.index])
+
+    def take_damage(self, amount: int) -> int:
+        """Take damage (see EnemySquad.take_damage)"""
+        return self.squad.take_damage(self.index, amount)
+
+    def heal(self, amount: int) -> int:
+        """Heal (see EnemySquad.heal)"""
+        return self.squad.heal(self.index, amount)
+
+    def is_alive(self) -> bool:
+        """Check if this enemy has HP left"""
+        return self.squad.hp[self.index] > 0
+
+    def __repr__(self) -> str:
+        return f"EnemyUnit({self.name!r}, hp={self.hp_current}/{self.hp_max})"
+
+
+def spawn_encounter(loader, genre: str, encounter) -> List[EnemySquad]:
+    """
+    Spawn every enemy group of a location encounter
+
+    Each enemy ID in a group becomes one squad of the group's count, all
+    sharing the loader's cached template.
+
+    Args:
+        loader: DataLoader
+        genre: Genre folder
+        encounter: Encounter from a location (compiled model or raw mapping)
+
+    Returns:
+        One EnemySquad per (group, enemy ID)
+
+    Example:
+        tavern = loader.load_location_model("cyberpunk", "golden_drake_tavern")
+        squads = spawn_encounter(loader, "cyberpunk", tavern.encounters[0])
+    """
+    groups = encounter["enemy_groups"] if isinstance(encounter, Mapping) else encounter.enemy_groups
+
+    squads = []
+    for group in groups:
+        if isinstance(group, Mapping):
+            enemy_ids, count = group.get("enemies", ()), group.get("count", 1)
+        else:
+            enemy_ids, count = group.enemies, group.count
+        for enemy_id in enemy_ids:
+            squads.append(EnemySquad(loader.load_enemy_model(genre, enemy_id), count))
+    return squads
@@ -234,7 +234,8 @@ class Player:
         self.stamina_max += 3
         self.stamina_current = self.stamina_max
 
-        print(f"🎉 LEVEL UP! You are now level {self.level}!")
+        from src.core.session import notify
+        notify(f"🎉 LEVEL UP! You are now level {self.level}!")
 
     def add_item(self, item_id: str):
         """Add item to inventory"""
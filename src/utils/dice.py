@@ -1,34 +1,67 @@
 """
 Dice Rolling System - D&D style mechanics
+
+Every roll draws from the session RNG. Seeding it (seed) or swapping it
+(set_rng, as the session recorder does) makes a session reproducible.
+
+The RNG lives in a context variable, so each GameSession (see
+src/core/session.py) rolls its own dice; outside any session, rolls share
+one process-wide RNG. New threads start from that process-wide RNG.
 """
 
 import random
-from typing import Tuple
+from contextvars import ContextVar
+from typing import Optional, Tuple
+
+_default_rng = random.Random()  # Used outside any session
+_rng: ContextVar[Optional[random.Random]] = ContextVar("dice_rng", default=None)
+
+
+def seed(value: int):
+    """Seed the session RNG (e.g., with GameState.seed)"""
+    get_rng().seed(value)
+
+
+def get_rng() -> random.Random:
+    """The session RNG"""
+    return _rng.get() or _default_rng
+
+
+def set_rng(rng: random.Random) -> random.Random:
+    """
+    Replace the session RNG (in the current context)
+
+    Returns:
+        The previous RNG (to restore it later)
+    """
+    previous = get_rng()
+    _rng.set(rng)
+    return previous
 
 
 def d4() -> int:
     """Roll a 4-sided die"""
-    return random.randint(1, 4)
+    return get_rng().randint(1, 4)
 
 
 def d6() -> int:
     """Roll a 6-sided die"""
-    return random.randint(1, 6)
+    return get_rng().randint(1, 6)
 
 
 def d8() -> int:
     """Roll an 8-sided die"""
-    return random.randint(1, 8)
+    return get_rng().randint(1, 8)
 
 
 def d10() -> int:
     """Roll a 10-sided die"""
-    return random.randint(1, 10)
+    return get_rng().randint(1, 10)
 
 
 def d12() -> int:
     """Roll a 12-sided die"""
-    return random.randint(1, 12)
+    return get_rng().randint(1, 12)
 
 
 def d20() -> int:
@@ -38,12 +71,12 @@ def d20() -> int:
     Returns:
         Random integer 1-20
     """
-    return random.randint(1, 20)
+    return get_rng().randint(1, 20)
 
 
 def d100() -> int:
     """Roll percentile dice (1-100)"""
-    return random.randint(1, 100)
+    return get_rng().randint(1, 100)
 
 
 def roll_dice(dice_notation: str) -> int:
@@ -67,6 +100,14 @@ def roll_dice(dice_notation: str) -> int:
     Raises:
         ValueError: If notation is invalid
     """
+    count, sides, modifier = _parse_notation(dice_notation)
+    rng = get_rng()
+    total = sum(rng.randint(1, sides) for _ in range(count))
+    return total + modifier
+
+
+def _parse_notation(dice_notation: str) -> Tuple[int, int, int]:
+    """Split dice notation into (count, sides, modifier)"""
     dice_notation = dice_notation.strip().lower()
 
     # Parse modifier
@@ -89,10 +130,7 @@ def roll_dice(dice_notation: str) -> int:
     count_str, sides_str = dice_part.split('d')
     count = int(count_str) if count_str else 1
     sides = int(sides_str)
-
-    # Roll
-    total = sum(random.randint(1, sides) for _ in range(count))
-    return total + modifier
+    return count, sides, modifier
 
 
 def advantage() -> Tuple[int, int, int]:
@@ -210,3 +248,152 @@ def damage_roll(dice_notation: str, critical: bool = False) -> int:
         damage -= modifier
 
     return damage
+
+
+# Batch rolls (NumPy, optional: pip install 'the-nerve[sim]')
+#
+# For balancing and simulation tooling: millions of rolls per call, returned
+# as NumPy arrays. Batches draw from the session RNG and give exactly the
+# rolls the scalar functions would - roll_dice_batch("2d6+3", n) equals
+# [roll_dice("2d6+3") for _ in range(n)] under the same seed - and leave the
+# RNG where those scalar rolls would have, so both can be mixed freely.
+# Draws are taken from the RNG's state directly, so RNG subclasses that
+# observe draws (like the session recorder's) don't see them.
+#
+# This works because random.Random and NumPy's MT19937 are the same
+# Mersenne Twister: the session RNG's state is copied into MT19937, and
+# random.Random's rejection sampling for randint (top bits of one 32-bit
+# word, redrawn while out of range) is replayed on whole arrays of words.
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Batch dice need NumPy: pip install 'the-nerve[sim]'") from None
+    return numpy
+
+
+def _below_batch(n: int, size: int):
+    """
+    Draw size values in [0, n) from the session RNG, as _randbelow(n) would
+
+    Returns:
+        int64 array of the values, in draw order
+    """
+    np = _numpy()
+    if not 0 < n < 2 ** 32:
+        raise ValueError(f"Batch dice need 1 to {2 ** 32 - 1} sides, got {n}")
+
+    rng = get_rng()
+    version, internal, gauss_next = rng.getstate()
+    bit_generator = np.random.MT19937()
+    bit_generator.state = {
+        "bit_generator": "MT19937",
+        "state": {"key": np.array(internal[:-1], dtype=np.uint32), "pos": internal[-1]},
+    }
+
+    k = n.bit_length()
+    chunks = []
+    missing = size
+    while missing > 0:
+        before = bit_generator.state
+        words = bit_generator.random_raw(int(missing * (1 << k) / n) + 64) >> (32 - k)
+        accepted = np.flatnonzero(words < n)
+        if len(accepted) >= missing:
+            # Only consume the words up to the last one used
+            bit_generator.state = before
+            bit_generator.random_raw(int(accepted[missing - 1]) + 1)
+            accepted = accepted[:missing]
+        chunks.append(words[accepted])
+        missing -= len(accepted)
+
+    state = bit_generator.state["state"]
+    rng.setstate((version, tuple(state["key"].tolist()) + (int(state["pos"]),), gauss_next))
+    if not chunks:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(chunks).astype(np.int64)
+
+
+def _d20_batch(n: int, use_advantage: bool = False, use_disadvantage: bool = False):
+    """n d20 results, each the better/worse of two with (dis)advantage"""
+    if use_advantage or use_disadvantage:
+        pairs = _below_batch(20, 2 * n).reshape(n, 2) + 1
+        return pairs.max(axis=1) if use_advantage else pairs.min(axis=1)
+    return _below_batch(20, n) + 1
+
+
+def roll_dice_batch(dice_notation: str, n: int):
+    """
+    Roll dice notation n times (see roll_dice)
+
+    Args:
+        dice_notation: Dice string (e.g., "2d6+3")
+        n: Number of rolls
+
+    Returns:
+        int64 array of n totals
+
+    Raises:
+        ValueError: If notation is invalid
+        ImportError: If NumPy isn't installed
+
+    Example:
+        totals = roll_dice_batch("2d6+3", 1_000_000)
+        print(totals.mean())  # ~10.0
+    """
+    count, sides, modifier = _parse_notation(dice_notation)
+    faces = _below_batch(sides, n * count).reshape(n, count)
+    return faces.sum(axis=1) + (count + modifier)
+
+
+def skill_check_batch(
+    skill_value,
+    difficulty,
+    n: int,
+    use_advantage: bool = False,
+    use_disadvantage: bool = False
+):
+    """
+    Perform n skill checks (see skill_check)
+
+    Args:
+        skill_value: Bonus to add to each d20 roll (int or array of n)
+        difficulty: Target DC (int or array of n)
+        n: Number of checks
+        use_advantage: Roll 2d20, take higher
+        use_disadvantage: Roll 2d20, take lower
+
+    Returns:
+        (success, roll_result, total) arrays of n
+
+    Example:
+        success, _, _ = skill_check_batch(skill_value=5, difficulty=15, n=100_000)
+        print(f"Success rate: {success.mean():.1%}")
+    """
+    roll = _d20_batch(n, use_advantage, use_disadvantage)
+    total = roll + skill_value
+    return (total >= difficulty, roll, total)
+
+
+def damage_roll_batch(dice_notation: str, n: int, critical=False):
+    """
+    Roll damage n times, doubling dice on critical hits (see damage_roll)
+
+    Args:
+        dice_notation: Damage dice (e.g., "1d8+3")
+        n: Number of rolls
+        critical: Whether the hits are critical (bool, or bool array of n)
+
+    Returns:
+        int64 array of n damage totals
+    """
+    np = _numpy()
+    count, sides, modifier = _parse_notation(dice_notation)
+    dice = np.where(np.broadcast_to(np.asarray(critical, dtype=bool), (n,)), 2 * count, count)
+    faces = _below_batch(sides, int(dice.sum())) + 1
+
+    # Sum each roll's run of dice
+    running = np.concatenate(([0], np.cumsum(faces)))
+    ends = np.cumsum(dice)
+    return running[ends] - running[ends - dice] + modifier
@@ -5,6 +5,7 @@ Test script to validate all JSON data files
 
 from pathlib import Path
 from src.data.loader import DataLoader
+from src.data.validation import validate_content
 
 def main():
     """Test loading all JSON files"""
@@ -107,6 +108,17 @@ def main():
         print(f"   ❌ FAILED: {e}")
         print()
 
+    # Schema validation of every file (unchanged files are skipped via data/.cache)
+    print("🔍 Validating all content files...")
+    report = validate_content(Path("data"))
+    for failure in report.failures:
+        print(f"   ❌ {failure.path}")
+        for error in failure.errors:
+            print(f"      - {error}")
+    print(f"   ✅ {len(report.results) - len(report.failures)}/{len(report.results)} valid "
+          f"({report.validated} checked, {report.skipped} unchanged)")
+    print()
+
     # Cache stats
     print("📊 Cache Statistics:")
     stats = loader.get_cache_stats()
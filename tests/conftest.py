@@ -0,0 +1,48 @@
+"""Shared test fixtures"""
+
+import shutil
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pytest
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Writable copy of the shipped content"""
+    shutil.copytree(DATA_DIR / "genres", tmp_path / "genres")
+    return tmp_path
+
+
+@pytest.fixture
+def make_state():
+    """
+    Factory for save-ready game states: player "V" at a location, met_tom set
+
+    Call as make_state(location, flags={...}, choices=[...], visited=True,
+    **GameState fields).
+    """
+    from src.core.game_state import GameState
+    from src.entities.player import Player
+
+    def make(
+        location: str = "golden_drake_tavern",
+        flags: Optional[dict] = None,
+        choices: Iterable[str] = (),
+        visited: bool = False,
+        **fields
+    ) -> GameState:
+        state = GameState(current_location_id=location, **fields)
+        state.player = Player(name="V")
+        state.set_flag("met_tom")
+        for flag, value in (flags or {}).items():
+            state.set_flag(flag, value)
+        for choice in choices:
+            state.record_choice(choice)
+        if visited:
+            state.visited_locations.add(location)
+        return state
+
+    return make
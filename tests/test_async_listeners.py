@@ -0,0 +1,130 @@
+"""Tests for coroutine listeners and the listener error channel"""
+
+import asyncio
+import threading
+import warnings
+
+from src.core.event_dispatcher import Event, EventDispatcher, EventType, ListenerError
+
+
+def saved() -> Event:
+    return Event(EventType.SAVE_TRIGGERED, {"slot": "autosave"})
+
+
+def test_async_listeners_run_concurrently_within_limit():
+    dispatcher = EventDispatcher(max_concurrent=2)
+    running, peak, done = [0], [0], []
+
+    async def on_save(event: Event):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        done.append(event)
+
+    dispatcher.subscribe(EventType.SAVE_TRIGGERED, on_save)
+
+    async def main():
+        for _ in range(5):
+            dispatcher.publish(saved())  # Returns without waiting for on_save
+        assert done == [] and dispatcher.async_pending() == 5
+        await dispatcher.drain()
+
+    asyncio.run(main())
+    assert len(done) == 5
+    assert peak[0] == 2
+    assert dispatcher.async_pending() == 0
+
+
+def test_backlog_overflow_is_reported_and_apublish_waits():
+    dispatcher = EventDispatcher(max_concurrent=1, max_pending=2)
+    errors, done = [], []
+    dispatcher.add_error_handler(errors.append)
+
+    async def on_save(event: Event):
+        await asyncio.sleep(0.01)
+        done.append(event)
+
+    dispatcher.subscribe(EventType.SAVE_TRIGGERED, on_save)
+
+    async def main():
+        for _ in range(3):
+            dispatcher.publish(saved())
+        assert [error.kind for error in errors] == ["overflow"]
+
+        for _ in range(4):
+            await dispatcher.apublish(saved())  # Waits for room instead of dropping
+            assert dispatcher.async_pending() <= 2
+        await dispatcher.drain()
+
+    asyncio.run(main())
+    assert len(done) == 6
+    assert len(errors) == 1
+
+
+def test_errors_go_to_the_error_channel(capsys):
+    dispatcher = EventDispatcher()
+    errors = []
+    dispatcher.add_error_handler(errors.append)
+
+    def broken(event: Event):
+        raise ValueError("sync boom")
+
+    async def broken_async(event: Event):
+        raise KeyError("async boom")
+
+    dispatcher.subscribe(EventType.SAVE_TRIGGERED, broken)
+    dispatcher.subscribe(EventType.SAVE_TRIGGERED, broken_async)
+
+    async def main():
+        dispatcher.publish(saved())
+        await dispatcher.drain()
+
+    asyncio.run(main())
+    assert [(type(e.error), e.is_async) for e in errors] == [(ValueError, False), (KeyError, True)]
+    assert all(isinstance(error, ListenerError) and error.event.type is EventType.SAVE_TRIGGERED
+               for error in errors)
+    assert list(dispatcher.recent_errors) == errors
+    assert capsys.readouterr().out == ""
+
+
+def test_async_listeners_without_a_loop_are_reported_not_run():
+    dispatcher = EventDispatcher()
+    errors, done = [], []
+    dispatcher.add_error_handler(errors.append)
+
+    async def on_save(event: Event):
+        done.append(event)
+
+    dispatcher.subscribe(EventType.SAVE_TRIGGERED, on_save)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # The dropped coroutine is closed, not left unawaited
+        dispatcher.publish(saved())
+
+    assert done == []
+    assert [(error.kind, error.is_async) for error in errors] == [("no_loop", True)]
+    assert dispatcher.async_pending() == 0
+
+
+def test_attached_loop_runs_listeners_published_from_other_threads():
+    dispatcher = EventDispatcher()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    dispatcher.attach_loop(loop)
+
+    ran = threading.Event()
+    listener_threads = []
+
+    async def on_save(event: Event):
+        listener_threads.append(threading.current_thread())
+        ran.set()
+
+    dispatcher.subscribe(EventType.SAVE_TRIGGERED, on_save)
+    dispatcher.publish(saved())
+    assert ran.wait(5)
+    assert listener_threads == [thread]
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
@@ -0,0 +1,64 @@
+"""Tests for the asyncio loading API"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.data.loader import DataLoader
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def test_aload_matches_sync_load():
+    loader = DataLoader(DATA_DIR)
+    tavern = asyncio.run(loader.aload_location("cyberpunk", "golden_drake_tavern"))
+
+    assert tavern is loader.load_location("cyberpunk", "golden_drake_tavern")
+    enemy = asyncio.run(loader.aload_enemy_model("cyberpunk", "street_thug_tutorial"))
+    assert enemy.stats.hp_max == 30
+    loader.close()
+
+
+def test_concurrent_loads_share_one_read():
+    loader = DataLoader(DATA_DIR)
+    reads = []
+    read_record = loader._read_record
+
+    def slow_read(*args, **kwargs):
+        reads.append(threading.get_ident())
+        time.sleep(0.05)
+        return read_record(*args, **kwargs)
+
+    loader._read_record = slow_read
+
+    async def load_many():
+        return await asyncio.gather(
+            *(loader.aload_npc("cyberpunk", "bartender_tom") for _ in range(5))
+        )
+
+    results = asyncio.run(load_many())
+    assert len(reads) == 1
+    assert all(result is results[0] for result in results)
+    assert not loader._inflight
+    loader.close()
+
+
+def test_aload_missing_record_raises():
+    loader = DataLoader(DATA_DIR)
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(loader.aload_item("cyberpunk", "no_such_item"))
+    loader.close()
+
+
+def test_agather_location_loads_dependency_set():
+    loader = DataLoader(DATA_DIR)
+    content = asyncio.run(loader.agather_location("cyberpunk", "golden_drake_tavern"))
+
+    assert ("locations", "golden_drake_tavern") in content
+    assert {("npcs", "bartender_tom"), ("dialogues", "dialogue_bartender_intro"),
+            ("enemies", "street_thug_tutorial"), ("items", "medkit_basic"),
+            ("items", "credits_50")} <= set(content)
+    loader.close()
@@ -0,0 +1,68 @@
+"""Tests for non-blocking background autosaves"""
+
+import threading
+
+from src.core.save_codecs import decode_save
+from src.core.save_manager import SaveManager
+
+
+def test_background_autosave_writes_snapshot(tmp_path, make_state):
+    saves = SaveManager(str(tmp_path), background=True)
+    state = make_state()
+    assert saves.autosave(state)
+
+    # Changes after the call are not part of the queued snapshot
+    state.set_flag("after_save")
+    state.record_choice("late_choice")
+    assert saves.flush(timeout=5)
+
+    data = decode_save(saves.autosave_path.read_bytes())
+    assert data["game_state"]["world_flags"] == {"met_tom": True}
+    assert data["game_state"]["choice_history"] == []
+    assert saves.close(timeout=5)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_burst_of_autosaves_is_coalesced(tmp_path, make_state):
+    saves = SaveManager(str(tmp_path), background=True)
+    started, release = threading.Event(), threading.Event()
+    writes = []
+    write_full = saves._write_full
+
+    def slow_write(slot_name, save_data):
+        writes.append(save_data["game_state"]["turn_count"])
+        started.set()
+        release.wait(5)
+        write_full(slot_name, save_data)
+
+    saves._write_full = slow_write
+    state = make_state()
+    saves.autosave(state)  # Picked up by the worker, blocks in slow_write
+    assert started.wait(5)
+
+    for turn in range(1, 6):
+        state.turn_count = turn
+        saves.autosave(state)
+    release.set()
+
+    assert saves.close(timeout=5)
+    assert writes == [0, 5]
+    assert saves.load_game("autosave").turn_count == 5
+
+
+def test_background_journaled_and_direct_save(tmp_path, make_state):
+    saves = SaveManager(str(tmp_path), journaled=True, background=True)
+    state = make_state()
+    for turn in range(3):
+        state.turn_count = turn
+        saves.autosave(state)
+        saves.flush(timeout=5)
+
+    state.turn_count = 10
+    saves.autosave(state)
+    state.turn_count = 11
+    saves.save_game(state, "autosave")  # Supersedes the queued background save
+    assert saves.close(timeout=5)
+
+    assert saves.load_game("autosave").turn_count == 11
+    assert not saves.autosave(state)  # Closed
@@ -0,0 +1,46 @@
+"""Tests for precompiled content bundles"""
+
+import pytest
+
+from src.data.bundle import ContentBundle, build_bundle, bundle_path
+from src.data.loader import DataLoader
+
+
+def test_bundle_contains_every_record(data_dir):
+    path = build_bundle(data_dir, "cyberpunk")
+    with ContentBundle(path) as bundle:
+        assert "locations/golden_drake_tavern" in bundle
+        assert "npcs/bartender_tom" in bundle
+        assert len(bundle) == len(list((data_dir / "genres" / "cyberpunk").rglob("*.json")))
+
+
+def test_bundled_loader_matches_loose_files(data_dir):
+    build_bundle(data_dir, "cyberpunk")
+    loose = DataLoader(data_dir)
+    bundled = DataLoader(data_dir, use_bundles=True)
+
+    assert bundled.load_location("cyberpunk", "golden_drake_tavern") == \
+        loose.load_location("cyberpunk", "golden_drake_tavern")
+    assert bundled.load_enemy("cyberpunk", "street_thug_tutorial") == \
+        loose.load_enemy("cyberpunk", "street_thug_tutorial")
+    bundled.close()
+
+
+def test_bundled_loader_falls_back_to_loose_files(data_dir):
+    build_bundle(data_dir, "cyberpunk")
+    (data_dir / "genres" / "cyberpunk" / "items" / "new_item.json").write_text(
+        '{"item_id": "new_item", "name": "New"}', encoding="utf-8"
+    )
+    loader = DataLoader(data_dir, use_bundles=True)
+
+    assert loader.load_item("cyberpunk", "new_item")["name"] == "New"
+    with pytest.raises(FileNotFoundError):
+        loader.load_item("cyberpunk", "missing_item")
+    loader.close()
+
+
+def test_rejects_non_bundle_file(data_dir):
+    path = bundle_path(data_dir, "cyberpunk")
+    path.write_bytes(b"not a bundle at all, just some bytes")
+    with pytest.raises(ValueError):
+        ContentBundle(path)
@@ -0,0 +1,87 @@
+"""Tests for the bounded content cache"""
+
+from pathlib import Path
+
+from src.data.cache import CachePolicy, ContentCache
+from src.data.loader import DataLoader
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def test_evicts_least_recently_used():
+    cache = ContentCache(CachePolicy(max_entries=2))
+    cache.put("a", {"id": "a"}, 10)
+    cache.put("b", {"id": "b"}, 10)
+    cache.get("a")
+    cache.put("c", {"id": "c"}, 10)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.evictions == 1
+    assert cache.resident_bytes == 20
+
+
+def test_byte_budget_and_pinning():
+    cache = ContentCache(CachePolicy(max_bytes=100))
+    cache.pin("hub")
+    cache.put("hub", {"id": "hub"}, 60)
+    cache.put("a", {"id": "a"}, 30)
+    cache.put("b", {"id": "b"}, 30)
+
+    assert "hub" in cache and "b" in cache
+    assert "a" not in cache
+    assert cache.resident_bytes == 90
+
+    cache.unpin("hub")
+    cache.put("c", {"id": "c"}, 30)
+    cache.put("d", {"id": "d"}, 30)
+    assert "hub" not in cache
+    assert cache.evictions == 3
+
+
+def test_loader_reports_cache_stats():
+    loader = DataLoader(DATA_DIR, cache_policy=CachePolicy(max_entries=2))
+    loader.pin_location("cyberpunk", "golden_drake_tavern")
+
+    loader.load_location("cyberpunk", "golden_drake_tavern")
+    loader.load_item("cyberpunk", "medkit_basic")
+    loader.load_item("cyberpunk", "credits_50")
+    loader.load_location("cyberpunk", "golden_drake_tavern")
+
+    stats = loader.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["pinned"] == 1
+    assert stats["cached_files"] == 2
+    assert stats["resident_bytes"] > 0
+
+
+def test_pin_hubs_policy():
+    loader = DataLoader(DATA_DIR, cache_policy=CachePolicy(max_entries=0, pin_hubs=True))
+    loader.load_location("cyberpunk", "golden_drake_tavern")
+    loader.load_npc("cyberpunk", "bartender_tom")
+
+    assert loader.get_cache_stats()["cached_files"] == 1
+
+
+def test_record_and_model_caches_have_their_own_policies():
+    loader = DataLoader(DATA_DIR, cache_policy=CachePolicy(max_entries=1))
+    loader.load_item_model("cyberpunk", "medkit_basic")
+    loader.load_item_model("cyberpunk", "medkit_basic")
+
+    models = loader.get_cache_stats()["models"]
+    assert (models["hits"], models["misses"], models["evictions"]) == (1, 1, 0)
+    assert models["entries"] == loader.get_cache_stats()["compiled_models"] == 1
+
+    loader = DataLoader(
+        DATA_DIR,
+        cache_policy=CachePolicy(max_entries=2),
+        model_cache_policy=CachePolicy(max_entries=1)
+    )
+    for item_id in ("medkit_basic", "credits_50"):
+        loader.load_item("cyberpunk", item_id)
+        loader.load_item_model("cyberpunk", item_id)
+    stats = loader.get_cache_stats()
+    assert stats["cached_files"] == 2
+    assert stats["models"]["entries"] == 1 and stats["models"]["max_entries"] == 1
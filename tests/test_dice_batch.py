@@ -0,0 +1,56 @@
+"""Tests for NumPy batch dice"""
+
+import pytest
+
+from src.utils import dice
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("notation", ["2d6+3", "1d20", "3d8-2", "d100", "4d7"])
+def test_roll_dice_batch_matches_scalar_rolls(notation):
+    dice.seed(1234)
+    scalar = [dice.roll_dice(notation) for _ in range(1000)]
+    next_scalar = dice.d20()
+
+    dice.seed(1234)
+    batch = dice.roll_dice_batch(notation, 1000)
+    assert batch.dtype == np.int64
+    assert batch.tolist() == scalar
+    assert dice.d20() == next_scalar  # RNG left where the scalar rolls leave it
+
+
+@pytest.mark.parametrize("use_advantage,use_disadvantage", [
+    (False, False), (True, False), (False, True)
+])
+def test_skill_check_batch_matches_scalar_checks(use_advantage, use_disadvantage):
+    dice.seed(7)
+    scalar = [dice.skill_check(4, 14, use_advantage, use_disadvantage) for _ in range(500)]
+
+    dice.seed(7)
+    success, roll, total = dice.skill_check_batch(4, 14, 500, use_advantage, use_disadvantage)
+    assert list(zip(success.tolist(), roll.tolist(), total.tolist(), strict=True)) == scalar
+
+
+def test_damage_roll_batch_matches_scalar_with_mixed_crits():
+    critical = np.random.default_rng(0).random(800) < 0.25
+
+    dice.seed(99)
+    scalar = [dice.damage_roll("1d8+3", bool(crit)) for crit in critical]
+    dice.seed(99)
+    assert dice.damage_roll_batch("1d8+3", 800, critical).tolist() == scalar
+
+    dice.seed(99)
+    scalar = [dice.damage_roll("2d6-1", True) for _ in range(100)]
+    dice.seed(99)
+    assert dice.damage_roll_batch("2d6-1", 100, critical=True).tolist() == scalar
+
+
+def test_batch_distribution():
+    dice.seed(3)
+    totals = dice.roll_dice_batch("2d6+3", 200_000)
+    assert totals.min() == 5 and totals.max() == 15
+    assert abs(totals.mean() - 10.0) < 0.05
+    assert dice.roll_dice_batch("2d6", 0).shape == (0,)
+    with pytest.raises(ValueError):
+        dice.roll_dice_batch("2x6", 10)
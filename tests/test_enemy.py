@@ -0,0 +1,70 @@
+"""Tests for flyweight enemy squads"""
+
+from pathlib import Path
+
+import pytest
+
+from src.data.loader import DataLoader
+from src.entities.enemy import EnemySquad, StatusEffect, spawn_encounter
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.fixture
+def loader():
+    return DataLoader(DATA_DIR)
+
+
+@pytest.fixture
+def template(loader):
+    return loader.load_enemy_model("cyberpunk", "street_thug_tutorial")
+
+
+def test_members_share_template_but_not_state(template):
+    squad = EnemySquad(template, count=100)
+
+    assert squad[0].template is squad[99].template is template
+    assert squad[5].take_damage(12) == 12
+    assert squad[5].hp_current == 18
+    assert squad[6].hp_current == 30
+    assert squad.alive_indices() == list(range(100))
+
+
+def test_damage_heal_and_defeat(template):
+    squad = EnemySquad(template, count=2)
+
+    assert squad.take_damage(0, 50) == 30
+    assert not squad[0].is_alive()
+    assert squad.heal(1, 10) == 0
+    squad[1].hp_current = 0
+    assert squad.is_defeated()
+
+
+def test_status_effects(template):
+    squad = EnemySquad(template, count=3)
+    squad.add_status(1, StatusEffect.STUNNED | StatusEffect.BLEEDING)
+    squad.remove_status(1, StatusEffect.STUNNED)
+
+    assert squad[1].status == StatusEffect.BLEEDING
+    assert not squad.has_status(0, StatusEffect.BLEEDING)
+
+
+def test_round_trip(template):
+    squad = EnemySquad(template, count=3, positions=[2, 1, 0])
+    squad.take_damage(2, 7)
+    squad.add_status(0, StatusEffect.DEFENDING)
+
+    restored = EnemySquad.from_dict(squad.to_dict(), template)
+    assert restored.to_dict() == squad.to_dict()
+
+
+def test_spawn_encounter_from_location(loader):
+    tavern = loader.load_location_model("cyberpunk", "golden_drake_tavern")
+    squads = spawn_encounter(loader, "cyberpunk", tavern.encounters[0])
+
+    assert len(squads) == 1
+    assert squads[0].template.enemy_id == "street_thug_tutorial"
+    assert len(squads[0]) == 1
+
+    raw = loader.load_location("cyberpunk", "golden_drake_tavern")
+    assert len(spawn_encounter(loader, "cyberpunk", raw["encounters"][0])) == 1
@@ -0,0 +1,69 @@
+"""Tests for the bounded, indexed event history"""
+
+from src.core.event_dispatcher import Event, EventDispatcher, EventHistory, EventType
+
+
+def flag(name: str) -> Event:
+    return Event(EventType.FLAG_SET, {"flag": name})
+
+
+def moved(location: str) -> Event:
+    return Event(EventType.PLAYER_MOVED, {"location": location})
+
+
+def test_history_is_a_ring_buffer():
+    dispatcher = EventDispatcher(history_size=3)
+    for i in range(5):
+        dispatcher.publish(flag(f"f{i}"))
+
+    assert [e.data["flag"] for e in dispatcher.get_event_history()] == ["f2", "f3", "f4"]
+    assert len(dispatcher.history) == 3
+
+
+def test_type_index_follows_evictions():
+    dispatcher = EventDispatcher(history_size=4)
+    dispatcher.publish(moved("tavern"))
+    dispatcher.publish(flag("a"))
+    dispatcher.publish(moved("market"))
+    dispatcher.publish(flag("b"))
+    dispatcher.publish(flag("c"))  # Evicts moved("tavern")
+
+    assert [e.data["location"] for e in dispatcher.get_event_history(EventType.PLAYER_MOVED)] == [
+        "market"
+    ]
+    assert dispatcher.history.count(EventType.FLAG_SET) == 3
+    assert dispatcher.get_event_history(EventType.COMBAT_STARTED) == []
+
+    dispatcher.publish(flag("d"))  # Evicts flag("a")
+    dispatcher.publish(flag("e"))  # Evicts moved("market")
+    assert dispatcher.history.count(EventType.PLAYER_MOVED) == 0
+    assert [e.data["flag"] for e in dispatcher.iter_event_history(EventType.FLAG_SET)] == [
+        "b", "c", "d", "e"
+    ]
+
+
+def test_history_can_be_disabled_and_resized():
+    dispatcher = EventDispatcher(history_size=0)
+    received = []
+    dispatcher.subscribe(EventType.FLAG_SET, received.append)
+    dispatcher.publish(flag("a"))
+    assert received and dispatcher.get_event_history() == []
+
+    dispatcher.set_history_size(None)  # Unbounded
+    for i in range(10):
+        dispatcher.publish(flag(f"f{i}"))
+    dispatcher.set_history_size(2)
+    assert [e.data["flag"] for e in dispatcher.get_event_history(EventType.FLAG_SET)] == [
+        "f8", "f9"
+    ]
+
+    dispatcher.clear_history()
+    assert len(dispatcher.history) == 0
+
+
+def test_iteration_does_not_copy():
+    history = EventHistory(maxlen=10)
+    event = flag("a")
+    history.append(event)
+    assert next(iter(history)) is event
+    assert next(history.events(EventType.FLAG_SET)) is event
@@ -0,0 +1,77 @@
+"""Tests for per-listener event profiling"""
+
+import logging
+import time
+
+from src.core.event_dispatcher import Event, EventCategory, EventDispatcher, EventType
+
+
+def fast(event: Event):
+    pass
+
+
+def slow(event: Event):
+    time.sleep(0.005)
+
+
+def test_profiling_collects_per_listener_and_per_event_stats(caplog):
+    dispatcher = EventDispatcher()
+    dispatcher.subscribe(EventType.DAMAGE_DEALT, fast)
+    dispatcher.subscribe(EventCategory.COMBAT, slow)
+    assert dispatcher.profiling_snapshot() is None
+
+    dispatcher.enable_profiling(slow_threshold=0.004)
+    with caplog.at_level(logging.WARNING, logger="src.core.event_profiler"):
+        for _ in range(3):
+            dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"amount": 5}))
+        dispatcher.publish(Event(EventType.ENTITY_DIED, {"entity": "rat"}))
+    dispatcher.publish(Event(EventType.FLAG_SET, {"flag": "met_tom"}))  # No listeners
+
+    snapshot = dispatcher.profiling_snapshot()
+    assert snapshot["events"]["damage_dealt"]["count"] == 3
+    assert snapshot["events"]["entity_died"]["count"] == 1
+    assert snapshot["events"]["flag_set"]["count"] == 1
+
+    by_name = {listener["name"].rsplit(".", 1)[-1]: listener for listener in snapshot["listeners"]}
+    assert by_name["slow"]["count"] == 4 and by_name["slow"]["target"] == "combat"
+    assert by_name["fast"]["count"] == 3 and by_name["fast"]["target"] == "damage_dealt"
+    assert by_name["slow"]["max_ms"] >= 4
+    assert sum(by_name["slow"]["histogram"].values()) == 4
+    assert snapshot["listeners"][0]["name"].endswith("slow")  # Slowest total first
+
+    # Slow calls are logged as warnings
+    assert snapshot["slow_calls"] == 4
+    assert len(caplog.records) == 4
+    record = caplog.records[-1]
+    assert record.levelno == logging.WARNING
+    assert record.event.data == {"entity": "rat"}
+    assert record.listener.endswith("slow") and record.elapsed_ms >= 4
+    assert "entity_died" in record.getMessage()
+
+
+def test_failing_listeners_are_still_timed():
+    dispatcher = EventDispatcher()
+    dispatcher.add_error_handler(lambda error: None)
+
+    def broken(event: Event):
+        raise ValueError("boom")
+
+    dispatcher.subscribe(EventType.FLAG_SET, broken)
+    dispatcher.enable_profiling(slow_threshold=None)
+    dispatcher.publish(Event(EventType.FLAG_SET, {}))
+    assert dispatcher.profiling_snapshot()["listeners"][0]["count"] == 1
+
+
+def test_disable_stops_recording_and_keeps_results():
+    dispatcher = EventDispatcher()
+    dispatcher.subscribe(EventType.FLAG_SET, fast)
+    profiler = dispatcher.enable_profiling(slow_threshold=None)
+    dispatcher.publish(Event(EventType.FLAG_SET, {}))
+
+    assert dispatcher.disable_profiling() is profiler
+    dispatcher.publish(Event(EventType.FLAG_SET, {}))
+    assert profiler.snapshot()["events"]["flag_set"]["count"] == 1
+    assert dispatcher.profiling_snapshot() is None
+
+    profiler.reset()
+    assert profiler.snapshot()["listeners"] == []
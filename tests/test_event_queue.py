@@ -0,0 +1,98 @@
+"""Tests for the queued event dispatch mode"""
+
+from src.core.event_dispatcher import Event, EventDispatcher, EventType, by_data_key
+
+
+def collect(dispatcher: EventDispatcher, *event_types: EventType) -> list:
+    received = []
+    for event_type in event_types:
+        dispatcher.subscribe(event_type, received.append)
+    return received
+
+
+def test_publish_enqueues_until_flush():
+    dispatcher = EventDispatcher(queued=True)
+    received = collect(dispatcher, EventType.PLAYER_MOVED)
+    dispatcher.publish(Event(EventType.PLAYER_MOVED, {"location": "tavern"}))
+
+    assert received == [] and dispatcher.pending() == 1
+    assert dispatcher.flush() == 1
+    assert [e.data["location"] for e in received] == ["tavern"]
+    assert dispatcher.pending() == 0
+
+
+def test_flush_dispatches_by_priority_then_fifo():
+    dispatcher = EventDispatcher(queued=True)
+    dispatcher.set_priority(EventType.ENTITY_DIED, 10)
+    received = collect(dispatcher, EventType.DAMAGE_DEALT, EventType.ENTITY_DIED)
+
+    dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"n": 1}))
+    dispatcher.publish(Event(EventType.ENTITY_DIED, {"n": 2}))
+    dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"n": 3}))
+    dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"n": 4}), priority=20)
+    dispatcher.flush()
+
+    assert [e.data["n"] for e in received] == [4, 2, 1, 3]
+
+
+def test_coalescing_merges_pending_events():
+    dispatcher = EventDispatcher(queued=True)
+    dispatcher.coalesce(EventType.FLAG_SET, by_data_key("flag"))
+    dispatcher.coalesce(
+        EventType.DAMAGE_DEALT, by_data_key("target"),
+        lambda old, new: Event(new.type, {**new.data,
+                                          "amount": old.data["amount"] + new.data["amount"]})
+    )
+    received = collect(dispatcher, EventType.FLAG_SET, EventType.DAMAGE_DEALT)
+
+    dispatcher.publish(Event(EventType.FLAG_SET, {"flag": "door_open", "value": False}))
+    dispatcher.publish(Event(EventType.FLAG_SET, {"flag": "met_tom", "value": True}))
+    dispatcher.publish(Event(EventType.FLAG_SET, {"flag": "door_open", "value": True}))
+    for amount in (3, 4, 5):
+        dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"target": "rat", "amount": amount}))
+    assert dispatcher.pending() == 3
+
+    dispatcher.flush()
+    assert [(e.data.get("flag"), e.data.get("value")) for e in received[:2]] == [
+        ("door_open", True), ("met_tom", True)
+    ]
+    assert received[2].data == {"target": "rat", "amount": 12}
+
+    # Once dispatched, the key starts a new event
+    dispatcher.publish(Event(EventType.FLAG_SET, {"flag": "door_open", "value": False}))
+    assert dispatcher.pending() == 1
+
+
+def test_budget_bounds_each_flush():
+    dispatcher = EventDispatcher(queued=True, tick_budget=3)
+    received = collect(dispatcher, EventType.DAMAGE_DEALT)
+    for i in range(7):
+        dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"n": i}))
+
+    assert dispatcher.flush() == 3
+    assert dispatcher.flush() == 3
+    assert dispatcher.flush(max_events=10) == 1
+    assert [e.data["n"] for e in received] == list(range(7))
+
+    # A spent time budget still dispatches one event per flush
+    dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"n": 7}))
+    dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"n": 8}))
+    assert dispatcher.flush(max_seconds=0) == 1
+
+
+def test_listeners_publishing_during_flush_do_not_recurse():
+    dispatcher = EventDispatcher(queued=True)
+    depth, order = [0], []
+
+    def on_moved(event: Event):
+        depth[0] += 1
+        order.append(("moved", depth[0]))
+        dispatcher.publish(Event(EventType.LOCATION_ENTERED, event.data))
+        depth[0] -= 1
+
+    dispatcher.subscribe(EventType.PLAYER_MOVED, on_moved)
+    dispatcher.subscribe(EventType.LOCATION_ENTERED, lambda e: order.append(("entered", depth[0])))
+    dispatcher.publish(Event(EventType.PLAYER_MOVED, {"location": "tavern"}))
+
+    assert dispatcher.flush() == 2
+    assert order == [("moved", 1), ("entered", 0)]
@@ -0,0 +1,119 @@
+"""Tests for category, wildcard, filtered and weak subscriptions"""
+
+import gc
+
+import pytest
+
+from src.core.event_dispatcher import (
+    Event, EventCategory, EventDispatcher, EventType, resolve_target
+)
+
+
+def test_category_and_wildcard_targets():
+    dispatcher = EventDispatcher()
+    combat, everything, dialogue = [], [], []
+    dispatcher.subscribe(EventCategory.COMBAT, combat.append)
+    dispatcher.subscribe("*", everything.append)
+    dispatcher.subscribe("dialogue_*", dialogue.append)
+
+    for event_type in (EventType.DAMAGE_DEALT, EventType.FLAG_SET, EventType.DIALOGUE_ENDED):
+        dispatcher.publish(Event(event_type, {}))
+
+    assert [e.type for e in combat] == [EventType.DAMAGE_DEALT]
+    assert len(everything) == 3
+    assert [e.type for e in dialogue] == [EventType.DIALOGUE_ENDED]
+    assert resolve_target("*") == frozenset(EventType)
+    with pytest.raises(ValueError):
+        dispatcher.subscribe("no_such_event_*", print)
+
+
+def test_where_and_predicate_filters_skip_the_callback():
+    dispatcher = EventDispatcher()
+    calls = []
+    dispatcher.subscribe(
+        EventType.FLAG_SET, lambda e: calls.append(("where", e.data["flag"])),
+        where={"flag": "tutorial_combat_complete"}
+    )
+    dispatcher.subscribe(
+        EventType.DAMAGE_DEALT, lambda e: calls.append(("big", e.data["amount"])),
+        predicate=lambda e: e.data["amount"] >= 10
+    )
+
+    dispatcher.publish(Event(EventType.FLAG_SET, {"flag": "met_tom"}))
+    dispatcher.publish(Event(EventType.FLAG_SET, {"flag": "tutorial_combat_complete"}))
+    dispatcher.publish(Event(EventType.FLAG_SET, {}))
+    dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"amount": 3}))
+    dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"amount": 12}))
+
+    assert calls == [("where", "tutorial_combat_complete"), ("big", 12)]
+
+
+def test_listeners_run_in_subscription_order_across_targets():
+    dispatcher = EventDispatcher()
+    order = []
+    dispatcher.subscribe("*", lambda e: order.append("all"))
+    dispatcher.subscribe(EventType.ENTITY_DIED, lambda e: order.append("exact"))
+    dispatcher.subscribe(EventCategory.COMBAT, lambda e: order.append("category"))
+    dispatcher.publish(Event(EventType.ENTITY_DIED, {}))
+    assert order == ["all", "exact", "category"]
+
+
+def test_unsubscribe_and_clear_rebuild_the_table():
+    dispatcher = EventDispatcher()
+    received = []
+    dispatcher.subscribe(EventCategory.COMBAT, received.append)
+    dispatcher.subscribe(EventType.DAMAGE_DEALT, received.append)
+    assert dispatcher.listener_count(EventType.DAMAGE_DEALT) == 2
+
+    dispatcher.unsubscribe(EventCategory.COMBAT, received.append)
+    dispatcher.publish(Event(EventType.DAMAGE_DEALT, {}))
+    dispatcher.publish(Event(EventType.ENTITY_DIED, {}))
+    assert [e.type for e in received] == [EventType.DAMAGE_DEALT]
+
+    dispatcher.clear_listeners(EventType.DAMAGE_DEALT)
+    assert dispatcher.listener_count() == 0
+
+
+def test_weak_listeners_drop_out_when_collected():
+    dispatcher = EventDispatcher()
+
+    class CombatLog:
+        def __init__(self):
+            self.events = []
+
+        def record(self, event: Event):
+            self.events.append(event)
+
+    log = CombatLog()
+    dispatcher.subscribe(EventCategory.COMBAT, log.record, weak=True)
+    dispatcher.publish(Event(EventType.COMBAT_STARTED, {}))
+    assert len(log.events) == 1
+
+    del log
+    gc.collect()
+    assert dispatcher.listener_count(EventType.COMBAT_STARTED) == 0
+    dispatcher.publish(Event(EventType.COMBAT_STARTED, {}))  # No error
+
+    # Strong subscriptions keep bound methods' objects alive
+    strong = CombatLog()
+    dispatcher.subscribe(EventType.COMBAT_ENDED, strong.record)
+    del strong
+    gc.collect()
+    assert dispatcher.listener_count(EventType.COMBAT_ENDED) == 1
+
+
+def test_indexed_filters_keep_subscription_order():
+    dispatcher = EventDispatcher()
+    order = []
+    dispatcher.subscribe(EventType.FLAG_SET, lambda e: order.append(1), where={"flag": "a"})
+    dispatcher.subscribe(EventType.FLAG_SET, lambda e: order.append(2))
+    dispatcher.subscribe(EventType.FLAG_SET, lambda e: order.append(3),
+                         where={"value": True})
+    dispatcher.subscribe(EventType.FLAG_SET, lambda e: order.append(4),
+                         where={"flag": "a", "value": False})
+    dispatcher.subscribe(EventType.FLAG_SET, lambda e: order.append(5),
+                         where={"flag": "a", "value": True})
+    dispatcher.subscribe(EventType.FLAG_SET, lambda e: order.append(6), where={"tags": ["x"]})
+
+    dispatcher.publish(Event(EventType.FLAG_SET, {"flag": "a", "value": True, "tags": ["x"]}))
+    assert order == [1, 2, 3, 5, 6]
@@ -0,0 +1,64 @@
+"""Tests for incremental content hot-reload"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.core.event_dispatcher import EventDispatcher, EventType
+from src.data.loader import DataLoader
+from src.data.watcher import ContentWatcher
+
+
+def edit_json(path: Path, **changes):
+    """Rewrite a JSON file and bump its mtime so the change is always visible"""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data.update(changes)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_changed_only_touches_edited_entries(data_dir):
+    loader = DataLoader(data_dir)
+    tavern = loader.load_location("cyberpunk", "golden_drake_tavern")
+    loader.load_dialogue_tree("cyberpunk", "dialogue_bartender_intro")
+
+    edit_json(data_dir / "genres" / "cyberpunk" / "dialogues" / "dialogue_bartender_intro.json",
+              title="Edited")
+    changes = loader.reload_changed()
+
+    assert [c["content_id"] for c in changes] == ["dialogue_bartender_intro"]
+    assert loader.load_dialogue_tree("cyberpunk", "dialogue_bartender_intro")["title"] == "Edited"
+    assert loader.load_location("cyberpunk", "golden_drake_tavern") is tavern
+    assert loader.reload_changed() == []
+
+
+def test_reload_reports_deleted_files(data_dir):
+    loader = DataLoader(data_dir)
+    loader.load_item("cyberpunk", "credits_50")
+    (data_dir / "genres" / "cyberpunk" / "items" / "credits_50.json").unlink()
+
+    changes = loader.reload_changed()
+    assert changes[0]["deleted"] is True
+    assert loader.get_cache_stats()["cached_files"] == 0
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher_publishes_content_reloaded(data_dir, use_inotify):
+    dispatcher = EventDispatcher()
+    received = []
+    dispatcher.subscribe(EventType.CONTENT_RELOADED, received.append)
+
+    loader = DataLoader(data_dir)
+    watcher = ContentWatcher(loader, dispatcher, interval=0, use_inotify=use_inotify)
+    loader.load_npc("cyberpunk", "bartender_tom")
+    assert watcher.poll() == []
+
+    edit_json(data_dir / "genres" / "cyberpunk" / "npcs" / "bartender_tom.json", title="Owner")
+    watcher.poll()
+    watcher.close()
+
+    assert [e.data["content_id"] for e in received] == ["bartender_tom"]
+    assert loader.load_npc("cyberpunk", "bartender_tom")["title"] == "Owner"
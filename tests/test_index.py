@@ -0,0 +1,52 @@
+"""Tests for the content cross-reference index"""
+
+from src.data.index import ContentIndex, index_path
+from src.data.loader import DataLoader
+
+
+def test_lookup_and_reverse_references(data_dir):
+    index = DataLoader(data_dir).get_index("cyberpunk")
+
+    assert index.lookup("bartender_tom").kind == "npcs"
+    assert index.lookup("golden_drake_tavern").path == "locations/golden_drake_tavern.json"
+    assert index.lookup("tavern_backroom") is None
+    assert ("locations", "golden_drake_tavern") in index.referenced_by("medkit_basic")
+    assert ("npcs", "bartender_tom") in index.referenced_by("medkit_basic")
+    assert ("dialogues", "dialogue_bartender_intro") in index.referenced_by("bartender_tom")
+
+
+def test_dangling_references(data_dir):
+    dangling = DataLoader(data_dir).get_index("cyberpunk").dangling_references()
+    targets = {target for _, target in dangling}
+
+    assert ("locations", "tavern_backroom") in targets
+    assert ("items", "switchblade") in targets
+    assert ("dialogues", "dialogue_bartender_post_tutorial") in targets
+    assert ("items", "medkit_basic") not in targets
+
+
+def test_index_is_persisted_and_reused(data_dir, monkeypatch):
+    DataLoader(data_dir).get_index("cyberpunk")
+    assert index_path(data_dir, "cyberpunk").exists()
+
+    def fail_build(*args, **kwargs):
+        raise AssertionError("index should not be rebuilt")
+
+    monkeypatch.setattr(ContentIndex, "build", fail_build)
+    assert "bartender_tom" in DataLoader(data_dir).get_index("cyberpunk")
+
+
+def test_index_rebuilds_when_content_changes(data_dir):
+    DataLoader(data_dir).get_index("cyberpunk")
+    (data_dir / "genres" / "cyberpunk" / "items" / "switchblade.json").write_text(
+        '{"item_id": "switchblade", "name": "Switchblade"}', encoding="utf-8"
+    )
+
+    loader = DataLoader(data_dir)
+    assert loader.get_index("cyberpunk").exists("items", "switchblade")
+    assert loader.load_by_id("cyberpunk", "switchblade")["name"] == "Switchblade"
+
+
+def test_corrupt_index_is_rebuilt(data_dir):
+    index_path(data_dir, "cyberpunk").write_text("{not json", encoding="utf-8")
+    assert "bartender_tom" in DataLoader(data_dir).get_index("cyberpunk")
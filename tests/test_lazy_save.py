@@ -0,0 +1,77 @@
+"""Tests for lazy, partial save loading"""
+
+import pytest
+
+from src.core.save_manager import SaveManager
+
+
+@pytest.fixture
+def big_state(make_state):
+    """State with 100 flags and choices, so skipped sections are worth skipping"""
+    return make_state(
+        turn_count=12, playtime_seconds=900, visited=True,
+        flags={f"flag_{i}": i for i in range(100)},
+        choices=[f"choice_{i}" for i in range(100)]
+    )
+
+
+def test_preview_decodes_nothing(tmp_path, big_state):
+    saves = SaveManager(str(tmp_path))
+    saves.save_game(big_state, "slot_1")
+
+    with saves.load_game("slot_1", lazy=True) as save:
+        assert save.current_location_id == "golden_drake_tavern"
+        assert save.playtime_seconds == 900
+        assert save.decoded_sections == []
+
+        assert save.game_state_field("turn_count") == 12
+        assert save.decoded_sections == ["game_state"]
+
+        assert save.world_flags["flag_7"] == 7
+        assert sorted(save.decoded_sections) == ["game_state", "game_state.world_flags"]
+        assert "player" in save.section_names
+
+
+def test_lazy_game_state_matches_full_load(tmp_path, big_state):
+    saves = SaveManager(str(tmp_path))
+    state = big_state
+    saves.save_game(state, "slot_1")
+
+    with saves.load_game("slot_1", lazy=True) as save:
+        assert save.player.name == "V"
+        assert save.game_state.to_dict() == state.to_dict()
+        assert save.game_state.player is save.player
+
+
+def test_lazy_journaled_save_applies_journal_per_section(tmp_path, big_state):
+    saves = SaveManager(str(tmp_path), journaled=True)
+    state = big_state
+    saves.autosave(state)
+
+    state.turn_count = 13
+    state.set_flag("flag_3", "changed")
+    del state.world_flags["flag_4"]
+    state.record_choice("late_choice")
+    state.visited_locations.add("downtown_streets")
+    state.player.take_damage(5)
+    state.current_location_id = "downtown_streets"
+    saves.autosave(state)
+
+    with saves.load_game("autosave", lazy=True) as save:
+        assert save.current_location_id == "downtown_streets"
+        assert save.game_state_field("turn_count") == 13
+        assert save.decoded_sections == ["game_state"]
+
+        flags = save.world_flags
+        assert flags["flag_3"] == "changed" and "flag_4" not in flags
+        assert save.game_state_field("choice_history")[-1] == "late_choice"
+        assert save.player.hp_current == state.player.hp_current
+        assert save.game_state.to_dict() == saves.load_game("autosave").to_dict()
+
+
+def test_lazy_legacy_json_save(tmp_path, big_state):
+    SaveManager(str(tmp_path), codec="json").save_game(big_state, "old")
+
+    with SaveManager(str(tmp_path)).load_game("old", lazy=True) as save:
+        assert save.game_state_field("turn_count") == 12
+        assert save.world_flags["flag_99"] == 99
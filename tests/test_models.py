@@ -0,0 +1,55 @@
+"""Tests for compiled content models"""
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from src.data.loader import DataLoader
+from src.data.models import Enemy, compile_record
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def test_every_shipped_record_compiles():
+    loader = DataLoader(DATA_DIR)
+    tavern = loader.load_location_model("cyberpunk", "golden_drake_tavern")
+    tom = loader.load_npc_model("cyberpunk", "bartender_tom")
+    thug = loader.load_enemy_model("cyberpunk", "street_thug_tutorial")
+    whiskey = loader.load_item_model("cyberpunk", "synth_whiskey")
+    intro = loader.load_dialogue_model("cyberpunk", "dialogue_bartender_intro")
+
+    assert tavern.exits["out"].target == "downtown_streets"
+    assert tavern.encounters[0].enemy_groups[0].enemies == ("street_thug_tutorial",)
+    assert tom.merchant_data.shop_inventory[1].item_id == "medkit_basic"
+    assert thug.stats.hp_max == 30
+    assert thug.loot_table.random[0].chance == 0.3
+    assert whiskey.effect["effects"][0]["stat"] == "charisma"
+    assert intro.speaker_npc_id == "bartender_tom"
+
+
+def test_models_are_slotted_and_immutable():
+    thug = DataLoader(DATA_DIR).load_enemy_model("cyberpunk", "street_thug_tutorial")
+
+    assert not hasattr(thug, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        thug.stats.hp_max = 999
+    with pytest.raises(TypeError):
+        thug.dialogue["on_death"] = "changed"
+
+
+def test_models_are_cached():
+    loader = DataLoader(DATA_DIR)
+    first = loader.load_enemy_model("cyberpunk", "street_thug_tutorial")
+
+    assert loader.load_enemy_model("cyberpunk", "street_thug_tutorial") is first
+    assert loader.get_cache_stats()["compiled_models"] == 1
+
+
+def test_invalid_record_is_rejected():
+    with pytest.raises(ValidationError):
+        compile_record("enemies", {"enemy_id": "broken", "name": "Broken", "stats": {}})
+    assert isinstance(compile_record("enemies", {
+        "enemy_id": "rat", "name": "Rat", "stats": {"hp_max": 3}, "unknown_field": 1,
+    }), Enemy)
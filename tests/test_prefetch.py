@@ -0,0 +1,49 @@
+"""Tests for genre preloading and location prefetch"""
+
+from pathlib import Path
+
+from src.core.event_dispatcher import Event, EventDispatcher, EventType
+from src.data.loader import DataLoader
+from src.data.references import extract_references
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def cached_ids(loader: DataLoader) -> set:
+    return {Path(key).stem for key in loader.get_cache_stats()["cache_keys"]}
+
+
+def test_extract_location_references():
+    loader = DataLoader(DATA_DIR)
+    refs = extract_references("locations", loader.load_location("cyberpunk", "golden_drake_tavern"))
+
+    assert ("locations", "downtown_streets") in refs
+    assert ("npcs", "bartender_tom") in refs
+    assert ("dialogues", "dialogue_bartender_intro") in refs
+    assert ("enemies", "street_thug_tutorial") in refs
+    assert ("items", "medkit_basic") in refs
+    assert ("dialogues", "dialogue_bartender_post_tutorial") in refs
+
+
+def test_preload_genre_loads_every_record():
+    loader = DataLoader(DATA_DIR)
+    count = loader.preload_genre("cyberpunk", max_workers=4)
+
+    assert count == len(list((DATA_DIR / "genres" / "cyberpunk").rglob("*.json")))
+    assert loader.get_cache_stats()["cached_files"] == count
+
+
+def test_prefetch_on_location_entered():
+    dispatcher = EventDispatcher()
+    loader = DataLoader(DATA_DIR)
+    loader.enable_prefetch(dispatcher, "cyberpunk", max_workers=2)
+
+    dispatcher.publish(Event(EventType.LOCATION_ENTERED, {"location_id": "golden_drake_tavern"}))
+    assert loader.wait_for_prefetch(timeout=5)
+
+    # NPCs, encounter enemies, and items referenced by the location and its enemies
+    assert {"bartender_tom", "dialogue_bartender_intro", "street_thug_tutorial",
+            "medkit_basic", "credits_50", "synth_whiskey"} <= cached_ids(loader)
+
+    loader.disable_prefetch(dispatcher)
+    assert dispatcher.listener_count(EventType.LOCATION_ENTERED) == 0
@@ -0,0 +1,100 @@
+"""Tests for deterministic session record/replay"""
+
+import json
+
+import pytest
+
+from src.core.event_dispatcher import Event, EventDispatcher, EventType
+from src.core.game_state import GameState
+from src.core.replay import SessionRecorder, read_journal, replay
+from src.utils import dice
+
+
+def wire_combat(dispatcher: EventDispatcher, game_state: GameState):
+    """A tiny combat system: attacks roll damage, damage may kill"""
+    def on_attack(event: Event):
+        amount = dice.roll_dice("1d8") + dice.d100() // 50
+        dispatcher.publish(Event(EventType.DAMAGE_DEALT, {"target": event.data["target"],
+                                                          "amount": amount}))
+
+    def on_damage(event: Event):
+        if event.data["amount"] >= 6:
+            dispatcher.publish(Event(EventType.ENTITY_DIED, {"entity": event.data["target"]}))
+
+    dispatcher.subscribe(EventType.COMBAT_STARTED, on_attack)
+    dispatcher.subscribe(EventType.DAMAGE_DEALT, on_damage)
+
+
+def record_session(tmp_path, setup=wire_combat, queued=False):
+    dispatcher = EventDispatcher(queued=queued)
+    game_state = GameState(seed=1234)
+    setup(dispatcher, game_state)
+    with SessionRecorder(dispatcher, log_dir=str(tmp_path)) as recorder:
+        recorder.start(game_state)
+        for i in range(20):
+            dispatcher.publish(Event(EventType.COMBAT_STARTED, {"target": f"rat_{i}"}))
+            if queued and i % 3 == 2:
+                dispatcher.flush()
+        dispatcher.flush()
+    return recorder.path
+
+
+def test_recorded_session_replays_identically(tmp_path):
+    path = record_session(tmp_path)
+    assert path.parent == tmp_path and path.suffix == ".replay"
+
+    header, steps = read_journal(path)
+    assert header["seed"] == 1234
+    roots = [step for step in steps if step[0] == "e" and step[3] == 0]
+    assert len(roots) == 20
+    assert any(step[0] == "r" for step in steps)
+    assert any(step[0] == "e" and step[1] == "entity_died" for step in steps)
+
+    result = replay(path, wire_combat, GameState())
+    assert result.ok, result.divergence
+    assert result.steps == result.total_steps == len(steps)
+
+
+def test_queued_sessions_replay_with_the_same_flush_points(tmp_path):
+    path = record_session(tmp_path, queued=True)
+    assert replay(path, wire_combat, GameState(), queued=True).ok
+
+
+def test_changed_behavior_is_reported_as_divergence(tmp_path):
+    path = record_session(tmp_path)
+
+    def wire_buffed(dispatcher: EventDispatcher, game_state: GameState):
+        wire_combat(dispatcher, game_state)
+        dispatcher.subscribe(EventType.ENTITY_DIED, lambda event: dice.d20())  # Extra roll
+
+    result = replay(path, wire_buffed, GameState())
+    assert not result.ok
+    assert result.divergence.actual[0] == "r"  # The extra draw
+    assert result.steps == result.divergence.step < result.total_steps
+
+    # Nothing wired: the first recorded reaction never happens
+    result = replay(path, lambda dispatcher, game_state: None, GameState())
+    assert result.divergence.step == 1 and result.divergence.actual is None
+
+
+def test_recording_restores_the_dice_rng(tmp_path):
+    before = dice.get_rng()
+    path = record_session(tmp_path)
+    assert dice.get_rng() is before
+
+    lines = path.read_text().splitlines()
+    assert all(json.loads(line) for line in lines)
+    assert "\n" not in lines[-1]
+
+
+def test_existing_journal_is_not_appended_to(tmp_path):
+    path = record_session(tmp_path)
+    recorder = SessionRecorder(EventDispatcher())
+    with pytest.raises(FileExistsError):
+        recorder.start(GameState(seed=1), path=path)
+    assert not recorder.recording
+
+    with recorder:
+        recorder.start(GameState(seed=99), path=path, overwrite=True)
+    header, steps = read_journal(path)
+    assert header["seed"] == 99 and steps == []
@@ -0,0 +1,46 @@
+"""Tests for the compact binary save encoding"""
+
+import pytest
+
+from src.core.save_binary import BINARY_VERSION, MAX_DEPTH, dumps, loads
+
+
+def test_round_trip_keeps_types():
+    value = {
+        "flags": {"met_tom": True, "debt": None, "trust": -3, "credits": 2 ** 40},
+        "huge": -2 ** 100,
+        "ratio": 0.25,
+        "choices": ["order_whiskey", "ask_about_job" * 20],
+        "hashes": (b"\x00\xff", ("key", 1)),
+        2: "int keys",
+    }
+    decoded = loads(dumps(value))
+    assert decoded == value
+    assert type(decoded["hashes"]) is tuple and type(decoded["hashes"][0]) is bytes
+    assert dumps(decoded) == dumps(value)
+
+
+def test_unsupported_values_are_rejected():
+    with pytest.raises(TypeError):
+        dumps({"visited": {"tavern"}})
+    nested: list = []
+    for _ in range(MAX_DEPTH + 1):
+        nested = [nested]
+    with pytest.raises(ValueError):
+        dumps(nested)
+
+
+@pytest.mark.parametrize("raw", [
+    b"",
+    bytes([BINARY_VERSION + 1]) + b"N",   # Unknown format version
+    bytes([BINARY_VERSION]) + b"Z",       # Unknown tag
+    bytes([BINARY_VERSION]) + b"NN",      # Trailing bytes
+    bytes([BINARY_VERSION]) + b"s\x05ab",  # Size past the end
+    bytes([BINARY_VERSION]) + b"i\x01",   # Truncated int
+    bytes([BINARY_VERSION]) + b"m\x01l\x00N",  # Unhashable key
+    bytes([BINARY_VERSION]) + b"s\x02\xff\xfe",  # Invalid UTF-8
+    bytes([BINARY_VERSION]) + b"l\x01" * (MAX_DEPTH + 1) + b"N",
+])
+def test_corrupt_data_raises_value_error(raw):
+    with pytest.raises(ValueError):
+        loads(raw)
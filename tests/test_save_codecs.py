@@ -0,0 +1,97 @@
+"""Tests for pluggable save codecs"""
+
+import json
+
+import pytest
+
+from src.core.save_codecs import (
+    CODECS, FORMAT_VERSION, SAVE_MAGIC, SaveCodec, decode_save, read_header, register_codec
+)
+from src.core.save_manager import SaveManager
+
+
+@pytest.mark.parametrize("codec", sorted(CODECS))
+def test_codec_round_trip(tmp_path, codec, make_state):
+    saves = SaveManager(str(tmp_path), codec=codec)
+    state = make_state(turn_count=7, flags={"tom_trust": 3}, choices=["order_whiskey"])
+    assert saves.save_game(state, "slot_1")
+
+    loaded = saves.load_game("slot_1")
+    assert loaded.to_dict() == state.to_dict()
+    assert loaded.player.to_dict() == state.player.to_dict()
+    assert [save["slot_name"] for save in saves.list_saves()] == ["slot_1"]
+
+
+def test_header_is_self_describing(tmp_path, make_state):
+    saves = SaveManager(str(tmp_path), codec="binary+lzma")
+    saves.save_game(make_state(turn_count=7), "slot_1")
+    raw = (tmp_path / "slot_1.sav").read_bytes()
+
+    assert raw.startswith(SAVE_MAGIC)
+    header = read_header(raw)
+    assert (header.version, header.encoding, header.compression) == (
+        FORMAT_VERSION, "binary", "lzma"
+    )
+    assert header.info["metadata"]["location"] == "golden_drake_tavern"
+
+
+def test_legacy_json_save_still_loads_and_is_replaced(tmp_path, make_state):
+    legacy = SaveManager(str(tmp_path), codec="json")
+    legacy.save_game(make_state(turn_count=7), "slot_1")
+    assert json.loads((tmp_path / "slot_1.json").read_text(encoding="utf-8"))["player"]
+
+    saves = SaveManager(str(tmp_path))
+    assert saves.load_game("slot_1").turn_count == 7
+
+    saves.save_game(make_state(turn_count=7), "slot_1")
+    assert sorted(path.name for path in tmp_path.glob("slot_1.*")) == ["slot_1.sav"]
+
+
+def test_custom_codec_and_errors(tmp_path, make_state):
+    register_codec(SaveCodec("test+json", "json"))
+    try:
+        saves = SaveManager(str(tmp_path), codec="test+json")
+        saves.save_game(make_state(turn_count=7), "slot_1")
+    finally:
+        del CODECS["test+json"]
+    assert decode_save((tmp_path / "slot_1.sav").read_bytes())["game_state"]["turn_count"] == 7
+
+    with pytest.raises(ValueError):
+        SaveManager(str(tmp_path), codec="no_such_codec")
+    with pytest.raises(ValueError):
+        decode_save(SAVE_MAGIC + b"\x09\x00\x00\x00")
+
+
+def test_default_codec_is_compressed_json(tmp_path, make_state):
+    SaveManager(str(tmp_path)).save_game(make_state(turn_count=7), "slot_1")
+    header = read_header((tmp_path / "slot_1.sav").read_bytes())
+    assert (header.encoding, header.compression) == ("json", "zlib")
+
+
+def test_sections_of_the_wrong_type_are_rejected(tmp_path, make_state):
+    saves = SaveManager(str(tmp_path), codec="binary")
+    saves.save_game(make_state(turn_count=7), "slot_1")
+    data = decode_save((tmp_path / "slot_1.sav").read_bytes())
+    data["game_state"]["world_flags"] = ["not", "a", "dict"]
+    raw = CODECS["binary"].encode(data)
+
+    with pytest.raises(ValueError, match="world_flags"):
+        decode_save(raw)
+    with pytest.raises(ValueError):
+        decode_save(json.dumps({"game_state": {}}).encode("utf-8"))
+
+
+def test_unknown_version_and_malformed_info_are_rejected(tmp_path, make_state):
+    SaveManager(str(tmp_path)).save_game(make_state(turn_count=7), "slot_1")
+    raw = (tmp_path / "slot_1.sav").read_bytes()
+    header = read_header(raw)
+
+    bumped = raw[:len(SAVE_MAGIC)] + bytes([FORMAT_VERSION + 1, 0]) + raw[len(SAVE_MAGIC) + 2:]
+    with pytest.raises(ValueError, match="version"):
+        decode_save(bumped)
+
+    info = json.dumps({"metadata": header.info["metadata"], "sections": {"player": [0]}}).encode()
+    start = len(SAVE_MAGIC) + 4 + len(header.encoding) + len(header.compression)  # info_len
+    broken = raw[:start] + len(info).to_bytes(4, "little") + info + raw[header.body_offset:]
+    with pytest.raises(ValueError, match="info block"):
+        decode_save(broken)
@@ -0,0 +1,113 @@
+"""Tests for the content-addressed rewind history"""
+
+import pytest
+
+from src.core.game_state import GameState
+from src.core.save_history import HistoryStore
+from src.core.save_manager import SaveManager
+from src.entities.player import Player
+
+
+def make_save(turn: int, flags: int = 2000) -> dict:
+    return {
+        "metadata": {"save_time": f"t{turn}", "version": "1.0.0", "location": "tavern",
+                     "playtime": turn},
+        "game_state": {
+            "turn_count": turn,
+            "world_flags": {f"flag_{i}": i for i in range(flags)} | {"turn": turn},
+            "choice_history": [f"choice_{i}" for i in range(turn * 10)],
+            "visited_locations": ["tavern", "market"],
+        },
+        "player": {"name": "V", "level": 1},
+    }
+
+
+def test_restore_round_trips_every_point(tmp_path):
+    history = HistoryStore(tmp_path / "history.db")
+    saves = [make_save(turn) for turn in range(5)]
+    ids = [history.record(save, label=f"turn {i}") for i, save in enumerate(saves)]
+
+    for point_id, save in zip(ids, saves, strict=True):
+        assert history.restore(point_id) == save
+    assert [point["label"] for point in history.points()] == [f"turn {i}" for i in range(4, -1, -1)]
+    history.close()
+
+    # Points survive reopening the file
+    history = HistoryStore(tmp_path / "history.db")
+    assert history.restore(ids[2]) == saves[2]
+    history.close()
+
+
+def test_unchanged_chunks_are_stored_once(tmp_path):
+    history = HistoryStore(tmp_path / "history.db")
+    history.record(make_save(1))
+    first = history.stats()
+    for turn in range(2, 12):
+        history.record(make_save(turn))
+    after = history.stats()
+
+    # One changed flag and a few appended choices per point: the flag table
+    # (2000 entries, ~30 chunks) is almost entirely shared
+    assert after["chunks"] - first["chunks"] < 10 * 12
+    assert after["stored_bytes"] < first["stored_bytes"] * 4
+    history.close()
+
+
+def test_old_points_are_dropped_and_garbage_collected(tmp_path):
+    history = HistoryStore(tmp_path / "history.db", max_points=3, gc_every=100)
+    ids = [history.record(make_save(turn, flags=200 * (turn + 1))) for turn in range(6)]
+
+    assert [point["id"] for point in history.points()] == ids[:2:-1]
+    chunks = history.stats()["chunks"]
+    assert history.gc() > 0
+    assert history.stats()["chunks"] < chunks
+    assert history.gc() == 0
+
+    # Kept points are intact after collection
+    assert history.restore(ids[-1]) == make_save(5, flags=1200)
+    with pytest.raises(KeyError):
+        history.restore(ids[0])
+    history.close()
+
+
+def test_autosave_records_rewind_points(tmp_path):
+    saves = SaveManager(str(tmp_path), history_size=10)
+    state = GameState(current_location_id="golden_drake_tavern")
+    state.player = Player(name="V")
+    for turn in range(3):
+        state.turn_count = turn
+        state.set_flag(f"turn_{turn}")
+        assert saves.autosave(state)
+
+    points = saves.list_history()
+    assert len(points) == 3
+    rewound = saves.rewind(points[-1]["id"])
+    assert rewound.turn_count == 0
+    assert rewound.world_flags == {"turn_0": True}
+    assert rewound.player.name == "V"
+    assert saves.rewind(12345) is None
+    assert saves.close(timeout=5)
+
+
+def test_background_autosave_records_history(tmp_path):
+    saves = SaveManager(str(tmp_path), background=True, history_size=10)
+    state = GameState(current_location_id="golden_drake_tavern")
+    saves.autosave(state)
+    assert saves.flush(timeout=5)
+    assert len(saves.list_history()) == 1
+    assert saves.close(timeout=5)
+
+
+def test_mutated_containers_are_not_mistaken_for_unchanged(tmp_path):
+    history = HistoryStore(tmp_path / "history.db")
+    save = make_save(1, flags=10)
+    inventory = ["sword"]
+    save["player"]["inventory"] = inventory
+    first = history.record(save)
+
+    inventory.append("shield")  # Same list object, new contents
+    second = history.record(save)
+
+    assert history.restore(first)["player"]["inventory"] == ["sword"]
+    assert history.restore(second)["player"]["inventory"] == ["sword", "shield"]
+    history.close()
@@ -0,0 +1,62 @@
+"""Tests for the save slot index behind list_saves"""
+
+import json
+import shutil
+
+from src.core.save_codecs import read_save_info
+from src.core.save_manager import SaveManager
+
+
+def slots(saves: SaveManager) -> dict:
+    return {save["slot_name"]: save["location"] for save in saves.list_saves()}
+
+
+def test_index_updates_on_every_save(tmp_path, make_state):
+    saves = SaveManager(str(tmp_path))
+    saves.save_game(make_state("golden_drake_tavern", playtime_seconds=10), "slot_1")
+    saves.save_game(make_state("downtown_streets", playtime_seconds=20), "slot_2")
+
+    index = json.loads((tmp_path / "slots.index").read_text(encoding="utf-8"))
+    assert index["slots"]["slot_2"]["metadata"]["location"] == "downtown_streets"
+    assert read_save_info(tmp_path / "slot_1.sav")["metadata"]["playtime"] == 10
+
+    assert slots(saves) == {"slot_1": "golden_drake_tavern", "slot_2": "downtown_streets"}
+
+
+def test_list_saves_does_not_decode_indexed_saves(tmp_path, monkeypatch, make_state):
+    saves = SaveManager(str(tmp_path))
+    for i in range(5):
+        saves.save_game(make_state(f"location_{i}", playtime_seconds=i), f"slot_{i}")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("list_saves decoded a save")
+
+    monkeypatch.setattr("src.core.save_manager.decode_save", fail)
+    monkeypatch.setattr("src.core.save_manager.read_save_info", fail)
+    assert len(SaveManager(str(tmp_path)).list_saves()) == 5
+
+
+def test_corrupt_index_and_external_changes_are_rebuilt(tmp_path, make_state):
+    saves = SaveManager(str(tmp_path), journaled=True)
+    saves.save_game(make_state("golden_drake_tavern", playtime_seconds=10), "slot_1")
+    state = make_state("golden_drake_tavern", playtime_seconds=5)
+    saves.autosave(state)
+    state.current_location_id = "downtown_streets"
+    saves.autosave(state)
+
+    (tmp_path / "slots.index").write_text("{corrupt", encoding="utf-8")
+    shutil.copy(tmp_path / "slot_1.sav", tmp_path / "copied.sav")
+    (tmp_path / "slot_1.sav").unlink()
+
+    fresh = SaveManager(str(tmp_path))
+    assert slots(fresh) == {"copied": "golden_drake_tavern", "autosave": "downtown_streets"}
+    index = json.loads((tmp_path / "slots.index").read_text(encoding="utf-8"))
+    assert set(index["slots"]) == {"copied", "autosave"}
+
+
+def test_legacy_json_saves_are_indexed(tmp_path, make_state):
+    legacy = SaveManager(str(tmp_path), codec="json")
+    legacy.save_game(make_state("old_town", playtime_seconds=1), "old")
+    (tmp_path / "slots.index").unlink()
+
+    assert slots(SaveManager(str(tmp_path))) == {"old": "old_town"}
@@ -0,0 +1,80 @@
+"""Tests for journaled delta autosaves"""
+
+import json
+
+from src.core.save_journal import apply, diff
+from src.core.save_manager import SaveManager
+
+
+def test_diff_round_trip():
+    old = {"flags": {"a": 1, "b": 2}, "log": ["x"], "hp": 10}
+    new = {"flags": {"a": 1, "c": True}, "log": ["x", "y"], "hp": 7}
+
+    ops = diff(old, new)
+    assert ["ext", ["log"], ["y"]] in ops
+    assert apply(json.loads(json.dumps(old)), ops) == new
+    assert diff(new, new) == []
+
+
+def test_journaled_autosave_replays(tmp_path, capsys, make_state):
+    saves = SaveManager(str(tmp_path), journaled=True, compact_every=10)
+    state = make_state(seed=42, choices=["order_whiskey"], visited=True)
+    saves.autosave(state)
+    snapshot = saves.autosave_path.read_bytes()
+
+    for turn in range(1, 4):
+        state.turn_count = turn
+        state.record_choice(f"choice_{turn}")
+        state.set_flag(f"flag_{turn}", turn)
+        state.player.take_damage(3)
+        assert saves.autosave(state)
+
+    # Snapshot untouched, one small line per autosave
+    assert saves.autosave_path.read_bytes() == snapshot
+    lines = (tmp_path / "autosave.journal").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    assert all(len(line) < 600 for line in lines)
+
+    loaded = saves.load_game("autosave")
+    assert loaded.to_dict() == state.to_dict()
+    assert loaded.player.to_dict() == state.player.to_dict()
+    assert saves.list_saves()[0]["playtime"] == state.playtime_seconds
+
+
+def test_compaction_and_stale_journal(tmp_path, make_state):
+    saves = SaveManager(str(tmp_path), journaled=True, compact_every=2)
+    state = make_state(seed=42, choices=["order_whiskey"], visited=True)
+    saves.autosave(state)
+    stale = None
+
+    for turn in range(1, 6):
+        state.turn_count = turn
+        saves.autosave(state)
+        if turn == 2:
+            stale = (tmp_path / "autosave.journal").read_text(encoding="utf-8")
+
+    # turns 1-2 were journaled, turn 3 compacted, turns 4-5 journaled again
+    journal = (tmp_path / "autosave.journal").read_text(encoding="utf-8").splitlines()
+    assert len(journal) == 2
+
+    # Lines from before the compaction are ignored on replay
+    with open(tmp_path / "autosave.journal", "a", encoding="utf-8") as f:
+        f.write(stale)
+    assert saves.load_game("autosave").turn_count == 5
+
+
+def test_torn_journal_line_and_full_save(tmp_path, make_state):
+    saves = SaveManager(str(tmp_path), journaled=True)
+    state = make_state(seed=42, choices=["order_whiskey"], visited=True)
+    saves.autosave(state)
+    state.turn_count = 1
+    saves.autosave(state)
+    with open(tmp_path / "autosave.journal", "a", encoding="utf-8") as f:
+        f.write('{"generation": 1, "ops": [["set"')
+
+    assert saves.load_game("autosave").turn_count == 1
+
+    state.turn_count = 2
+    saves.save_game(state, "autosave")
+    assert not (tmp_path / "autosave.journal").exists()
+    assert saves.load_game("autosave").turn_count == 2
@@ -0,0 +1,140 @@
+"""Tests for the SQLite multi-profile save backend"""
+
+import sqlite3
+import threading
+
+from src.core.save_manager import SaveManager
+from src.core.save_sqlite import SQLiteSaveManager
+
+
+def test_save_and_load_round_trip(tmp_path, make_state):
+    saves = SQLiteSaveManager(str(tmp_path / "saves.db"))
+    assert saves.save_game(make_state(turn_count=7), "slot_1")
+
+    loaded = saves.load_game("slot_1")
+    assert loaded.turn_count == 7
+    assert loaded.world_flags == {"met_tom": True}
+    assert loaded.player.name == "V"
+    assert saves.load_game("missing") is None
+
+    with saves.load_game("slot_1", lazy=True) as save:
+        assert save.current_location_id == "golden_drake_tavern"
+        assert save.game_state_field("turn_count") == 7
+    assert saves.close(timeout=5)
+
+
+def test_profiles_are_isolated(tmp_path, make_state):
+    db_path = str(tmp_path / "saves.db")
+    alice = SQLiteSaveManager(db_path, profile="alice")
+    bob = SQLiteSaveManager(db_path, profile="bob")
+    alice.save_game(make_state(turn_count=1), "slot_1")
+    bob.save_game(make_state(turn_count=2), "slot_1")
+    bob.save_game(make_state(turn_count=3), "slot_2")
+
+    assert alice.load_game("slot_1").turn_count == 1
+    assert bob.load_game("slot_1").turn_count == 2
+    assert [save["slot_name"] for save in alice.list_saves()] == ["slot_1"]
+    assert sorted(save["slot_name"] for save in bob.list_saves()) == ["slot_1", "slot_2"]
+    assert alice.list_profiles() == ["alice", "bob"]
+
+    assert bob.delete_save("slot_2")
+    assert not bob.delete_save("slot_2")
+    alice.close()
+    bob.close()
+
+
+def test_profiles_have_separate_rewind_history(tmp_path, make_state):
+    db_path = str(tmp_path / "saves.db")
+    alice = SQLiteSaveManager(db_path, profile="alice", history_size=2)
+    bob = SQLiteSaveManager(db_path, profile="bob", history_size=2)
+    for turn in range(1, 4):
+        alice.autosave(make_state(location="alley", turn_count=turn))
+    bob.autosave(make_state(turn_count=100))
+
+    alice_points = alice.list_history()
+    assert len(alice_points) == 2  # Bob's autosave didn't evict Alice's points
+    assert alice.rewind(alice_points[0]["id"]).turn_count == 3
+    bob_points = bob.list_history()
+    assert len(bob_points) == 1
+    assert bob.rewind(bob_points[0]["id"]).turn_count == 100
+    alice.close()
+    bob.close()
+
+
+def test_query_saves_by_location_and_time(tmp_path, make_state):
+    saves = SQLiteSaveManager(str(tmp_path / "saves.db"), profile="alice")
+    saves.save_game(make_state("golden_drake_tavern"), "slot_1")
+    saves.save_game(make_state("market"), "slot_2")
+    saves.profile = "bob"
+    saves.save_game(make_state("market"), "slot_1")
+
+    market = saves.query_saves(location="market")
+    assert sorted(save["profile"] for save in market) == ["alice", "bob"]
+    assert len(saves.query_saves(profile="alice", location="market")) == 1
+    assert len(saves.query_saves(limit=2)) == 2
+
+    newest = saves.query_saves()[0]
+    assert newest["profile"] == "bob"
+    assert saves.query_saves(since=newest["save_time"])[0] == newest
+    assert newest not in saves.query_saves(until=newest["save_time"])
+
+    # Metadata queries are served by indexes
+    plan = sqlite3.connect(saves.db_path).execute(
+        "EXPLAIN QUERY PLAN SELECT slot FROM saves WHERE location = ? ORDER BY save_time DESC",
+        ("market",)
+    ).fetchall()
+    assert "saves_by_location" in str(plan)
+    saves.close()
+
+
+def test_concurrent_writers_and_readers(tmp_path, make_state):
+    db_path = str(tmp_path / "saves.db")
+    errors = []
+
+    def play(profile: str):
+        saves = SQLiteSaveManager(db_path, profile=profile)
+        try:
+            for turn in range(20):
+                assert saves.save_game(make_state(turn_count=turn), "autosave")
+                assert saves.load_game("autosave").turn_count == turn
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+        finally:
+            saves.close()
+
+    threads = [threading.Thread(target=play, args=(f"player_{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    saves = SQLiteSaveManager(db_path)
+    assert len(saves.query_saves()) == 4
+    assert sqlite3.connect(db_path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    saves.close()
+
+
+def test_background_autosave_and_import(tmp_path, monkeypatch, make_state):
+    files = SaveManager(str(tmp_path / "files"), journaled=True)
+    files.save_journaled(make_state(turn_count=1), "autosave")
+    files.save_journaled(make_state(turn_count=2), "autosave")  # Journal line
+    files.save_game(make_state(turn_count=5), "slot_1")
+
+    saves = SQLiteSaveManager(str(tmp_path / "db" / "saves.db"), background=True)
+    assert saves.import_files(str(tmp_path / "files")) == 2
+
+    # A slot that can't be read is skipped, not a failed import
+    list_saves = SaveManager.list_saves
+    monkeypatch.setattr(
+        SaveManager, "list_saves", lambda self: list_saves(self) + [{"slot_name": "gone"}]
+    )
+    assert saves.import_files(str(tmp_path / "files")) == 2
+    monkeypatch.undo()
+    assert saves.load_game("autosave").turn_count == 2
+    assert saves.load_game("slot_1").turn_count == 5
+
+    saves.autosave(make_state(turn_count=9))
+    assert saves.flush(timeout=5)
+    assert saves.load_game("autosave").turn_count == 9
+    assert saves.close(timeout=5)
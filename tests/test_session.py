@@ -0,0 +1,107 @@
+"""Tests for per-session dispatchers, dice and messages"""
+
+import asyncio
+import random
+import threading
+
+from src.core.event_dispatcher import Event, EventType, game_events
+from src.core.game_state import GameState
+from src.core.save_manager import SaveManager
+from src.core.session import GameSession, current_session, get_events, notify
+from src.entities.player import Player
+from src.utils import dice
+
+
+def test_sessions_are_isolated():
+    first = GameSession(GameState(seed=7), output=[].append)
+    second = GameSession(GameState(seed=7), output=[].append)
+    received = []
+
+    with first.activate():
+        get_events().subscribe(EventType.FLAG_SET, received.append)
+        first_rolls = [dice.d20() for _ in range(10)]
+    with second.activate():
+        get_events().publish(Event(EventType.FLAG_SET, {"flag": "other_session"}))
+        second_rolls = [dice.d20() for _ in range(10)]
+
+    assert received == []  # Published in the other session
+    assert first_rolls == second_rolls  # Same seed, separate RNGs
+    assert current_session() is None and get_events() is game_events
+
+
+def test_unseeded_sessions_get_their_own_seed():
+    states = [GameState() for _ in range(3)]
+    sessions = [GameSession(state) for state in states]
+    assert len({state.seed for state in states}) == 3 and all(state.seed for state in states)
+    assert len({session.rng.random() for session in sessions}) == 3
+
+    # The chosen seed is in the state, so the session can be replayed
+    again = GameSession(GameState(seed=states[0].seed))
+    sessions[0].rng.seed(states[0].seed)
+    assert again.rng.random() == sessions[0].rng.random()
+
+
+def test_messages_go_to_the_session_output(capsys):
+    messages = []
+    session = GameSession(output=messages.append)
+    player = Player(name="V")
+
+    with session.activate():
+        player.add_xp(100)
+        notify("hello")
+    assert messages == ["🎉 LEVEL UP! You are now level 2!", "hello"]
+    assert capsys.readouterr().out == ""
+
+    notify("outside")
+    assert capsys.readouterr().out == "outside\n"
+
+
+def test_background_saves_report_to_their_session(tmp_path, capsys):
+    messages = []
+    session = GameSession(output=messages.append)
+    state = GameState(seed=1)
+    state.player = Player(name="V")
+
+    with session.activate():
+        saves = SaveManager(str(tmp_path), background=True)
+        saves.autosave(state)
+    assert saves.close(5)
+    assert messages == ["✅ Game saved to autosave"]
+    assert capsys.readouterr().out == ""
+
+
+def test_many_sessions_share_one_loop_and_many_threads():
+    sessions = [GameSession(GameState(seed=i), output=[].append) for i in range(20)]
+
+    async def play(turns: int):
+        session = current_session()
+        rolls = []
+        for _ in range(turns):
+            rolls.append(dice.d100())
+            await asyncio.sleep(0)  # Interleave with the other sessions
+        session.events.publish(Event(EventType.FLAG_SET, {"rolls": rolls}))
+
+    async def main():
+        tasks = [
+            asyncio.create_task(play(5), context=session.context()) for session in sessions
+        ]
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    for session in sessions:
+        expected = random.Random(session.game_state.seed)
+        rolls = session.events.get_event_history(EventType.FLAG_SET)[0].data["rolls"]
+        assert rolls == [expected.randint(1, 100) for _ in range(5)]
+
+    seen = {}
+    threads = [
+        threading.Thread(target=session.run, args=(lambda: seen.update(
+            {current_session().id: get_events()}
+        ),))
+        for session in sessions
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert seen == {session.id: session.events for session in sessions}
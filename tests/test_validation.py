@@ -0,0 +1,65 @@
+"""Tests for content-hash-keyed schema validation"""
+
+import json
+import os
+from pathlib import Path
+
+from src.data.validation import ContentValidator, validate_content
+
+
+def edit_json(path: Path, **changes):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data.update(changes)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_shipped_content_is_valid(data_dir):
+    report = validate_content(data_dir)
+    assert report.ok
+    assert report.validated == len(report.results) > 0
+
+
+def test_unchanged_files_are_skipped(data_dir):
+    first = validate_content(data_dir)
+    assert (data_dir / ".cache" / "validation.json").exists()
+
+    edit_json(data_dir / "genres" / "cyberpunk" / "items" / "medkit_basic.json", name="Medkit+")
+    second = validate_content(data_dir)
+
+    assert second.validated == 1
+    assert second.skipped == len(first.results) - 1
+
+
+def test_invalid_record_is_reported_and_cached(data_dir):
+    enemy = data_dir / "genres" / "cyberpunk" / "enemies" / "street_thug_tutorial.json"
+    edit_json(enemy, enemy_id="someone_else", stats={"level": 1})
+
+    for expected_validated in (len(list(data_dir.rglob("*.json"))), 0):
+        report = validate_content(data_dir)
+        assert report.validated == expected_validated
+        [failure] = report.failures
+        assert failure.path == "genres/cyberpunk/enemies/street_thug_tutorial.json"
+        assert any("doesn't match filename" in error for error in failure.errors)
+        assert any(error.startswith("stats.hp_max") for error in failure.errors)
+
+
+def test_touched_file_with_same_content_is_not_revalidated(data_dir):
+    validate_content(data_dir)
+    npc = data_dir / "genres" / "cyberpunk" / "npcs" / "bartender_tom.json"
+    stat = npc.stat()
+    os.utime(npc, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert validate_content(data_dir).validated == 0
+
+
+def test_corrupt_cache_and_no_cache_mode(data_dir):
+    validate_content(data_dir)
+    (data_dir / ".cache" / "validation.json").write_text("{not json", encoding="utf-8")
+
+    validator = ContentValidator(data_dir)
+    assert validator.validate().validated > 0
+
+    uncached = validate_content(data_dir, use_cache=False)
+    assert uncached.skipped == 0
@@ -0,0 +1,67 @@
+"""Tests for read-only content views and copy-on-write instances"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.data.loader import DataLoader
+from src.data.views import instantiate, loads_frozen, thaw
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.fixture
+def loader():
+    return DataLoader(DATA_DIR)
+
+
+def test_loader_hands_out_read_only_cached_records(loader):
+    thug = loader.load_enemy("cyberpunk", "street_thug_tutorial")
+
+    assert loader.load_enemy("cyberpunk", "street_thug_tutorial") is thug
+    with pytest.raises(TypeError):
+        thug["stats"]["hp_current"] = 0
+    assert isinstance(thug["attacks"], tuple)
+
+
+def test_loads_frozen_round_trips():
+    raw = (DATA_DIR / "genres" / "cyberpunk" / "npcs" / "bartender_tom.json").read_text("utf-8")
+    assert thaw(loads_frozen(raw)) == json.loads(raw)
+
+
+def test_instance_overlays_only_changed_fields(loader):
+    template = loader.load_enemy("cyberpunk", "street_thug_tutorial")
+    ricky = instantiate(template)
+    ricky["stats"]["hp_current"] -= 7
+
+    assert ricky["stats"]["hp_current"] == 23
+    assert ricky["stats"]["hp_max"] == 30
+    assert template["stats"]["hp_current"] == 30
+    assert ricky.changes() == {"stats": {"hp_current": 23}}
+    assert instantiate(template)["stats"]["hp_current"] == 30
+
+
+def test_instance_lists_copy_on_write(loader):
+    template = loader.load_npc("cyberpunk", "bartender_tom")
+    tom = instantiate(template)
+    tom["merchant_data"]["shop_inventory"][1]["stock"] -= 1
+
+    assert tom["merchant_data"]["shop_inventory"][1]["stock"] == 2
+    assert template["merchant_data"]["shop_inventory"][1]["stock"] == 3
+    assert tom.changes() == {"merchant_data": {"shop_inventory": {1: {"stock": 2}}}}
+
+    tom["ambient_dialogue"].append("Tom nods.")
+    assert len(tom["ambient_dialogue"]) == len(template["ambient_dialogue"]) + 1
+    assert tom.to_dict()["ambient_dialogue"][-1] == "Tom nods."
+
+
+def test_instance_delete_and_add_keys(loader):
+    item = instantiate(loader.load_item("cyberpunk", "medkit_basic"))
+    del item["lore"]
+    item["charges"] = 2
+
+    assert "lore" not in item
+    assert item["charges"] == 2
+    assert item.changes() == {"charges": 2, "lore": None}
+    assert set(item) == (set(item.template) - {"lore"}) | {"charges"}